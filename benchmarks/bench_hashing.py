@@ -0,0 +1,63 @@
+"""
+Benchmark the latency of `/api/v1/product/search` while `/api/v1/business/me` is hammered with
+logins, with bcrypt verifying the passwords inline on the event loop against on the password
+hashing workers.
+
+Usage: python -m benchmarks.bench_hashing [--url postgresql+asyncpg://...] [--requests N]
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import bcrypt
+from httpx import AsyncClient, BasicAuth
+
+from benchmarks.common import client, create_schema, report, run_load, seed_products, use_database
+from fastapi_ecom.app import app, lifespan
+from fastapi_ecom.database import get_async_session
+from fastapi_ecom.database.models.business import Business
+from fastapi_ecom.utils import basic_auth
+
+
+async def verify_password_inline(password: str, hashed_password: str | None) -> bool:
+    """
+    Replica of the former password verification which ran bcrypt on the event loop.
+    """
+    return bool(hashed_password) and bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+
+
+async def measure(label: str, http: AsyncClient, requests: int, concurrency: int, logins: int) -> None:
+    auth = BasicAuth("login@example.com", "login")
+    hammer = asyncio.gather(*(http.get("/api/v1/business/me", auth=auth) for _ in range(logins)))
+    report(label, await run_load(lambda: http.get("/api/v1/product/search"), requests, concurrency))
+    await hammer
+
+
+async def main(url: str | None, requests: int, concurrency: int, logins: int) -> None:
+    with TemporaryDirectory() as workdir:
+        use_database(url, Path(workdir))
+        await create_schema()
+        async with lifespan(app):
+            await seed_products(100)
+            async with get_async_session()() as db:
+                hashed_password = bcrypt.hashpw(b"login", bcrypt.gensalt()).decode("utf-8")
+                db.add(Business(email="login@example.com", password=hashed_password, name="login", uuid="benchlog"))
+                await db.commit()
+            async with client() as http:
+                verify_password = basic_auth.verify_password
+                basic_auth.verify_password = verify_password_inline
+                await measure("before: bcrypt on the event loop", http, requests, concurrency, logins)
+                basic_auth.verify_password = verify_password
+                await measure("after: bcrypt on the hashing workers", http, requests, concurrency, logins)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=None, help="Database URL to benchmark against (defaults to a temporary SQLite database)")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--logins", type=int, default=8)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.requests, args.concurrency, args.logins))
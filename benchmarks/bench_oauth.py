@@ -0,0 +1,85 @@
+"""
+Benchmark the latency of `/api/v1/business/me` authenticated with an OAuth bearer token resolved
+by the userinfo endpoint of the provider on every request against an ID token verified locally
+with the cached signing keys of the provider. A local stand-in answers for the provider with a
+simulated round trip time.
+
+Usage: python -m benchmarks.bench_oauth [--url postgresql+asyncpg://...] [--rtt MS] [--requests N]
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import time
+
+from fastapi import FastAPI
+from httpx import ASGITransport
+from joserfc import jwt
+from joserfc.jwk import KeySet, RSAKey
+
+from benchmarks.common import client, create_schema, report, run_load, use_database
+from fastapi_ecom.app import app, lifespan
+from fastapi_ecom.config import config
+from fastapi_ecom.utils.oauth import oauth
+
+USER = {"email": "oauth@example.com", "name": "oauth", "sub": "oauth_sub"}
+
+
+def stand_in_provider(key: RSAKey, rtt: float) -> FastAPI:
+    """
+    Stand-in for the OAuth provider serving its discovery document, signing keys and userinfo.
+    """
+    provider = FastAPI()
+
+    @provider.get("/.well-known/openid-configuration")
+    async def discovery() -> dict[str, str]:
+        return {"issuer": "http://oidc", "userinfo_endpoint": "http://oidc/userinfo", "jwks_uri": "http://oidc/jwks"}
+
+    @provider.get("/jwks")
+    async def jwks() -> dict[str, list]:
+        await asyncio.sleep(rtt)
+        return KeySet([key]).as_dict(private=False)
+
+    @provider.get("/userinfo")
+    async def userinfo() -> dict[str, str]:
+        await asyncio.sleep(rtt)
+        return USER
+
+    return provider
+
+
+async def main(url: str | None, rtt: float, requests: int, concurrency: int) -> None:
+    key = RSAKey.generate_key(2048, parameters={"kid": "bench"}, private=True)
+    id_token = jwt.encode(
+        {"alg": "RS256", "kid": "bench"},
+        {**USER, "iss": "http://oidc", "aud": oauth.google.client_id, "iat": int(time()), "exp": int(time()) + 3600},
+        key,
+    )
+    oauth.google.client_kwargs["transport"] = ASGITransport(app=stand_in_provider(key, rtt / 1000))
+    oauth.google._server_metadata_url = "http://oidc/.well-known/openid-configuration"
+    oauth.google.server_metadata = {}
+    config.oidcttl = 0  # Resolve the access token with the provider on every request, as before
+    with TemporaryDirectory() as workdir:
+        use_database(url, Path(workdir))
+        await create_schema()
+        async with lifespan(app), client() as http:
+            await http.get("/api/v1/business/me", headers={"Authorization": "Bearer access-token"})  # Create the account
+            report(
+                "before: userinfo per request",
+                await run_load(lambda: http.get("/api/v1/business/me", headers={"Authorization": "Bearer access-token"}), requests, concurrency),
+            )
+            report(
+                "after: local ID token verification",
+                await run_load(lambda: http.get("/api/v1/business/me", headers={"Authorization": f"Bearer {id_token}"}), requests, concurrency),
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=None, help="Database URL to benchmark against (defaults to a temporary SQLite database)")
+    parser.add_argument("--rtt", type=float, default=30.0, help="Simulated round trip time to the provider in milliseconds")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.rtt, args.requests, args.concurrency))
@@ -0,0 +1,77 @@
+"""
+Benchmark the throughput of `/api/v1/order/create` under concurrent load against the window of the
+group-commit writer, from one transaction per order to batches collected over a few milliseconds.
+
+The benchmark is meant to run against a local PostgreSQL database, whose commit latency bounds the
+throughput of one transaction per order. SQLite serializes its writers and does not sync to disk
+the way PostgreSQL does, so the numbers it gives are only indicative.
+
+Usage: python -m benchmarks.bench_order_batch [--url postgresql+asyncpg://...] [--windows 0 2 5 10]
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from httpx import AsyncClient
+from sqlalchemy.future import select
+
+from benchmarks.common import client, create_schema, report, run_load, seed_products, use_database
+from fastapi_ecom.app import app, lifespan
+from fastapi_ecom.config import config
+from fastapi_ecom.database import get_async_session
+from fastapi_ecom.database.models.customer import Customer
+from fastapi_ecom.database.models.product import Product
+from fastapi_ecom.utils.auth import verify_cust_cred
+from fastapi_ecom.utils.order_batcher import order_batcher
+
+
+async def measure(http: AsyncClient, payload: dict, window: float, requests: int, concurrency: int) -> None:
+    failed = 0
+
+    async def place() -> None:
+        nonlocal failed
+        response = await http.post("/api/v1/order/create", json=payload)
+        failed += response.status_code != 201
+
+    config.ordbwin = window
+    before = order_batcher.report()
+    stats = await run_load(place, requests, concurrency)
+    after = order_batcher.report()
+    batches = after["batches"] - before["batches"]
+    label = f"window {window:g} ms" + (f", {(after['orders'] - before['orders']) / batches:.1f} orders/batch" if batches else "")
+    report(label, stats)
+    if failed:
+        print(f"{'':<40} {failed} of {requests} orders failed")
+
+
+async def main(url: str | None, requests: int, concurrency: int, windows: list[float], max_batch: int) -> None:
+    with TemporaryDirectory() as workdir:
+        use_database(url, Path(workdir))
+        await create_schema()
+        async with lifespan(app):
+            await seed_products(10)
+            async with get_async_session()() as db:
+                customer = Customer(email="benchcus@example.com", password="", name="benchcus", uuid="benchcus")
+                db.add(customer)
+                await db.commit()
+                product_ids = (await db.execute(select(Product.uuid).limit(3))).scalars().all()
+            app.dependency_overrides[verify_cust_cred] = lambda: customer
+            config.ordbmax = max_batch
+            payload = {"order_date": "2026-01-01T00:00:00", "order_items": [{"product_id": product_id, "quantity": 1} for product_id in product_ids]}
+            async with client() as http:
+                for window in windows:
+                    await measure(http, payload, window, requests, concurrency)
+            app.dependency_overrides.clear()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=None, help="Database URL to benchmark against (defaults to a temporary SQLite database)")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--windows", type=float, nargs="+", default=[0, 2, 5, 10])
+    parser.add_argument("--max-batch", type=int, default=64)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.requests, args.concurrency, args.windows, args.max_batch))
@@ -0,0 +1,93 @@
+"""
+Benchmark the latency of `/api/v1/order/create` against the number of order lines, with one
+product lookup and one insert per order line against one lookup for all the products and one
+multi-row insert for all the order details.
+
+Usage: python -m benchmarks.bench_order_create [--url postgresql+asyncpg://...] [--requests N]
+"""
+
+import argparse
+import asyncio
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Annotated
+from uuid import uuid4
+
+from fastapi import Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from benchmarks.common import client, create_schema, report, run_load, seed_products, use_database
+from fastapi_ecom.app import app, lifespan
+from fastapi_ecom.database import get_async_session
+from fastapi_ecom.database.db_setup import get_db
+from fastapi_ecom.database.models.customer import Customer
+from fastapi_ecom.database.models.order import Order
+from fastapi_ecom.database.models.order_details import OrderDetail
+from fastapi_ecom.database.models.product import Product
+from fastapi_ecom.database.pydantic_schemas.order import OrderCreate
+from fastapi_ecom.utils.auth import verify_cust_cred
+
+
+async def create_order_per_line(
+    order: OrderCreate, db: Annotated[AsyncSession, Depends(get_db)], customer_auth: Annotated[Customer, Depends(verify_cust_cred)]
+) -> dict:
+    """
+    Replica of the former `create_order` which looked every product up and added every order
+    detail one order line at a time.
+    """
+    new_order = Order(user_id=customer_auth.uuid, order_date=order.order_date, total_price=0.0, uuid=uuid4().hex[0:8])
+    db.add(new_order)
+    await db.flush()
+    total_price = 0
+    for item in order.order_items:
+        product = (await db.execute(select(Product).where(Product.uuid == item.product_id))).scalar_one_or_none()
+        if not product:
+            raise HTTPException(status_code=404, detail=f"Product with ID: {item.product_id} does not exist.")
+        total_price += product.price * item.quantity
+        db.add(OrderDetail(order_id=new_order.uuid, product_id=item.product_id, quantity=item.quantity, price=product.price, uuid=uuid4().hex[0:8]))
+    new_order.total_price = total_price
+    await db.flush()
+    return {"action": "post", "uuid": new_order.uuid}
+
+
+async def main(url: str | None, requests: int, concurrency: int, lines: list[int]) -> None:
+    with TemporaryDirectory() as workdir:
+        use_database(url, Path(workdir))
+        await create_schema()
+        async with lifespan(app):
+            await seed_products(max(lines))
+            async with get_async_session()() as db:
+                customer = Customer(email="benchcus@example.com", password="", name="benchcus", uuid="benchcus")
+                db.add(customer)
+                await db.commit()
+                product_ids = (await db.execute(select(Product.uuid).limit(max(lines)))).scalars().all()
+            app.dependency_overrides[verify_cust_cred] = lambda: customer
+            app.add_api_route("/bench/order/create", create_order_per_line, methods=["POST"], status_code=201)
+            async with client() as http:
+                for count in lines:
+                    payload = {
+                        "order_date": datetime.now(timezone.utc).isoformat(),
+                        "order_items": [{"product_id": product_id, "quantity": 1} for product_id in product_ids[:count]],
+                    }
+                    report(
+                        f"before: {count} lines, per line",
+                        await run_load(partial(http.post, "/bench/order/create", json=payload), requests, concurrency),
+                    )
+                    report(
+                        f"after: {count} lines, batched",
+                        await run_load(partial(http.post, "/api/v1/order/create", json=payload), requests, concurrency),
+                    )
+            app.dependency_overrides.clear()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=None, help="Database URL to benchmark against (defaults to a temporary SQLite database)")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--lines", type=int, nargs="+", default=[1, 10, 50])
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.requests, args.concurrency, args.lines))
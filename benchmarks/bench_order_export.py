@@ -0,0 +1,121 @@
+"""
+Benchmark the throughput and the peak memory of `/api/v1/order/export/internal` streaming every
+order along with its details, against walking `/api/v1/order/search/internal` page after page.
+
+The peak resident set size is read once the orders are seeded and again after every run, so that
+a growth proportional to the number of orders exported would show up between two runs.
+
+Usage: python -m benchmarks.bench_order_export [--url postgresql+asyncpg://...] [--orders 1000000]
+"""
+
+import argparse
+import asyncio
+import resource
+from datetime import date, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from httpx import AsyncClient
+from sqlalchemy import insert
+from sqlalchemy.future import select
+
+from benchmarks.common import client, create_schema, seed_products, use_database
+from fastapi_ecom.app import app, lifespan
+from fastapi_ecom.config import config
+from fastapi_ecom.database import get_async_session
+from fastapi_ecom.database.models.customer import Customer
+from fastapi_ecom.database.models.order import Order
+from fastapi_ecom.database.models.order_details import OrderDetail
+from fastapi_ecom.database.models.product import Product
+
+
+def peak_rss() -> float:
+    """
+    Read the peak resident set size of the process.
+
+    :return: The peak resident set size in MiB.
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+async def seed_orders(count: int, lines: int, chunk: int = 10_000) -> None:
+    """
+    Populate the benchmarking database with orders of a customer and their details.
+
+    The UUIDs are derived from the position of the rows, as a million random 8-character UUIDs are
+    bound to collide.
+
+    :param count: Number of orders to create.
+    :param lines: Number of details per order.
+    :param chunk: Number of orders to insert per transaction.
+
+    :return: None
+    """
+    async with get_async_session()() as db:
+        db.add(Customer(email="benchcus@example.com", password="", name="benchcus", uuid="benchcus"))
+        await db.commit()
+        product_ids = (await db.execute(select(Product.uuid).limit(lines))).scalars().all()
+        first = date(2020, 1, 1)
+        for start in range(0, count, chunk):
+            orders = [
+                {"uuid": f"{indx:08x}", "user_id": "benchcus", "order_date": first + timedelta(days=indx % 1500), "total_price": 10.0 * lines}
+                for indx in range(start, min(start + chunk, count))
+            ]
+            details = [
+                {"uuid": f"{start * lines + indx:08x}", "order_id": order["uuid"], "product_id": product_id, "quantity": 1, "price": 10.0}
+                for indx, (order, product_id) in enumerate((order, product_id) for order in orders for product_id in product_ids)
+            ]
+            await db.execute(insert(Order), orders)
+            await db.execute(insert(OrderDetail), details)
+            await db.commit()
+
+
+async def measure_export(http: AsyncClient, label: str, params: dict, headers: dict, count: int) -> None:
+    size = 0
+    start = perf_counter()
+    async with http.stream("GET", "/api/v1/order/export/internal", params=params, headers=headers) as response:
+        async for chunk in response.aiter_raw():
+            size += len(chunk)
+    elapsed = perf_counter() - start
+    print(f"{label:<40} {count / elapsed:>10.0f} orders/s    {size / 2**20:>8.1f} MiB sent    peak RSS {peak_rss():>8.1f} MiB")
+
+
+async def measure_pages(http: AsyncClient, count: int) -> None:
+    start = perf_counter()
+    calls, cursor = 0, None
+    while True:
+        response = await http.get("/api/v1/order/search/internal", params={"limit": 100} | ({"cursor": cursor} if cursor else {}))
+        calls += 1
+        cursor = response.json().get("next_cursor")
+        if not cursor:
+            break
+    elapsed = perf_counter() - start
+    print(f"{f'paginated search ({calls} calls)':<40} {count / elapsed:>10.0f} orders/s    {'':>17}    peak RSS {peak_rss():>8.1f} MiB")
+
+
+async def main(url: str | None, orders: int, lines: int, pages: bool) -> None:
+    with TemporaryDirectory() as workdir:
+        use_database(url, Path(workdir))
+        config.intlrprt = True  # The export is served alongside the internal reports only
+        await create_schema()
+        async with lifespan(app):
+            await seed_products(lines)
+            await seed_orders(orders, lines)
+            print(f"{f'seeded {orders} orders':<40} {'':>17}    {'':>17}    peak RSS {peak_rss():>8.1f} MiB")
+            async with client() as http:
+                await measure_export(http, "export ndjson", {"format": "ndjson"}, {"Accept-Encoding": "identity"}, orders)
+                await measure_export(http, "export csv", {"format": "csv"}, {"Accept-Encoding": "identity"}, orders)
+                await measure_export(http, "export ndjson gzip", {"format": "ndjson"}, {"Accept-Encoding": "gzip"}, orders)
+                if pages:
+                    await measure_pages(http, orders)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=None, help="Database URL to benchmark against (defaults to a temporary SQLite database)")
+    parser.add_argument("--orders", type=int, default=1_000_000)
+    parser.add_argument("--lines", type=int, default=3, help="Number of details per order")
+    parser.add_argument("--pages", action="store_true", help="Also walk the paginated search endpoint for comparison")
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.orders, args.lines, args.pages))
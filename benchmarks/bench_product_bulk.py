@@ -0,0 +1,59 @@
+"""
+Benchmark repricing the products of a business with `/api/v1/product/bulk-update` against a call
+to `/api/v1/product/update/uuid/{product_id}` per product, along with deleting them with
+`/api/v1/product/bulk-delete`.
+
+Usage: python -m benchmarks.bench_product_bulk [--url postgresql+asyncpg://...] [--products 10000]
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from sqlalchemy.future import select
+
+from benchmarks.common import client, create_schema, run_load, seed_products, use_database
+from fastapi_ecom.app import app, lifespan
+from fastapi_ecom.database import get_async_session
+from fastapi_ecom.database.models.business import Business
+from fastapi_ecom.database.models.product import Product
+from fastapi_ecom.utils.auth import verify_business_cred
+
+
+async def main(url: str | None, products: int, concurrency: int) -> None:
+    with TemporaryDirectory() as workdir:
+        use_database(url, Path(workdir))
+        await create_schema()
+        async with lifespan(app):
+            await seed_products(products)
+            async with get_async_session()() as db:
+                business = (await db.execute(select(Business).where(Business.uuid == "benchbiz"))).scalar_one()
+                uuids = (await db.execute(select(Product.uuid))).scalars().all()
+            app.dependency_overrides[verify_business_cred] = lambda: business
+            async with client() as http:
+                remaining = iter(uuids)
+                stats = await run_load(
+                    lambda: http.put(f"/api/v1/product/update/uuid/{next(remaining)}", json={"price": 1.0}), products, concurrency
+                )
+                print(f"{f'update one by one ({products} products)':<40} {stats['rps']:>10.0f} products/s")
+                start = perf_counter()
+                response = await http.put("/api/v1/product/bulk-update", json={"products": [{"uuid": uuid, "price": 2.0} for uuid in uuids]})
+                elapsed = perf_counter() - start
+                count = response.json()["count"]
+                print(f"{f'bulk update ({count} products)':<40} {count / elapsed:>10.0f} products/s")
+                start = perf_counter()
+                response = await http.post("/api/v1/product/bulk-delete", json={"uuids": list(uuids)})
+                elapsed = perf_counter() - start
+                count = response.json()["count"]
+                print(f"{f'bulk delete ({count} products)':<40} {count / elapsed:>10.0f} products/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=None, help="Database URL to benchmark against (defaults to a temporary SQLite database)")
+    parser.add_argument("--products", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.products, args.concurrency))
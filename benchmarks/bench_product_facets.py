@@ -0,0 +1,116 @@
+"""
+Benchmark the latencies of `/api/v1/product/facets` and of `/api/v1/product/search` filtered on a
+category and a price range, with the composite indexes on the products against without them.
+
+The response cache is disabled, so that every request reaches the database.
+
+Usage: python -m benchmarks.bench_product_facets [--url postgresql+asyncpg://...] [--products 1000000]
+"""
+
+import argparse
+import asyncio
+from datetime import date, timedelta
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from sqlalchemy import insert, text
+
+from benchmarks.common import client, create_schema, report, run_load, use_database
+from fastapi_ecom.app import app, lifespan
+from fastapi_ecom.config import config
+from fastapi_ecom.database import get_async_session
+from fastapi_ecom.database.models.business import Business
+from fastapi_ecom.database.models.product import Product
+
+# Composite indexes serving the filters and the facets of the products
+INDEXES = {
+    "ix_products_category_id": "products (category, id)",
+    "ix_products_category_price": "products (category, product_price)",
+    "ix_products_expiry_date": "products (expiry_date)",
+}
+
+
+async def seed_catalog(count: int, categories: int, chunk: int = 20_000) -> None:
+    """
+    Populate the benchmarking database with a business and its products spread over categories,
+    prices and dates.
+
+    The UUIDs are derived from the position of the rows, as a million random 8-character UUIDs are
+    bound to collide.
+
+    :param count: Number of products to create.
+    :param categories: Number of categories to spread the products over.
+    :param chunk: Number of products to insert per transaction.
+
+    :return: None
+    """
+    first = date(2024, 1, 1)
+    async with get_async_session()() as db:
+        db.add(Business(email="benchbiz@example.com", password="", name="benchbiz", uuid="benchbiz"))
+        await db.commit()
+        for start in range(0, count, chunk):
+            rows = [
+                {
+                    "uuid": f"{indx:08x}",
+                    "name": f"Product {indx}",
+                    "description": f"Benchmark product number {indx}",
+                    "category": f"category-{indx % categories}",
+                    "mfg_date": first + timedelta(days=indx % 365),
+                    "exp_date": first + timedelta(days=365 + indx % 1000),
+                    "price": float(indx * 7919 % 2000),
+                    "business_id": "benchbiz",
+                }
+                for indx in range(start, min(start + chunk, count))
+            ]
+            await db.execute(insert(Product), rows)
+            await db.commit()
+
+
+async def set_indexes(present: bool) -> None:
+    """
+    Create or drop the composite indexes on the products, then refresh the statistics of the
+    planner.
+
+    :param present: Whether the indexes are to be created.
+
+    :return: None
+    """
+    async with get_async_session()() as db:
+        for name, columns in INDEXES.items():
+            await db.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {columns}" if present else f"DROP INDEX IF EXISTS {name}"))
+        await db.execute(text("ANALYZE"))
+        await db.commit()
+
+
+async def main(url: str | None, requests: int, concurrency: int, products: int, categories: int) -> None:
+    with TemporaryDirectory() as workdir:
+        use_database(url, Path(workdir))
+        config.rspcttl = 0
+        await create_schema()
+        async with lifespan(app):
+            await seed_catalog(products, categories)
+            async with client() as http:
+                filtered = {"category": "category-3", "min_price": 100, "max_price": 200, "not_expired": True}
+                for present in [False, True]:
+                    await set_indexes(present)
+                    label = "with indexes" if present else "without indexes"
+                    report(f"facets, {label}", await run_load(lambda: http.get("/api/v1/product/facets"), requests, concurrency))
+                    report(
+                        f"facets of a category, {label}",
+                        await run_load(lambda: http.get("/api/v1/product/facets", params={"category": "category-3"}), requests, concurrency),
+                    )
+                    report(
+                        f"filtered search, {label}",
+                        await run_load(lambda: http.get("/api/v1/product/search", params=filtered), requests, concurrency),
+                    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=None, help="Database URL to benchmark against (defaults to a temporary SQLite database)")
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=5)
+    parser.add_argument("--products", type=int, default=1_000_000)
+    parser.add_argument("--categories", type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.requests, args.concurrency, args.products, args.categories))
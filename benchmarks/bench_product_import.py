@@ -0,0 +1,103 @@
+"""
+Benchmark the throughput and the peak memory of `/api/v1/product/import` loading a streamed upload
+of products as NDJSON and as CSV, against adding them one by one through `/api/v1/product/create`.
+
+The peak resident set size is read after every run, so that a growth proportional to the size of
+the upload would show up between two runs of growing sizes.
+
+Usage: python -m benchmarks.bench_product_import [--url postgresql+asyncpg://...] [--products 100000 1000000]
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+from collections.abc import AsyncIterator
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from httpx import AsyncClient
+
+from benchmarks.common import client, create_schema, run_load, use_database
+from fastapi_ecom.app import app, lifespan
+from fastapi_ecom.database import get_async_session
+from fastapi_ecom.database.models.business import Business
+from fastapi_ecom.utils.auth import verify_business_cred
+
+
+def peak_rss() -> float:
+    """
+    Read the peak resident set size of the process.
+
+    :return: The peak resident set size in MiB.
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def product(indx: int) -> dict:
+    return {
+        "name": f"Product {indx}",
+        "description": f"Imported product number {indx}",
+        "category": f"category-{indx % 20}",
+        "mfg_date": "2024-01-01T00:00:00",
+        "exp_date": "2030-01-01T00:00:00",
+        "price": float(indx % 1000),
+    }
+
+
+async def upload(fmt: str, count: int, lines: int = 1000) -> AsyncIterator[bytes]:
+    """
+    Generate an upload of products a chunk of lines at a time, so that the upload is never held
+    in full by the benchmark either.
+
+    :param fmt: Format of the upload, either "ndjson" or "csv".
+    :param count: Number of products in the upload.
+    :param lines: Number of products per chunk.
+
+    :return: An asynchronous generator of the chunks.
+    """
+    if fmt == "csv":
+        yield b"name,description,category,mfg_date,exp_date,price\r\n"
+    for start in range(0, count, lines):
+        rows = (product(indx) for indx in range(start, min(start + lines, count)))
+        if fmt == "csv":
+            yield "".join(",".join(str(value) for value in row.values()) + "\r\n" for row in rows).encode()
+        else:
+            yield "".join(json.dumps(row) + "\n" for row in rows).encode()
+
+
+async def measure_import(http: AsyncClient, fmt: str, count: int) -> None:
+    start = perf_counter()
+    response = await http.post("/api/v1/product/import", params={"format": fmt}, content=upload(fmt, count), timeout=None)
+    elapsed = perf_counter() - start
+    imported = response.json()["imported"]
+    print(f"{f'import {fmt} ({imported} products)':<40} {imported / elapsed:>10.0f} products/s    peak RSS {peak_rss():>8.1f} MiB")
+
+
+async def main(url: str | None, products: list[int], creates: int, concurrency: int) -> None:
+    with TemporaryDirectory() as workdir:
+        use_database(url, Path(workdir))
+        await create_schema()
+        async with lifespan(app):
+            async with get_async_session()() as db:
+                business = Business(email="benchbiz@example.com", password="", name="benchbiz", uuid="benchbiz")
+                db.add(business)
+                await db.commit()
+            app.dependency_overrides[verify_business_cred] = lambda: business
+            async with client() as http:
+                stats = await run_load(lambda: http.post("/api/v1/product/create", json=product(0)), creates, concurrency)
+                print(f"{f'create one by one ({creates} products)':<40} {stats['rps']:>10.0f} products/s    peak RSS {peak_rss():>8.1f} MiB")
+                for count in products:
+                    await measure_import(http, "ndjson", count)
+                    await measure_import(http, "csv", count)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=None, help="Database URL to benchmark against (defaults to a temporary SQLite database)")
+    parser.add_argument("--products", type=int, nargs="+", default=[100_000, 1_000_000], help="Numbers of products per import")
+    parser.add_argument("--creates", type=int, default=2000, help="Number of products added one by one for comparison")
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.products, args.creates, args.concurrency))
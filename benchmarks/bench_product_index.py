@@ -0,0 +1,47 @@
+"""
+Benchmark the latencies of `/api/v1/product/search/name/{text}` answered from the in-memory
+search index against the full-text and substring searches of the database, along with the time
+spent searching the index alone.
+
+Usage: python -m benchmarks.bench_product_index [--url postgresql+asyncpg://...] [--products 100000]
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from benchmarks.common import client, create_schema, report, run_load, seed_products, use_database
+from fastapi_ecom.app import app, lifespan
+from fastapi_ecom.utils.search_index import product_index
+
+
+async def main(url: str | None, requests: int, concurrency: int, products: int, text: str) -> None:
+    with TemporaryDirectory() as workdir:
+        use_database(url, Path(workdir))
+        await create_schema()
+        async with lifespan(app):
+            await seed_products(products)
+            start = perf_counter()
+            await product_index.build()
+            print(f"{f'built index of {len(product_index)} products':<40} {perf_counter() - start:>10.2f} s")
+            start = perf_counter()
+            for _ in range(requests):
+                product_index.search(text, None, 0, 100)
+            print(f"{'index search alone':<40} {(perf_counter() - start) * 1000 / requests:>10.3f} ms per search")
+            async with client() as http:
+                for mode in ["index", "fulltext", "substring"]:
+                    path = f"/api/v1/product/search/name/{text}"
+                    report(f"mode={mode}", await run_load(lambda mode=mode, path=path: http.get(path, params={"mode": mode}), requests, concurrency))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=None, help="Database URL to benchmark against (defaults to a temporary SQLite database)")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--products", type=int, default=100_000)
+    parser.add_argument("--text", default="number 4242", help="Search string to look up")
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.requests, args.concurrency, args.products, args.text))
@@ -0,0 +1,54 @@
+"""
+Benchmark the throughput of `/api/v1/product/search` with a per-request engine against the
+process-wide engine shared through the application lifespan.
+
+Usage: python -m benchmarks.bench_product_search [--url postgresql+asyncpg://...] [--requests N]
+"""
+
+import argparse
+import asyncio
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from benchmarks.common import client, create_schema, report, run_load, seed_products, use_database
+from fastapi_ecom.app import app, lifespan
+from fastapi_ecom.database import get_engine
+from fastapi_ecom.database.db_setup import get_db, get_read_db
+
+
+async def get_db_per_request() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Replica of the former `get_db` which built a new engine, and a new pool, for every request.
+    """
+    db = async_sessionmaker(bind=get_engine(), expire_on_commit=False)()
+    try:
+        yield db
+        await db.commit()
+    finally:
+        await db.close()
+
+
+async def main(url: str | None, requests: int, concurrency: int, products: int) -> None:
+    with TemporaryDirectory() as workdir:
+        use_database(url, Path(workdir))
+        await create_schema()
+        async with lifespan(app):
+            await seed_products(products)
+            async with client() as http:
+                app.dependency_overrides[get_db] = app.dependency_overrides[get_read_db] = get_db_per_request
+                report("before: engine per request", await run_load(lambda: http.get("/api/v1/product/search"), requests, concurrency))
+                app.dependency_overrides.clear()
+                report("after: shared engine (lifespan)", await run_load(lambda: http.get("/api/v1/product/search"), requests, concurrency))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=None, help="Database URL to benchmark against (defaults to a temporary SQLite database)")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--products", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.requests, args.concurrency, args.products))
@@ -0,0 +1,126 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from statistics import quantiles
+from time import perf_counter
+from uuid import uuid4
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import URL, make_url
+
+from fastapi_ecom import database
+from fastapi_ecom.app import app
+from fastapi_ecom.config import config
+from fastapi_ecom.database import baseobjc, get_async_session
+from fastapi_ecom.database.models.business import Business
+from fastapi_ecom.database.models.product import Product
+
+
+def use_database(url: str | None, workdir: Path) -> URL:
+    """
+    Point the service to the database used for benchmarking.
+
+    :param url: SQLAlchemy URL of the database to use; a SQLite database inside `workdir` is used
+                when it is not provided.
+    :param workdir: Directory used to keep the SQLite database.
+
+    :return: The URL of the database used for benchmarking.
+    """
+    target = make_url(url) if url else URL.create(drivername="sqlite+aiosqlite", database=f"{workdir.as_posix()}/bench.db")
+    database.get_database_url = lambda engine="async": target
+    config.confecho = False
+    logging.getLogger("fastapi_ecom").setLevel(logging.ERROR)
+    return target
+
+
+async def create_schema() -> None:
+    """
+    Recreate all the tables of the service in the benchmarking database.
+
+    :return: None
+    """
+    engine = database.get_engine()
+    async with engine.begin() as conn:
+        await conn.run_sync(baseobjc.metadata.drop_all)
+        await conn.run_sync(baseobjc.metadata.create_all)
+    await engine.dispose()
+
+
+async def seed_products(count: int, business_id: str = "benchbiz", chunk: int = 10_000) -> None:
+    """
+    Populate the benchmarking database with a business and its products.
+
+    :param count: Number of products to create.
+    :param business_id: UUID of the business owning the products.
+    :param chunk: Number of products to add per transaction.
+
+    :return: None
+    """
+    today = datetime.now(timezone.utc)
+    async with get_async_session()() as db:
+        db.add(Business(email=f"{business_id}@example.com", password="", name=business_id, uuid=business_id))
+        await db.commit()
+        for start in range(0, count, chunk):
+            db.add_all(
+                Product(
+                    name=f"Product {indx}",
+                    description=f"Benchmark product number {indx}",
+                    category=f"category-{indx % 20}",
+                    mfg_date=today,
+                    exp_date=today + timedelta(days=indx % 365),
+                    price=float(indx % 1000),
+                    business_id=business_id,
+                    uuid=uuid4().hex[0:8],
+                )
+                for indx in range(start, min(start + chunk, count))
+            )
+            await db.commit()
+
+
+def client() -> AsyncClient:
+    """
+    Create an in-process HTTP client for the FastAPI application.
+
+    :return: An instance of `AsyncClient` bound to the application.
+    """
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://bench")
+
+
+async def run_load(call: Callable[[], Awaitable[object]], requests: int, concurrency: int) -> dict[str, float]:
+    """
+    Run a call repeatedly with a fixed number of concurrent workers and measure it.
+
+    :param call: The awaitable factory to benchmark.
+    :param requests: Total number of calls to perform.
+    :param concurrency: Number of calls in flight at the same time.
+
+    :return: Throughput in calls per second along with the p50 and p99 latencies in milliseconds.
+    """
+    latencies = []
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in remaining:
+            start = perf_counter()
+            await call()
+            latencies.append((perf_counter() - start) * 1000)
+
+    start = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = perf_counter() - start
+    cuts = quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return {"rps": len(latencies) / elapsed, "p50": cuts[49], "p99": cuts[98]}
+
+
+def report(label: str, stats: dict[str, float]) -> None:
+    """
+    Print the measurements of a benchmark run.
+
+    :param label: Name of the benchmark run.
+    :param stats: Measurements as returned by `run_load()`.
+
+    :return: None
+    """
+    print(f"{label:<40} {stats['rps']:>10.1f} req/s    p50 {stats['p50']:>8.2f} ms    p99 {stats['p99']:>8.2f} ms")
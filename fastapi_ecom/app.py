@@ -1,10 +1,19 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager, suppress
+
 import uvicorn
 from fastapi import FastAPI
 from starlette.middleware.sessions import SessionMiddleware
 
 from fastapi_ecom.config import config
-from fastapi_ecom.router import business, customer, order, product
+from fastapi_ecom.database.db_setup import dispose_async_session, get_async_session
+from fastapi_ecom.router import business, customer, internal, order, product
+from fastapi_ecom.utils.hashing import password_hasher
+from fastapi_ecom.utils.idempotency import idempotency_store
 from fastapi_ecom.utils.logging_setup import general
+from fastapi_ecom.utils.order_batcher import order_batcher
+from fastapi_ecom.utils.search_index import product_index
 
 # Metadata for API tags
 tags_metadata = [
@@ -12,14 +21,59 @@ tags_metadata = [
     {"name": "product", "description": "Operations on products"},
     {"name": "customer", "description": "Operations on customers"},
     {"name": "order", "description": "Operations on orders"},
+    {"name": "internal", "description": "Operational insights of the service"},
 ]
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """
+    Manage the resources shared by the FastAPI application for its whole lifetime.
+
+    The database engine and its connection pool are set up once on startup, reused by every
+    request and disposed of cleanly on shutdown along with the password hashing workers. The
+    expired idempotency keys are swept in the background meanwhile, and the orders waiting to be
+    written in a batch are written before shutting down. The in-memory search index of the
+    products is built on startup and rebuilt in the background, if enabled.
+
+    :param app: The FastAPI application instance.
+
+    :yield: Control back to the application while it serves requests.
+    """
+    general("Setting up database connection pool")
+    get_async_session()
+    sweeper = asyncio.create_task(idempotency_store.sweeper()) if config.idemswep > 0 else None
+    refresher = None
+    if config.srchidx:
+        general("Building product search index")
+        await product_index.build()
+        refresher = asyncio.create_task(product_index.refresher()) if config.srchrfsh > 0 else None
+    yield
+    if refresher:
+        general("Stopping product search index refresher")
+        refresher.cancel()
+        with suppress(asyncio.CancelledError):
+            await refresher
+    if sweeper:
+        general("Stopping idempotency key sweeper")
+        sweeper.cancel()
+        with suppress(asyncio.CancelledError):
+            await sweeper
+    general("Writing pending order batches")
+    await order_batcher.drain()
+    general("Disposing database connection pool")
+    await dispose_async_session()
+    general("Shutting down password hashing workers")
+    password_hasher.shutdown()
+
+
 # Initialize the FastAPI application
 app = FastAPI(
     title="FastAPI ECOM",
     description="E-Commerce API for businesses and end users using FastAPI.",
     version="0.1.0",
     openapi_tags=tags_metadata,
+    lifespan=lifespan,
     swagger_ui_init_oauth={
         "clientId": config.GOOGLE_CLIENT_ID,
         "clientSecret": config.GOOGLE_CLIENT_SECRET,
@@ -47,6 +101,7 @@ app.include_router(business.router, prefix=PREFIX)
 app.include_router(product.router, prefix=PREFIX)
 app.include_router(customer.router, prefix=PREFIX)
 app.include_router(order.router, prefix=PREFIX)
+app.include_router(internal.router, prefix=PREFIX)
 
 
 def start_service():
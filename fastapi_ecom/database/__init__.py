@@ -1,10 +1,12 @@
+from itertools import count
 from pathlib import Path
 
-from sqlalchemy import URL, Engine, create_engine
+from sqlalchemy import URL, Engine, create_engine, make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base
 
 from fastapi_ecom.config import config
+from fastapi_ecom.database.pool import MonitoredPool
 
 # Base class for ORM models, to be used with SQLAlchemy's declarative system.
 baseobjc = declarative_base()
@@ -15,6 +17,18 @@ alempath = str(Path(str(Path(str(Path(__file__).parent.resolve().parent.resolve(
 # Migration path for alembic configuration
 migrpath = str(Path(str(Path(__file__).parent.resolve().parent.resolve()), "migrations").resolve())
 
+# Process-wide asynchronous engine and session factory, shared by every request of the service.
+# These are set up lazily by `get_async_session()` and released by `dispose_async_session()`.
+_async_engine: AsyncEngine | None = None
+_async_session: async_sessionmaker | None = None
+
+# Read-only session factories on the primary and on the read replicas listed in the configuration,
+# set up along with the above.
+_read_session: async_sessionmaker | None = None
+_replica_engines: list[AsyncEngine] = []
+_replica_sessions: list[async_sessionmaker] = []
+_replica_turn = count()
+
 
 def get_database_url(engine: str = "async") -> URL:
     """
@@ -46,33 +60,129 @@ def get_database_url(engine: str = "async") -> URL:
     return SQLALCHEMY_DATABASE_URL
 
 
-def get_engine(engine: str = "async") -> Engine | AsyncEngine:
+def get_engine(engine: str = "async", url: URL | None = None) -> Engine | AsyncEngine:
     """
     Create a session engine based on the specified engine type.
 
+    The asynchronous engine uses a `MonitoredPool` sized and tuned from the configuration; the
+    asyncpg driver additionally gets its prepared statement cache size from the configuration.
+
     :param engine: Specifies the type of database engine ("async" or "sync"). Defaults to "async".
+    :param url: Database URL to connect to. Defaults to the URL built by `get_database_url()`.
 
     :return: An SQLAlchemy engine instance, either synchronous or asynchronous.
     """
     if engine == "sync":
-        SQLALCHEMY_DATABASE_URL = get_database_url(engine="sync")
+        SQLALCHEMY_DATABASE_URL = url or get_database_url(engine="sync")
         sync_engine = create_engine(url=SQLALCHEMY_DATABASE_URL, echo=config.confecho)
         return sync_engine
 
-    SQLALCHEMY_DATABASE_URL = get_database_url()
-    async_engine = create_async_engine(url=SQLALCHEMY_DATABASE_URL, echo=config.confecho)
+    SQLALCHEMY_DATABASE_URL = url or get_database_url()
+    driver_args = {}
+    if SQLALCHEMY_DATABASE_URL.get_driver_name() == "asyncpg":
+        # The dialect takes its own cache size from the URL, the driver takes its own as an argument
+        SQLALCHEMY_DATABASE_URL = SQLALCHEMY_DATABASE_URL.update_query_dict({"prepared_statement_cache_size": str(config.stmtcach)})
+        driver_args = {"connect_args": {"statement_cache_size": config.stmtcach}}
+    async_engine = create_async_engine(
+        url=SQLALCHEMY_DATABASE_URL,
+        echo=config.confecho,
+        poolclass=MonitoredPool,
+        pool_size=config.poolsize,
+        max_overflow=config.maxovflw,
+        pool_timeout=config.pooltmot,
+        pool_recycle=config.poolrcyc,
+        pool_pre_ping=config.preping,
+        **driver_args,
+    )
     return async_engine
 
 
+def _read_only_sessionmaker(engine: AsyncEngine) -> async_sessionmaker:
+    """
+    Create a session factory for read-only sessions sharing the connection pool of an engine.
+
+    On PostgreSQL, the sessions run their statements in a `READ ONLY` transaction, which the
+    database refuses any write in and takes no transaction ID for. The sessions are also marked
+    read-only so that any attempt to write through them fails before it reaches the database.
+
+    :param engine: The asynchronous engine to borrow the connections from.
+
+    :return: An asynchronous session factory.
+    """
+    return async_sessionmaker(bind=engine.execution_options(postgresql_readonly=True), expire_on_commit=False, info={"read_only": True})
+
+
 def get_async_session() -> async_sessionmaker:
     """
-    Create an asynchronous session factory for handling database sessions.
+    Provide the process-wide asynchronous session factory for handling database sessions.
 
-    This factory binds to the asynchronous engine created using the configuration from
-    `get_engine()`.
+    The factory and the asynchronous engine backing it are created on the first call using the
+    configuration from `get_engine()` and reused afterwards, so that every session borrows its
+    connection from the same connection pool instead of building a new pool each time. The
+    read-only session factories on the primary and on the read replicas listed in the
+    configuration are set up alongside.
 
     :return: An asynchronous session factory.
     """
-    async_engine = get_engine()
-    async_session = async_sessionmaker(bind=async_engine, expire_on_commit=False)
-    return async_session
+    global _async_engine, _async_session, _read_session
+    if _async_session is None:
+        _async_engine = get_engine()
+        _async_session = async_sessionmaker(bind=_async_engine, expire_on_commit=False)
+        _read_session = _read_only_sessionmaker(_async_engine)
+        _replica_engines[:] = [get_engine(url=make_url(replica)) for replica in config.replicas]
+        _replica_sessions[:] = [_read_only_sessionmaker(replica) for replica in _replica_engines]
+    return _async_session
+
+
+def get_read_session(primary: bool = False) -> async_sessionmaker:
+    """
+    Pick an asynchronous session factory for handling read-only sessions.
+
+    The factory is picked among the read replicas, either in turns ("round-robin") or as the one
+    with the fewest connections in use ("least-busy") as per the configuration. The read-only
+    session factory on the primary database is returned when it is asked for or when no read
+    replicas are configured.
+
+    :param primary: Whether the sessions must read from the primary database. Defaults to False.
+
+    :return: An asynchronous session factory.
+    """
+    get_async_session()
+    if primary or not _replica_sessions:
+        return _read_session
+    if config.rplcpick == "least-busy":
+        return min(zip(_replica_engines, _replica_sessions, strict=True), key=lambda replica: replica[0].pool.checkedout())[1]
+    return _replica_sessions[next(_replica_turn) % len(_replica_sessions)]
+
+
+def get_pool_report() -> dict[str, int | float] | None:
+    """
+    Report the live usage of the connection pool of the process-wide asynchronous engine.
+
+    :return: Dictionary as returned by `MonitoredPool.report()` or None if the engine has not been
+             set up yet.
+    """
+    if _async_engine is None or not isinstance(_async_engine.pool, MonitoredPool):
+        return None
+    return _async_engine.pool.report()
+
+
+async def dispose_async_session() -> None:
+    """
+    Dispose the process-wide asynchronous engine and close all the pooled connections.
+
+    The engines of the read replicas are disposed of as well. The next call to
+    `get_async_session()` creates fresh engines and session factories.
+
+    :return: None
+    """
+    global _async_engine, _async_session, _read_session
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    for replica in _replica_engines:
+        await replica.dispose()
+    _replica_engines.clear()
+    _replica_sessions.clear()
+    _async_engine = None
+    _async_session = None
+    _read_session = None
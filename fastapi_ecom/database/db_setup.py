@@ -1,17 +1,21 @@
 from collections.abc import AsyncGenerator
 
 from alembic import command, config
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from fastapi_ecom.database import (  # noqa: F401
     alempath,
     baseobjc,
+    dispose_async_session,
     get_async_session,
     get_database_url,
     get_engine,
+    get_read_session,
     migrpath,
     models,
 )
+from fastapi_ecom.database.routing import client_key, has_writes, sticky_writes
 from fastapi_ecom.utils.logging_setup import general, success
 
 
@@ -42,27 +46,58 @@ def make_database() -> None:
     success("Database marked at migration head successfully")
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
-    Dependency function to provide a database session for FastAPI routes.
+    Dependency function to provide a database session on the primary database for FastAPI routes.
 
     This function -
         - Yields a database session for use within the route ensuring auto resource cleanup along
           with compatibility of FastAPI dependency injection.
-        - Commits the session upon successful execution.
+        - Commits the session upon successful execution, if it wrote or has changes pending to be
+          written; the transaction of a session which only read is rolled back as it closes.
+        - Keeps the reads of the client on the primary for a while if the session wrote to it.
         - Rolls back the session if an exception occurs to maintain database integrity.
         - Closes the session after the request is completed, regardless of outcome.
 
+    :param request: The incoming request.
+
     :yield: An instance of the asynchronous SQLAlchemy session.
 
     :raises exception: Re-raises any exception encountered during the session lifecycle.
     """
-    db = get_async_session()()  # Initialize a new database session.
+    db = get_async_session()()  # Initialize a new database session from the shared pool.
     try:
         yield db
-        await db.commit()  # Commit changes to the database if no exception occurs.
+        if has_writes(db):
+            sticky_writes.mark(client_key(request))  # Read your own writes from the primary.
+            await db.commit()  # Commit changes to the database if no exception occurs.
     except Exception:
         await db.rollback()  # Roll back changes if an exception occurs.
         raise
     finally:
         await db.close()  # Ensure the session is closed after use.
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Dependency function to provide a read-only database session for FastAPI routes which only read
+    from the database.
+
+    This function -
+        - Yields a read-only database session on one of the configured read replicas, or on the
+          primary if none is configured.
+        - Yields a read-only database session on the primary if the client wrote to it within the
+          stickiness window, so that it reads its own writes.
+        - Runs the statements of the session in a read-only transaction on PostgreSQL, which is
+          rolled back as the session closes.
+        - Closes the session after the request is completed, regardless of outcome.
+
+    :param request: The incoming request.
+
+    :yield: An instance of the asynchronous SQLAlchemy session.
+    """
+    db = get_read_session(primary=sticky_writes.is_sticky(client_key(request)))()
+    try:
+        yield db
+    finally:
+        await db.close()  # Ensure the session is closed after use.
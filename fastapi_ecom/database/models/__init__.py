@@ -1,5 +1,6 @@
 from fastapi_ecom.database.models.business import Business  # noqa: F401
 from fastapi_ecom.database.models.customer import Customer  # noqa: F401
+from fastapi_ecom.database.models.idempotency_key import IdempotencyKey  # noqa: F401
 from fastapi_ecom.database.models.order import Order  # noqa: F401
 from fastapi_ecom.database.models.order_details import OrderDetail  # noqa: F401
 from fastapi_ecom.database.models.product import Product  # noqa: F401
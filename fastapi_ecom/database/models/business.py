@@ -27,6 +27,8 @@ class Business(baseobjc, UUIDCreatableMixin, DateCreatableMixin, DateUpdateableM
     :cvar oauth_id: OAuth provider's user ID
     :cvar oauth_email: Email address from OAuth.
     :cvar created_via_oauth: Flag indicating if the business account is created using OAuth.
+    :cvar version: Version of the credentials of the business, bumped whenever they change so that
+                   the tokens issued before are revoked.
     :cvar products: Relationship to the `Product` model, representing the products offered by the
                     business.
     """
@@ -46,5 +48,6 @@ class Business(baseobjc, UUIDCreatableMixin, DateCreatableMixin, DateUpdateableM
     oauth_id = Column("oauth_id", String(100), nullable=True)
     oauth_email = Column("oauth_email", String(100), nullable=True)
     created_via_oauth = Column("created_via_oauth", Boolean, default=False)
+    version = Column("version", Integer, nullable=False, default=0, server_default="0")
 
-    products = relationship("Product", back_populates="businesses")
+    products = relationship("Product", back_populates="businesses", lazy="raise")
@@ -27,6 +27,8 @@ class Customer(baseobjc, UUIDCreatableMixin, DateCreatableMixin, DateUpdateableM
     :cvar oauth_id: OAuth provider's user ID
     :cvar oauth_email: Email address from OAuth.
     :cvar created_via_oauth: Flag indicating if the customer account is created using OAuth.
+    :cvar version: Version of the credentials of the customer, bumped whenever they change so that
+                   the tokens issued before are revoked.
     :cvar orders: Relationship to the `Order` model, representing orders placed by the customer.
     """
 
@@ -45,5 +47,6 @@ class Customer(baseobjc, UUIDCreatableMixin, DateCreatableMixin, DateUpdateableM
     oauth_id = Column("oauth_id", String(100), nullable=True)
     oauth_email = Column("oauth_email", String(100), nullable=True)
     created_via_oauth = Column("created_via_oauth", Boolean, default=False)
+    version = Column("version", Integer, nullable=False, default=0, server_default="0")
 
-    orders = relationship("Order", back_populates="customers")
+    orders = relationship("Order", back_populates="customers", lazy="raise")
@@ -0,0 +1,33 @@
+from sqlalchemy import Column, Integer, Text, UniqueConstraint
+from sqlalchemy.types import TIMESTAMP
+
+from fastapi_ecom.database import baseobjc
+from fastapi_ecom.database.models.util import DateCreatableMixin
+
+
+class IdempotencyKey(baseobjc, DateCreatableMixin):
+    """
+    Database model representing an idempotency key presented to a creating endpoint along with the
+    response it produced, so that a retry of the request is answered with the same response.
+
+    :cvar __tablename__: Name of the database table.
+    :cvar id: Auto incremented ID for each records.
+    :cvar scope: Endpoint and principal the key was presented by; the same key can be used by
+                 different principals or against different endpoints.
+    :cvar key: Value of the `Idempotency-Key` header.
+    :cvar fingerprint: Digest of the body of the request the key was first presented with.
+    :cvar status_code: Status code of the response produced for the key.
+    :cvar response: Serialized JSON body of the response produced for the key.
+    :cvar expiry_date: Timestamp after which the key is forgotten.
+    """
+
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (UniqueConstraint("scope", "key", name="uq_idempotency_keys_scope_key"),)
+
+    id = Column("id", Integer, primary_key=True, index=True, autoincrement=True)
+    scope = Column("scope", Text, nullable=False)
+    key = Column("key", Text, nullable=False)
+    fingerprint = Column("fingerprint", Text, nullable=False)
+    status_code = Column("status_code", Integer, nullable=True)
+    response = Column("response", Text, nullable=True)
+    expiry_date = Column("expiry_date", TIMESTAMP(timezone=True), nullable=False, index=True)
@@ -32,5 +32,5 @@ class Order(baseobjc, UUIDCreatableMixin, DateCreatableMixin, DateUpdateableMixi
     order_date = Column("order_date", Date, nullable=False)
     total_price = Column("total_price", Float, nullable=False)
 
-    order_details = relationship("OrderDetail", back_populates="orders")
-    customers = relationship("Customer", back_populates="orders", passive_deletes=True)
+    order_details = relationship("OrderDetail", back_populates="orders", lazy="raise")
+    customers = relationship("Customer", back_populates="orders", passive_deletes=True, lazy="raise")
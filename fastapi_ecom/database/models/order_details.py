@@ -34,5 +34,5 @@ class OrderDetail(baseobjc, UUIDCreatableMixin, DateCreatableMixin, DateUpdateab
     price = Column("product_price", Float, nullable=False)
     order_id = Column("order_id", Text, ForeignKey("orders.uuid", ondelete="CASCADE"), nullable=False)
 
-    orders = relationship("Order", back_populates="order_details", passive_deletes=True)
-    products = relationship("Product", back_populates="order_details")
+    orders = relationship("Order", back_populates="order_details", passive_deletes=True, lazy="raise")
+    products = relationship("Product", back_populates="order_details", lazy="raise")
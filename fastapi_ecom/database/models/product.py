@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Date, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import DDL, Column, Date, Float, ForeignKey, Index, Integer, String, Text, event
 from sqlalchemy.orm import relationship
 
 from fastapi_ecom.database import baseobjc
@@ -23,6 +23,8 @@ class Product(baseobjc, UUIDCreatableMixin, DateCreatableMixin, DateUpdateableMi
     :cvar price: Price of the product.
     :cvar business_id: Foreign key referencing the `Business` model. If the associated business is
                        deleted, the product record will also be deleted (CASCADE).
+    :cvar version: Version of the product, bumped on every update so that the conditional updates
+                   of the clients holding an older version are refused.
     :cvar businesses: Relationship to the `Business` model, representing the business that sells
                       the product. The record will reflect business deletion (passive deletes).
     :cvar order_details: Relationship to the `OrderDetail` model, representing the details of
@@ -39,6 +41,56 @@ class Product(baseobjc, UUIDCreatableMixin, DateCreatableMixin, DateUpdateableMi
     exp_date = Column("expiry_date", Date, nullable=False)
     price = Column("product_price", Float, nullable=False)
     business_id = Column("business_id", Text, ForeignKey("businesses.uuid", ondelete="CASCADE"), nullable=False)
+    version = Column("version", Integer, nullable=False, default=0, server_default="0")
 
-    businesses = relationship("Business", back_populates="products", passive_deletes=True)
-    order_details = relationship("OrderDetail", back_populates="products")
+    businesses = relationship("Business", back_populates="products", passive_deletes=True, lazy="raise")
+    order_details = relationship("OrderDetail", back_populates="products", lazy="raise")
+
+
+# Indexes of the filters of the product searches and of their facets; the category along with the
+# ID serves the pages of a category, the category along with the price serves the facets without
+# reading the table, and the expiry date serves the products not expired yet.
+Index("ix_products_category_id", Product.category, Product.id)
+Index("ix_products_category_price", Product.category, Product.price)
+Index("ix_products_expiry_date", Product.exp_date)
+
+
+# Full-text search on the name and the description of the products, which lives outside of the
+# model as neither of the databases supported shares its flavour of it. On PostgreSQL, a generated
+# `tsvector` column weighting the name over the description is indexed with GIN, and so are the
+# name and the description with `pg_trgm` so that the substring searches use an index too. On
+# SQLite, an external content FTS5 table is kept in sync with the products through triggers.
+FULLTEXT_POSTGRESQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "ALTER TABLE products ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('english', coalesce(product_name, '')), 'A') || "
+    "setweight(to_tsvector('english', coalesce(description, '')), 'B')) STORED",
+    "CREATE INDEX ix_products_search_vector ON products USING gin (search_vector)",
+    "CREATE INDEX ix_products_product_name_trgm ON products USING gin (product_name gin_trgm_ops)",
+    "CREATE INDEX ix_products_description_trgm ON products USING gin (description gin_trgm_ops)",
+]
+FULLTEXT_SQLITE = [
+    "CREATE VIRTUAL TABLE products_fts USING fts5(product_name, description, content='products', content_rowid='id', tokenize='porter unicode61')",
+    "CREATE TRIGGER products_fts_insert AFTER INSERT ON products BEGIN "
+    "INSERT INTO products_fts (rowid, product_name, description) VALUES (new.id, new.product_name, new.description); END",
+    "CREATE TRIGGER products_fts_delete AFTER DELETE ON products BEGIN "
+    "INSERT INTO products_fts (products_fts, rowid, product_name, description) VALUES ('delete', old.id, old.product_name, old.description); END",
+    "CREATE TRIGGER products_fts_update AFTER UPDATE OF product_name, description ON products BEGIN "
+    "INSERT INTO products_fts (products_fts, rowid, product_name, description) VALUES ('delete', old.id, old.product_name, old.description); "
+    "INSERT INTO products_fts (rowid, product_name, description) VALUES (new.id, new.product_name, new.description); END",
+]
+
+# Objects of the full-text search created alongside the table, unknown to the model
+FULLTEXT_OBJECTS = {
+    "search_vector",
+    "ix_products_search_vector",
+    "ix_products_product_name_trgm",
+    "ix_products_description_trgm",
+    "products_fts",
+}
+
+for statement in FULLTEXT_POSTGRESQL:
+    event.listen(Product.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+for statement in FULLTEXT_SQLITE:
+    event.listen(Product.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+event.listen(Product.__table__, "before_drop", DDL("DROP TABLE IF EXISTS products_fts").execute_if(dialect="sqlite"))
@@ -0,0 +1,63 @@
+from time import perf_counter
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
+
+
+class MonitoredPool(AsyncAdaptedQueuePool):
+    """
+    Asynchronous queue pool which keeps track of how long the callers wait to check out a
+    connection, so that the pool can be sized from data rather than guesses.
+
+    :ivar checkouts: Number of connections checked out from the pool so far.
+    :ivar wait_total: Total seconds spent by the callers waiting for a connection.
+    :ivar wait_max: Longest seconds spent by a caller waiting for a connection.
+    :ivar timeouts: Number of callers which gave up waiting for a connection.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.timeouts = 0
+
+    def connect(self) -> PoolProxiedConnection:
+        """
+        Check out a connection from the pool while measuring the time it takes.
+
+        :return: A connection proxied by the pool.
+
+        :raises TimeoutError: If no connection becomes available within the pool timeout.
+        """
+        start = perf_counter()
+        try:
+            conn = super().connect()
+        except exc.TimeoutError:
+            self.timeouts += 1
+            raise
+        wait = perf_counter() - start
+        self.checkouts += 1
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+        return conn
+
+    def report(self) -> dict[str, int | float]:
+        """
+        Report the live usage of the pool.
+
+        :return: Dictionary containing the pool size, the checked out, idle and overflow
+                 connections along with the time spent by the callers waiting for a connection.
+        """
+        return {
+            "size": self.size(),
+            "checked_out": self.checkedout(),
+            "idle": self.checkedin(),
+            "overflow": max(self.overflow(), 0),
+            "max_overflow": self._max_overflow,
+            "timeout": self.timeout(),
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_avg_ms": (self.wait_total / self.checkouts * 1000) if self.checkouts else 0.0,
+            "wait_max_ms": self.wait_max * 1000,
+        }
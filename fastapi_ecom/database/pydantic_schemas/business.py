@@ -108,6 +108,8 @@ class BusinessManyResult(APIResult):
     Schema for a list of business results in API responses.
 
     :ivar businesses: List of businesses with their details.
+    :ivar next_cursor: Cursor of the next page, None if it is the last page.
     """
 
     businesses: list[BusinessView] = []
+    next_cursor: str | None = None
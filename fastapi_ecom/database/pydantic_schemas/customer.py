@@ -108,6 +108,8 @@ class CustomerManyResult(APIResult):
     Schema for a list of customer results in API responses.
 
     :ivar customers: List of customer details.
+    :ivar next_cursor: Cursor of the next page, None if it is the last page.
     """
 
     customers: list[CustomerView] = []
+    next_cursor: str | None = None
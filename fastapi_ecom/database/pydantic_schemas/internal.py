@@ -0,0 +1,175 @@
+from pydantic import BaseModel
+
+from fastapi_ecom.database.pydantic_schemas.util import APIResult
+
+
+class PoolView(BaseModel):
+    """
+    Schema for viewing the live usage of the database connection pool.
+
+    :ivar size: Number of connections kept open in the pool.
+    :ivar checked_out: Number of connections currently in use.
+    :ivar idle: Number of connections currently waiting in the pool.
+    :ivar overflow: Number of connections currently opened beyond the pool size.
+    :ivar max_overflow: Number of connections allowed to be opened beyond the pool size.
+    :ivar timeout: Seconds to wait for a connection before giving up.
+    :ivar checkouts: Number of connections checked out from the pool so far.
+    :ivar timeouts: Number of callers which gave up waiting for a connection.
+    :ivar wait_avg_ms: Average milliseconds spent waiting for a connection.
+    :ivar wait_max_ms: Longest milliseconds spent waiting for a connection.
+    """
+
+    size: int
+    checked_out: int
+    idle: int
+    overflow: int
+    max_overflow: int
+    timeout: float
+    checkouts: int
+    timeouts: int
+    wait_avg_ms: float
+    wait_max_ms: float
+
+
+class PoolResult(APIResult):
+    """
+    Schema for the database connection pool report in API responses.
+
+    :ivar pool: Contains the live usage of the database connection pool.
+    """
+
+    pool: PoolView
+
+
+class HashingView(BaseModel):
+    """
+    Schema for viewing the live usage of the password hashing workers.
+
+    :ivar workers: Number of workers hashing the passwords.
+    :ivar limit: Number of operations admitted to the workers at once.
+    :ivar admitted: Number of operations currently admitted to the workers.
+    :ivar waiting: Number of operations currently waiting for admission.
+    :ivar peak_waiting: Highest number of operations which waited for admission at once.
+    :ivar completed: Number of operations completed so far.
+    :ivar rejected: Number of operations rejected as too many were waiting.
+    :ivar wait_avg_ms: Average milliseconds spent waiting for admission.
+    :ivar wait_max_ms: Longest milliseconds spent waiting for admission.
+    """
+
+    workers: int
+    limit: int
+    admitted: int
+    waiting: int
+    peak_waiting: int
+    completed: int
+    rejected: int
+    wait_avg_ms: float
+    wait_max_ms: float
+
+
+class HashingResult(APIResult):
+    """
+    Schema for the password hashing report in API responses.
+
+    :ivar hashing: Contains the live usage of the password hashing workers.
+    """
+
+    hashing: HashingView
+
+
+class PrincipalCacheView(BaseModel):
+    """
+    Schema for viewing the usage of the cache of authenticated principals.
+
+    :ivar size: Number of principals currently cached.
+    :ivar capacity: Number of principals which can be cached at once.
+    :ivar ttl: Seconds for which a principal is served from the cache.
+    :ivar hits: Number of authentications served from the cache.
+    :ivar misses: Number of authentications which had to be verified against the database.
+    :ivar hit_rate: Ratio of the authentications served from the cache.
+    """
+
+    size: int
+    capacity: int
+    ttl: float
+    hits: int
+    misses: int
+    hit_rate: float
+
+
+class PrincipalCacheResult(APIResult):
+    """
+    Schema for the authenticated principal cache report in API responses.
+
+    :ivar principals: Contains the usage of the cache of authenticated principals.
+    """
+
+    principals: PrincipalCacheView
+
+
+class UserinfoCacheView(BaseModel):
+    """
+    Schema for viewing the usage of the cache of the users of the OAuth bearer tokens.
+
+    :ivar size: Number of tokens currently cached.
+    :ivar capacity: Number of tokens which can be cached at once.
+    :ivar ttl: Seconds for which the user of a valid token is served from the cache.
+    :ivar negative_ttl: Seconds for which a token rejected by the provider is remembered.
+    :ivar inflight: Number of calls to the provider currently in flight.
+    :ivar hits: Number of lookups served from the cache.
+    :ivar misses: Number of lookups which had to call the provider.
+    :ivar coalesced: Number of lookups which joined a call to the provider already in flight.
+    :ivar hit_rate: Ratio of the lookups which did not call the provider.
+    """
+
+    size: int
+    capacity: int
+    ttl: float
+    negative_ttl: float
+    inflight: int
+    hits: int
+    misses: int
+    coalesced: int
+    hit_rate: float
+
+
+class UserinfoCacheResult(APIResult):
+    """
+    Schema for the OAuth bearer token cache report in API responses.
+
+    :ivar userinfo: Contains the usage of the cache of the users of the OAuth bearer tokens.
+    """
+
+    userinfo: UserinfoCacheView
+
+
+class OrderBatchView(BaseModel):
+    """
+    Schema for viewing the usage of the group-commit writer of the orders.
+
+    :ivar window: Milliseconds for which a batch collects orders, 0 if batching is disabled.
+    :ivar max_batch: Number of orders after which a batch is written without waiting further.
+    :ivar pending: Number of orders waiting for the next batch.
+    :ivar batches: Number of batches committed.
+    :ivar orders: Number of orders committed as part of a batch.
+    :ivar retries: Number of batches whose orders had to be written again one at a time.
+    :ivar average_batch: Average number of orders per batch committed.
+    """
+
+    window: float
+    max_batch: int
+    pending: int
+    batches: int
+    orders: int
+    retries: int
+    average_batch: float
+
+
+class OrderBatchResult(APIResult):
+    """
+    Schema for the order batching report in API responses.
+
+    :ivar orders: Contains the usage of the group-commit writer of the orders.
+    """
+
+    orders: OrderBatchView
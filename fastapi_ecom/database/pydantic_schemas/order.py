@@ -98,9 +98,11 @@ class OrderManyResult(APIResult):
     Schema for a list of orders in API responses.
 
     :ivar orders: List of orders with detailed information.
+    :ivar next_cursor: Cursor of the next page, None if it is the last page.
     """
 
     orders: list[OrderView] = []
+    next_cursor: str | None = None
 
 
 class OrderManyResultInternal(APIResult):
@@ -108,6 +110,8 @@ class OrderManyResultInternal(APIResult):
     Schema for a list of internal orders in API responses, including unique identifiers.
 
     :ivar orders: List of orders with detailed internal information.
+    :ivar next_cursor: Cursor of the next page, None if it is the last page.
     """
 
     orders: list[OrderViewInternal] = []
+    next_cursor: str | None = None
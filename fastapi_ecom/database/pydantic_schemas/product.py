@@ -84,6 +84,45 @@ class ProductUpdate(BaseModel):
     price: float | None = 0.0
 
 
+class ProductBulkUpdateItem(ProductUpdate):
+    """
+    Schema for the changes made to one of the products updated in bulk, with all fields but the
+    UUID optional.
+
+    :ivar uuid: UUID of the product to update.
+    """
+
+    uuid: str
+
+
+class ProductBulkUpdate(BaseModel):
+    """
+    Schema for updating many products at once, either listing them along with their own changes or
+    making the same changes to all the products of a category.
+
+    :ivar products: The products to update, each along with its own changes.
+    :ivar category: Category of the products to update, instead of listing them.
+    :ivar changes: The changes made to all the products of the category.
+    """
+
+    products: list[ProductBulkUpdateItem] = []
+    category: str | None = None
+    changes: ProductUpdate | None = None
+
+
+class ProductBulkDelete(BaseModel):
+    """
+    Schema for deleting many products at once, either listing them or deleting all the products of
+    a category.
+
+    :ivar uuids: UUIDs of the products to delete.
+    :ivar category: Category of the products to delete, instead of listing them.
+    """
+
+    uuids: list[str] = []
+    category: str | None = None
+
+
 class ProductInternal(ProductCreate):
     """
     Internal schema for product data, including additional internal details.
@@ -124,9 +163,11 @@ class ProductManyResult(APIResult):
     Schema for a list of products in API responses.
 
     :ivar products: List of products with detailed information.
+    :ivar next_cursor: Cursor of the next page, None if it is the last page.
     """
 
     products: list[ProductView] = []
+    next_cursor: str | None = None
 
 
 class ProductManyResultInternal(APIResult):
@@ -134,6 +175,86 @@ class ProductManyResultInternal(APIResult):
     Schema for a list of products in API responses, including additional internal details.
 
     :ivar products: List of products with detailed internal information.
+    :ivar next_cursor: Cursor of the next page, None if it is the last page.
     """
 
     products: list[ProductViewInternal] = []
+    next_cursor: str | None = None
+
+
+class CategoryFacet(BaseModel):
+    """
+    Schema for the number of products of a category.
+
+    :ivar category: Category of the products.
+    :ivar count: Number of products of the category.
+    """
+
+    category: str
+    count: int
+
+
+class PriceFacet(BaseModel):
+    """
+    Schema for the number of products within a price bucket.
+
+    :ivar min: Lowest price of the bucket, inclusive, None for the cheapest bucket.
+    :ivar max: Highest price of the bucket, exclusive, None for the most expensive bucket.
+    :ivar count: Number of products within the bucket.
+    """
+
+    min: float | None
+    max: float | None
+    count: int
+
+
+class ProductFacetResult(APIResult):
+    """
+    Schema for the facets of the products in API responses.
+
+    :ivar total: Number of products matching the filters.
+    :ivar categories: Number of matching products per category, most populated first.
+    :ivar prices: Number of matching products per price bucket, cheapest first.
+    """
+
+    total: int
+    categories: list[CategoryFacet] = []
+    prices: list[PriceFacet] = []
+
+
+class ProductImportError(BaseModel):
+    """
+    Schema for a row rejected by a product import.
+
+    :ivar line: Number of the line the row starts at in the upload, starting at 1.
+    :ivar detail: Reason the row was rejected.
+    """
+
+    line: int
+    detail: str
+
+
+class ProductImportResult(APIResult):
+    """
+    Schema for the outcome of a product import in API responses.
+
+    :ivar imported: Number of products imported.
+    :ivar failed: Number of rows rejected.
+    :ivar errors: The rejected rows, up to the configured number, in the order of the upload.
+    """
+
+    imported: int
+    failed: int
+    errors: list[ProductImportError] = []
+
+
+class ProductBulkResult(APIResult):
+    """
+    Schema for the outcome of a bulk update or a bulk delete of products in API responses.
+
+    :ivar count: Number of products updated or deleted.
+    :ivar missing: UUIDs listed which match no product of the business.
+    """
+
+    count: int
+    missing: list[str] = []
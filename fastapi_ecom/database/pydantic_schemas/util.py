@@ -27,3 +27,17 @@ class APIResult(BaseModel):
     """
 
     action: APIResultAction | None
+
+
+class TokenResult(APIResult):
+    """
+    Schema for the signed tokens issued in API responses.
+
+    :ivar token: The signed token to present in the `Authorization` header.
+    :ivar token_type: The scheme to present the token with in the `Authorization` header.
+    :ivar expires_in: Seconds after which the token expires.
+    """
+
+    token: str
+    token_type: str
+    expires_in: int
@@ -0,0 +1,140 @@
+from collections import OrderedDict
+from hashlib import sha256
+from time import monotonic
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
+
+from fastapi_ecom.config import config
+
+
+@event.listens_for(Session, "before_flush")
+def _guard_flush(session: Session, flush_context: UOWTransaction, instances: object) -> None:
+    """
+    Refuse to flush pending changes through a read-only session.
+
+    :param session: The session about to flush its changes.
+    :param flush_context: The unit of work of the flush.
+    :param instances: Deprecated collection of instances passed by SQLAlchemy.
+
+    :return: None
+
+    :raises InvalidRequestError: If the session is read-only.
+    """
+    if session.info.get("read_only"):
+        raise InvalidRequestError("Cannot write to the database through a read-only session")
+
+
+@event.listens_for(Session, "after_flush")
+def _track_flush(session: Session, flush_context: UOWTransaction) -> None:
+    """
+    Mark the session as having written to the database once it flushes pending changes.
+
+    :param session: The session which flushed its changes.
+    :param flush_context: The unit of work of the flush.
+
+    :return: None
+    """
+    session.info["has_writes"] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _track_execute(orm_execute_state: ORMExecuteState) -> None:
+    """
+    Mark the session as having written to the database once it executes an `INSERT`, `UPDATE` or
+    `DELETE` statement directly.
+
+    :param orm_execute_state: The state of the statement being executed.
+
+    :return: None
+
+    :raises InvalidRequestError: If the session is read-only.
+    """
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        if orm_execute_state.session.info.get("read_only"):
+            raise InvalidRequestError("Cannot write to the database through a read-only session")
+        orm_execute_state.session.info["has_writes"] = True
+
+
+def has_writes(session: AsyncSession) -> bool:
+    """
+    Check whether the session has written to the database or has changes pending to be written.
+
+    :param session: The asynchronous database session to check.
+
+    :return: True if the session flushed changes, executed a writing statement or holds pending
+             changes else False.
+    """
+    return session.info.get("has_writes", False) or bool(session.new or session.dirty or session.deleted)
+
+
+def client_key(request: Request) -> str | None:
+    """
+    Identify the client of a request by a digest of the credentials it presents, so that the
+    credentials themselves are never kept around.
+
+    :param request: The incoming request.
+
+    :return: Digest of the `Authorization` header or None for anonymous requests.
+    """
+    authorization = request.headers.get("Authorization")
+    return sha256(authorization.encode("utf-8")).hexdigest() if authorization else None
+
+
+class StickyWrites:
+    """
+    Bounded registry of the clients which wrote to the primary database recently, so that their
+    reads can stay on the primary for the stickiness window instead of going to a lagging replica.
+
+    :ivar maxsize: Maximum number of clients remembered at once; the oldest are forgotten first.
+    """
+
+    def __init__(self, maxsize: int = 10000) -> None:
+        self.maxsize = maxsize
+        self._writes: OrderedDict[str, float] = OrderedDict()
+
+    def mark(self, key: str | None) -> None:
+        """
+        Remember that a client has just written to the primary database.
+
+        :param key: Key identifying the client as returned by `client_key()`.
+
+        :return: None
+        """
+        if not key or config.rplstick <= 0:
+            return
+        self._writes[key] = monotonic()
+        self._writes.move_to_end(key)
+        while len(self._writes) > self.maxsize:
+            self._writes.popitem(last=False)
+
+    def is_sticky(self, key: str | None) -> bool:
+        """
+        Check whether the reads of a client must stay on the primary database.
+
+        :param key: Key identifying the client as returned by `client_key()`.
+
+        :return: True if the client wrote within the stickiness window else False.
+        """
+        written = self._writes.get(key) if key else None
+        if written is None:
+            return False
+        if monotonic() - written > config.rplstick:
+            self._writes.pop(key, None)
+            return False
+        return True
+
+    def clear(self) -> None:
+        """
+        Forget all the clients.
+
+        :return: None
+        """
+        self._writes.clear()
+
+
+# Registry shared by all the requests of the service.
+sticky_writes = StickyWrites()
@@ -11,10 +11,12 @@ from fastapi_ecom.database import baseobjc
 from fastapi_ecom.database.models import (  # noqa: F401
     business,
     customer,
+    idempotency_key,
     order,
     order_details,
     product,
 )
+from fastapi_ecom.database.models.product import FULLTEXT_OBJECTS
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -31,6 +33,15 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = baseobjc.metadata
 
+
+def include_object(object, name, type_, reflected, compare_to):
+    """
+    Keep the objects of the full-text search, which are created outside of the models, out of the
+    autogenerated migrations.
+    """
+    return name not in FULLTEXT_OBJECTS and not (type_ == "table" and name.startswith("products_fts"))
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -53,6 +64,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -86,7 +98,7 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection):
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(connection=connection, target_metadata=target_metadata, include_object=include_object)
 
     with context.begin_transaction():
         context.run_migrations()
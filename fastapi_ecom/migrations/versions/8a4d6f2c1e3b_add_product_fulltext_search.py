@@ -0,0 +1,65 @@
+"""add product fulltext search
+
+Revision ID: 8a4d6f2c1e3b
+Revises: 5e2a7c4b9d1f
+Create Date: 2026-10-17 09:02:17.481203
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8a4d6f2c1e3b"
+down_revision: str | None = "5e2a7c4b9d1f"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute(
+            "ALTER TABLE products ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+            "setweight(to_tsvector('english', coalesce(product_name, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(description, '')), 'B')) STORED"
+        )
+        op.execute("CREATE INDEX ix_products_search_vector ON products USING gin (search_vector)")
+        op.execute("CREATE INDEX ix_products_product_name_trgm ON products USING gin (product_name gin_trgm_ops)")
+        op.execute("CREATE INDEX ix_products_description_trgm ON products USING gin (description gin_trgm_ops)")
+    else:
+        op.execute(
+            "CREATE VIRTUAL TABLE products_fts USING fts5("
+            "product_name, description, content='products', content_rowid='id', tokenize='porter unicode61')"
+        )
+        op.execute(
+            "CREATE TRIGGER products_fts_insert AFTER INSERT ON products BEGIN "
+            "INSERT INTO products_fts (rowid, product_name, description) VALUES (new.id, new.product_name, new.description); END"
+        )
+        op.execute(
+            "CREATE TRIGGER products_fts_delete AFTER DELETE ON products BEGIN "
+            "INSERT INTO products_fts (products_fts, rowid, product_name, description) "
+            "VALUES ('delete', old.id, old.product_name, old.description); END"
+        )
+        op.execute(
+            "CREATE TRIGGER products_fts_update AFTER UPDATE OF product_name, description ON products BEGIN "
+            "INSERT INTO products_fts (products_fts, rowid, product_name, description) "
+            "VALUES ('delete', old.id, old.product_name, old.description); "
+            "INSERT INTO products_fts (rowid, product_name, description) VALUES (new.id, new.product_name, new.description); END"
+        )
+        # Index the products present before the table was created
+        op.execute("INSERT INTO products_fts (products_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_products_description_trgm", table_name="products")
+        op.drop_index("ix_products_product_name_trgm", table_name="products")
+        op.drop_index("ix_products_search_vector", table_name="products")
+        op.drop_column("products", "search_vector")
+    else:
+        op.execute("DROP TRIGGER IF EXISTS products_fts_update")
+        op.execute("DROP TRIGGER IF EXISTS products_fts_delete")
+        op.execute("DROP TRIGGER IF EXISTS products_fts_insert")
+        op.execute("DROP TABLE IF EXISTS products_fts")
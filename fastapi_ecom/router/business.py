@@ -1,16 +1,16 @@
 from datetime import datetime, timezone
 from uuid import uuid4
 
-import bcrypt
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import delete
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import delete, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
-from fastapi_ecom.database.db_setup import get_db
+from fastapi_ecom.config import config
+from fastapi_ecom.database.db_setup import get_db, get_read_db
 from fastapi_ecom.database.models.business import Business
+from fastapi_ecom.database.models.product import Product
 from fastapi_ecom.database.pydantic_schemas.business import (
     BusinessCreate,
     BusinessManyResult,
@@ -18,17 +18,27 @@ from fastapi_ecom.database.pydantic_schemas.business import (
     BusinessUpdate,
     BusinessView,
 )
-from fastapi_ecom.utils.auth import verify_business_cred
+from fastapi_ecom.database.pydantic_schemas.util import TokenResult
+from fastapi_ecom.utils.auth import auth_backends, pick_backend, verify_business_cred
+from fastapi_ecom.utils.hashing import hash_password
+from fastapi_ecom.utils.idempotency import idempotency_store
 from fastapi_ecom.utils.logging_setup import failure, general, success, warning
+from fastapi_ecom.utils.pagination import next_page, paginate
+from fastapi_ecom.utils.principal_cache import principal_cache
+from fastapi_ecom.utils.response_cache import response_cache
+from fastapi_ecom.utils.search_index import product_index
+from fastapi_ecom.utils.token_auth import issue_token
 
 router = APIRouter(prefix="/business")
 
 
 @router.post("/create", status_code=status.HTTP_201_CREATED, response_model=BusinessResult, tags=["business"])
-async def create_business(business: BusinessCreate, db: AsyncSession = Depends(get_db)) -> BusinessResult:
+async def create_business(request: Request, business: BusinessCreate, db: AsyncSession = Depends(get_db)) -> BusinessResult:
     """
     Endpoint to create a new business.
 
+    :param request: The incoming request, optionally carrying an `Idempotency-Key` header whose
+                    retries are answered with the response of the first attempt.
     :param business: Input data for creating a new business. Must adhere to the `BusinessCreate`
                      schema.
     :param db: Active asynchronous database session dependency.
@@ -38,13 +48,17 @@ async def create_business(business: BusinessCreate, db: AsyncSession = Depends(g
 
     :raises HTTPException:
         - If a uniqueness constraint fails, it returns a 409 Conflict status.
+        - If the idempotency key was used for a different request, it returns a 422 Unprocessable
+          Entity status.
         - If there are other database errors, it returns a 500 Internal Server Error.
     """
-    salt = bcrypt.gensalt()
-    hashed_password = bcrypt.hashpw(business.password.strip().encode("utf-8"), salt)
+    idempotent = await idempotency_store.claim(request, db, "business", business)
+    if idempotent.replay:
+        return idempotent.replay
+    hashed_password = await hash_password(business.password.strip())
     db_business = Business(
         email=business.email.strip(),
-        password=hashed_password.decode("utf-8"),
+        password=hashed_password,
         name=business.name.strip(),
         addr_line_1=business.addr_line_1.strip(),
         addr_line_2=business.addr_line_2.strip(),
@@ -62,8 +76,11 @@ async def create_business(business: BusinessCreate, db: AsyncSession = Depends(g
     except Exception as expt:
         failure(f"Business account creation failed with unexpected error for email: {business.email}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected database error occurred.") from expt
+    response_cache.bump_on_commit(db)
     success(f"Business account created successfully with email: {business.email}")
-    return {"action": "post", "business": BusinessView.model_validate(db_business).model_dump()}
+    result = {"action": "post", "business": BusinessView.model_validate(db_business).model_dump()}
+    idempotent.store(status.HTTP_201_CREATED, result)
+    return result
 
 
 @router.get("/me", status_code=status.HTTP_200_OK, tags=["business"])
@@ -79,34 +96,77 @@ async def get_business_me(business_auth=Depends(verify_business_cred)) -> dict[s
     return {"action": "get", "email": business_auth.email}
 
 
+@router.post("/token", status_code=status.HTTP_201_CREATED, response_model=TokenResult, tags=["business"])
+async def create_business_token(request: Request, business_auth=Depends(verify_business_cred)) -> TokenResult:
+    """
+    Endpoint for an authenticated business to exchange its credentials for a signed token.
+
+    The subsequent requests presenting the token in the `Authorization` header with the "Token"
+    scheme skip the verification of the password. The token expires after the configured time
+    and is revoked when the email address or the password of the business changes.
+
+    :param request: The incoming request carrying the credentials.
+    :param business_auth: Authenticated business object.
+
+    :return: Dictionary containing the action type, the signed token, its scheme and its lifetime.
+
+    :raises HTTPException:
+        - If the business authenticated with a token, it raises 403 Forbidden.
+    """
+    if pick_backend(request) is auth_backends["token"]:
+        warning(f"Token refresh refused for business: {business_auth.email}")
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Authenticate with the credentials to obtain a token")
+    general(f"Issuing token for business: {business_auth.email}")
+    token = issue_token("business", business_auth)
+    success(f"Token issued successfully for business: {business_auth.email}")
+    return {"action": "post", "token": token, "token_type": "Token", "expires_in": config.tokenttl}
+
+
 @router.get("/search", status_code=status.HTTP_200_OK, response_model=BusinessManyResult, tags=["business"])
 async def get_businesses(
-    skip: int = Query(0, ge=0, description="Number of records to skip (must be between 0 and int64)"),
+    request: Request,
+    cursor: str | None = Query(None, description="Cursor returned as `next_cursor` by the previous page"),
+    skip: int = Query(0, ge=0, description="Number of records to skip past the cursor (legacy, capped by the configuration)"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return (must be between 1 and 100)"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> BusinessManyResult:
     """
     Endpoint fetches a paginated list of businesses from the database.
 
-    :param skip: Number of records to skip. Must be between 0 and int64.
+    :param request: The incoming request, optionally carrying an `If-None-Match` header.
+    :param cursor: Cursor returned as `next_cursor` by the previous page, to fetch the page following
+                   it.
+    :param skip: Number of records to skip past the cursor. Must be between 0 and the configured
+                 cap.
     :param limit: Maximum number of records to return. Must be between 1 and 100.
-    :param db: Active asynchronous database session dependency.
+    :param db: Active asynchronous database session dependency on a read replica.
 
     :return: Dictionary containing the action type and a list of businesses, validated and
              serialized using the `BusinessView` schema.
+             The cursor of the next page is included, None on the last page.
 
     :raises HTTPException:
         - If no business exist in the database, it raises 404 Not Found.
+        - If the cursor is malformed or more records than the configured cap are skipped, it raises
+          422 Unprocessable Entity.
     """
-    general(f"Searching businesses with skip={skip}, limit={limit}")
-    query = select(Business).options(selectinload("*")).offset(skip).limit(limit)
+    general(f"Searching businesses with cursor={cursor}, skip={skip}, limit={limit}")
+    cached = await response_cache.lookup(request)
+    if cached:
+        return cached
+    query = paginate(select(Business), Business.id, cursor, skip, limit)
     result = await db.execute(query)
-    businesses = result.scalars().all()
+    businesses, next_cursor = next_page(result.scalars().all(), limit)
     if not businesses:
         warning("No businesses found in database")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No business present in database")
     success(f"Found {len(businesses)} businesses")
-    return {"action": "get", "businesses": [BusinessView.model_validate(business).model_dump() for business in businesses]}
+    result = {
+        "action": "get",
+        "businesses": [BusinessView.model_validate(business).model_dump() for business in businesses],
+        "next_cursor": next_cursor,
+    }
+    return await response_cache.store(request, BusinessManyResult, result)
 
 
 @router.delete("/delete/me", status_code=status.HTTP_202_ACCEPTED, response_model=BusinessResult, tags=["business"])
@@ -125,11 +185,16 @@ async def delete_business(db: AsyncSession = Depends(get_db), business_auth=Depe
         - If there are other database errors, it returns a 500 Internal Server Error.
     """
     general(f"Deleting business account: {business_auth.email}")
-    query = select(Business).where(Business.uuid == business_auth.uuid).options(selectinload("*"))
+    # Delete the products of the business here rather than leave it to the cascade of the foreign
+    # key, so that they are dropped from the search index as well
+    result = await db.execute(delete(Product).where(Product.business_id == business_auth.uuid).returning(Product.id))
+    product_index.drop(db, list(result.scalars()))
+    # Delete the record and fetch the deleted row in a single round trip
+    query = delete(Business).where(Business.uuid == business_auth.uuid).returning(Business)
     result = await db.execute(query)
-    business_to_delete = result.scalar_one_or_none()
-    query = delete(Business).where(Business.uuid == business_auth.uuid)
-    await db.execute(query)
+    business_to_delete = result.scalar_one()
+    principal_cache.invalidate_on_commit(db, "business", business_auth.email, business_auth.uuid)
+    response_cache.bump_on_commit(db)
     try:
         await db.flush()
     except Exception as expt:  # pragma: no cover
@@ -164,24 +229,22 @@ async def update_business(
     """
     business_email = business_auth.email  # Capture email before potential database errors
     general(f"Updating details of business: {business_email}")
-    query = select(Business).where(Business.uuid == business_auth.uuid).options(selectinload("*"))
-    result = await db.execute(query)
-    business_to_update = result.scalar_one_or_none()
-    is_updated = False
+    business_to_update = business_auth
     bus_cols = ["email", "name", "addr_line_1", "addr_line_2", "city", "state"]
-    for item in bus_cols:
-        if getattr(business, item) != "":
-            setattr(business_to_update, item, getattr(business, item).strip())
-            is_updated = True
+    changes = {item: getattr(business, item).strip() for item in bus_cols if getattr(business, item) != ""}
     if business.password != "":
-        salt = bcrypt.gensalt()
-        hashed_password = bcrypt.hashpw(business.password.encode("utf-8"), salt)
-        business_to_update.password = hashed_password.decode("utf-8")
-        is_updated = True
-    if is_updated:
-        business_to_update.update_date = datetime.now(timezone.utc)
+        changes["password"] = await hash_password(business.password)
+    if business.password != "" or business.email != "":
+        changes["version"] = Business.version + 1  # Revoke the tokens issued before
+    if changes:
+        # Write only the fields provided and fetch the updated row in a single round trip
+        changes["update_date"] = datetime.now(timezone.utc)
+        query = update(Business).where(Business.uuid == business_auth.uuid).values(**changes).returning(Business)
+        principal_cache.invalidate_on_commit(db, "business", business_email, business_auth.uuid)
+        response_cache.bump_on_commit(db)
         try:
-            await db.flush()
+            result = await db.execute(query)
+            business_to_update = result.scalar_one()
         except IntegrityError as expt:
             failure(f"Business update failed - Uniqueness constraint violation for: {business_email}")
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Uniqueness constraint failed - Please try again") from expt
@@ -1,15 +1,14 @@
 from datetime import datetime, timezone
 from uuid import uuid4
 
-import bcrypt
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import delete
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy import delete, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
-from fastapi_ecom.database.db_setup import get_db
+from fastapi_ecom.config import config
+from fastapi_ecom.database.db_setup import get_db, get_read_db
 from fastapi_ecom.database.models.customer import Customer
 from fastapi_ecom.database.pydantic_schemas.customer import (
     CustomerCreate,
@@ -18,33 +17,45 @@ from fastapi_ecom.database.pydantic_schemas.customer import (
     CustomerUpdate,
     CustomerView,
 )
-from fastapi_ecom.utils.auth import verify_cust_cred
+from fastapi_ecom.database.pydantic_schemas.util import TokenResult
+from fastapi_ecom.utils.auth import auth_backends, pick_backend, verify_cust_cred
+from fastapi_ecom.utils.hashing import hash_password
+from fastapi_ecom.utils.idempotency import idempotency_store
 from fastapi_ecom.utils.logging_setup import failure, general, success, warning
+from fastapi_ecom.utils.pagination import next_page, paginate
+from fastapi_ecom.utils.principal_cache import principal_cache
+from fastapi_ecom.utils.token_auth import issue_token
 
 router = APIRouter(prefix="/customer")
 
 
 @router.post("/create", status_code=status.HTTP_201_CREATED, response_model=CustomerResult, tags=["customer"])
-async def create_customer(customer: CustomerCreate, db: AsyncSession = Depends(get_db)) -> CustomerResult:
+async def create_customer(request: Request, customer: CustomerCreate, db: AsyncSession = Depends(get_db)) -> CustomerResult:
     """
     Endpoint to create a new customer.
 
+    :param request: The incoming request, optionally carrying an `Idempotency-Key` header whose
+                    retries are answered with the response of the first attempt.
     :param customer: Input data for creating a new customer. Must adhere to the `CustomerCreate`
                      schema.
     :param db: Active asynchronous database session dependency.
 
     :raises HTTPException:
         - If a uniqueness constraint fails, it returns a 409 Conflict status.
+        - If the idempotency key was used for a different request, it returns a 422 Unprocessable
+          Entity status.
         - If there are other database errors, it returns a 500 Internal Server Error.
 
     :return: Dictionary containing the action type and the created customer data, validated and
              serialized using the `BusinessView` schema.
     """
-    salt = bcrypt.gensalt()
-    hashed_password = bcrypt.hashpw(customer.password.strip().encode("utf-8"), salt)
+    idempotent = await idempotency_store.claim(request, db, "customer", customer)
+    if idempotent.replay:
+        return idempotent.replay
+    hashed_password = await hash_password(customer.password.strip())
     db_customer = Customer(
         email=customer.email.strip(),
-        password=hashed_password.decode("utf-8"),
+        password=hashed_password,
         name=customer.name.strip(),
         addr_line_1=customer.addr_line_1.strip(),
         addr_line_2=customer.addr_line_2.strip(),
@@ -63,7 +74,9 @@ async def create_customer(customer: CustomerCreate, db: AsyncSession = Depends(g
         failure(f"Customer account creation failed with unexpected error for email: {customer.email}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected database error occurred.") from expt
     success(f"Customer account created successfully with email: {customer.email}")
-    return {"action": "post", "customer": CustomerView.model_validate(db_customer).model_dump()}
+    result = {"action": "post", "customer": CustomerView.model_validate(db_customer).model_dump()}
+    idempotent.store(status.HTTP_201_CREATED, result)
+    return result
 
 
 @router.get("/me", status_code=status.HTTP_200_OK, tags=["customer"])
@@ -79,34 +92,71 @@ async def get_customer_me(customer_auth=Depends(verify_cust_cred)) -> dict[str,
     return {"action": "get", "email": customer_auth.email}
 
 
+@router.post("/token", status_code=status.HTTP_201_CREATED, response_model=TokenResult, tags=["customer"])
+async def create_customer_token(request: Request, customer_auth=Depends(verify_cust_cred)) -> TokenResult:
+    """
+    Endpoint for an authenticated customer to exchange its credentials for a signed token.
+
+    The subsequent requests presenting the token in the `Authorization` header with the "Token"
+    scheme skip the verification of the password. The token expires after the configured time
+    and is revoked when the email address or the password of the customer changes.
+
+    :param request: The incoming request carrying the credentials.
+    :param customer_auth: Authenticated customer object.
+
+    :return: Dictionary containing the action type, the signed token, its scheme and its lifetime.
+
+    :raises HTTPException:
+        - If the customer authenticated with a token, it raises 403 Forbidden.
+    """
+    if pick_backend(request) is auth_backends["token"]:
+        warning(f"Token refresh refused for customer: {customer_auth.email}")
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Authenticate with the credentials to obtain a token")
+    general(f"Issuing token for customer: {customer_auth.email}")
+    token = issue_token("customer", customer_auth)
+    success(f"Token issued successfully for customer: {customer_auth.email}")
+    return {"action": "post", "token": token, "token_type": "Token", "expires_in": config.tokenttl}
+
+
 @router.get("/search", status_code=status.HTTP_200_OK, response_model=CustomerManyResult, tags=["customer"])
 async def get_customers(
-    skip: int = Query(0, ge=0, description="Number of records to skip (must be between 0 and int64)"),
+    cursor: str | None = Query(None, description="Cursor returned as `next_cursor` by the previous page"),
+    skip: int = Query(0, ge=0, description="Number of records to skip past the cursor (legacy, capped by the configuration)"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return (must be between 1 and 100)"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> CustomerManyResult:
     """
     Endpoint fetches a paginated list of customers from the database.
 
-    :param skip: Number of records to skip. Must be between 0 and int64.
+    :param cursor: Cursor returned as `next_cursor` by the previous page, to fetch the page following
+                   it.
+    :param skip: Number of records to skip past the cursor. Must be between 0 and the configured
+                 cap.
     :param limit: Maximum number of records to return. Must be between 1 and 100.
-    :param db: Active asynchronous database session dependency.
+    :param db: Active asynchronous database session dependency on a read replica.
 
     :return: Dictionary containing the action type and a list of customers, validated and
              serialized using the `CustomerView` schema.
+             The cursor of the next page is included, None on the last page.
 
     :raises HTTPException:
         - If no customer exist in the database, it raises 404 Not Found.
+        - If the cursor is malformed or more records than the configured cap are skipped, it raises
+          422 Unprocessable Entity.
     """
-    general(f"Searching customers with skip={skip}, limit={limit}")
-    query = select(Customer).options(selectinload("*")).offset(skip).limit(limit)
+    general(f"Searching customers with cursor={cursor}, skip={skip}, limit={limit}")
+    query = paginate(select(Customer), Customer.id, cursor, skip, limit)
     result = await db.execute(query)
-    customers = result.scalars().all()
+    customers, next_cursor = next_page(result.scalars().all(), limit)
     if not customers:
         warning("No customers found in database")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No customer present in database")
     success(f"Found {len(customers)} customers")
-    return {"action": "get", "customers": [CustomerView.model_validate(customer).model_dump() for customer in customers]}
+    return {
+        "action": "get",
+        "customers": [CustomerView.model_validate(customer).model_dump() for customer in customers],
+        "next_cursor": next_cursor,
+    }
 
 
 @router.delete("/delete/me", status_code=status.HTTP_202_ACCEPTED, response_model=CustomerResult, tags=["customer"])
@@ -125,11 +175,11 @@ async def delete_customer(db: AsyncSession = Depends(get_db), customer_auth=Depe
         - If there are other database errors, it returns a 500 Internal Server Error.
     """
     general(f"Deleting customer account: {customer_auth.email}")
-    query = select(Customer).where(Customer.uuid == customer_auth.uuid).options(selectinload("*"))
+    # Delete the record and fetch the deleted row in a single round trip
+    query = delete(Customer).where(Customer.uuid == customer_auth.uuid).returning(Customer)
     result = await db.execute(query)
-    customer_to_delete = result.scalar_one_or_none()
-    query = delete(Customer).where(Customer.uuid == customer_auth.uuid)
-    await db.execute(query)
+    customer_to_delete = result.scalar_one()
+    principal_cache.invalidate_on_commit(db, "customer", customer_auth.email, customer_auth.uuid)
     try:
         await db.flush()
     except Exception as expt:  # pragma: no cover
@@ -161,24 +211,21 @@ async def update_customer(customer: CustomerUpdate, db: AsyncSession = Depends(g
     """
     customer_email = customer_auth.email  # Capture email before potential database errors
     general(f"Updating details of customer: {customer_email}")
-    query = select(Customer).where(Customer.uuid == customer_auth.uuid).options(selectinload("*"))
-    result = await db.execute(query)
-    customer_to_update = result.scalar_one_or_none()
-    is_updated = False
+    customer_to_update = customer_auth
     cus_cols = ["email", "name", "addr_line_1", "addr_line_2", "city", "state"]
-    for item in cus_cols:
-        if getattr(customer, item) != "":
-            setattr(customer_to_update, item, getattr(customer, item).strip())
-            is_updated = True
+    changes = {item: getattr(customer, item).strip() for item in cus_cols if getattr(customer, item) != ""}
     if customer.password != "":
-        salt = bcrypt.gensalt()
-        hashed_password = bcrypt.hashpw(customer.password.encode("utf-8"), salt)
-        customer_to_update.password = hashed_password.decode("utf-8")
-        is_updated = True
-    if is_updated:
-        customer_to_update.update_date = datetime.now(timezone.utc)
+        changes["password"] = await hash_password(customer.password)
+    if customer.password != "" or customer.email != "":
+        changes["version"] = Customer.version + 1  # Revoke the tokens issued before
+    if changes:
+        # Write only the fields provided and fetch the updated row in a single round trip
+        changes["update_date"] = datetime.now(timezone.utc)
+        query = update(Customer).where(Customer.uuid == customer_auth.uuid).values(**changes).returning(Customer)
+        principal_cache.invalidate_on_commit(db, "customer", customer_email, customer_auth.uuid)
         try:
-            await db.flush()
+            result = await db.execute(query)
+            customer_to_update = result.scalar_one()
         except IntegrityError as expt:
             failure(f"Customer update failed - Uniqueness constraint violation for: {customer_email}")
             raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Uniqueness constraint failed - Please try again") from expt
@@ -0,0 +1,108 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from fastapi_ecom.config import config
+from fastapi_ecom.database import get_pool_report
+from fastapi_ecom.database.pydantic_schemas.internal import (
+    HashingResult,
+    HashingView,
+    OrderBatchResult,
+    OrderBatchView,
+    PoolResult,
+    PoolView,
+    PrincipalCacheResult,
+    PrincipalCacheView,
+    UserinfoCacheResult,
+    UserinfoCacheView,
+)
+from fastapi_ecom.utils.hashing import password_hasher
+from fastapi_ecom.utils.logging_setup import general, warning
+from fastapi_ecom.utils.order_batcher import order_batcher
+from fastapi_ecom.utils.principal_cache import principal_cache
+from fastapi_ecom.utils.userinfo_cache import userinfo_cache
+
+
+def check_reports_enabled() -> None:
+    """
+    Hide the endpoints reporting the operational state of the service unless the configuration
+    enables them, as they require no authentication.
+
+    :return: None
+
+    :raises HTTPException: If the reports are not enabled, it raises 404 Not Found.
+    """
+    if not config.intlrprt:
+        warning("Refused to report the operational state of the service as the reports are not enabled")
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+
+router = APIRouter(prefix="/internal", dependencies=[Depends(check_reports_enabled)])
+
+
+@router.get("/pool", status_code=status.HTTP_200_OK, response_model=PoolResult, tags=["internal"])
+async def get_pool_stats() -> PoolResult:
+    """
+    Endpoint fetches the live usage of the database connection pool.
+
+    :return: Dictionary containing the action type and the pool report, validated and serialized
+             using the `PoolView` schema.
+
+    :raises HTTPException:
+        - If the database connection pool has not been set up yet, it raises 404 Not Found.
+    """
+    general("Reporting database connection pool usage")
+    report = get_pool_report()
+    if report is None:
+        warning("Database connection pool is not set up")
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Database connection pool is not set up")
+    return {"action": "get", "pool": PoolView.model_validate(report).model_dump()}
+
+
+@router.get("/hashing", status_code=status.HTTP_200_OK, response_model=HashingResult, tags=["internal"])
+async def get_hashing_stats() -> HashingResult:
+    """
+    Endpoint fetches the live usage of the password hashing workers.
+
+    :return: Dictionary containing the action type and the hashing report, validated and serialized
+             using the `HashingView` schema.
+    """
+    general("Reporting password hashing usage")
+    return {"action": "get", "hashing": HashingView.model_validate(password_hasher.report()).model_dump()}
+
+
+@router.get("/principals", status_code=status.HTTP_200_OK, response_model=PrincipalCacheResult, tags=["internal"])
+async def get_principal_cache_stats() -> PrincipalCacheResult:
+    """
+    Endpoint fetches the usage of the cache of principals authenticated via HTTP Basic
+    Authentication.
+
+    :return: Dictionary containing the action type and the cache report, validated and serialized
+             using the `PrincipalCacheView` schema.
+    """
+    general("Reporting authenticated principal cache usage")
+    return {"action": "get", "principals": PrincipalCacheView.model_validate(principal_cache.report()).model_dump()}
+
+
+@router.get("/userinfo", status_code=status.HTTP_200_OK, response_model=UserinfoCacheResult, tags=["internal"])
+async def get_userinfo_cache_stats() -> UserinfoCacheResult:
+    """
+    Endpoint fetches the usage of the cache of the users which the OAuth provider resolved the
+    bearer tokens to.
+
+    :return: Dictionary containing the action type and the cache report, validated and serialized
+             using the `UserinfoCacheView` schema.
+    """
+    general("Reporting OAuth userinfo cache usage")
+    return {"action": "get", "userinfo": UserinfoCacheView.model_validate(userinfo_cache.report()).model_dump()}
+
+
+@router.get("/orders", status_code=status.HTTP_200_OK, response_model=OrderBatchResult, tags=["internal"])
+async def get_order_batch_stats() -> OrderBatchResult:
+    """
+    Endpoint fetches the usage of the group-commit writer coalescing the orders placed
+    concurrently into a single transaction.
+
+    :return: Dictionary containing the action type and the batching report, validated and
+             serialized using the `OrderBatchView` schema.
+    """
+    general("Reporting order batching usage")
+    return {"action": "get", "orders": OrderBatchView.model_validate(order_batcher.report()).model_dump()}
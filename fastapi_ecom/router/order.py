@@ -1,12 +1,15 @@
+from datetime import date
+from typing import Literal
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import and_, delete
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy import and_, delete, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
-from fastapi_ecom.database.db_setup import get_db
+from fastapi_ecom.database.db_setup import get_db, get_read_db
 from fastapi_ecom.database.models.order import Order
 from fastapi_ecom.database.models.order_details import OrderDetail
 from fastapi_ecom.database.models.product import Product
@@ -23,17 +26,27 @@ from fastapi_ecom.database.pydantic_schemas.order_details import (
     OrderDetailsView,
     OrderDetailsViewInternal,
 )
+from fastapi_ecom.database.routing import client_key, sticky_writes
+from fastapi_ecom.router.internal import check_reports_enabled
 from fastapi_ecom.utils.auth import verify_cust_cred
+from fastapi_ecom.utils.export import EXPORT_MEDIA_TYPES, accepts_gzip, stream_orders
+from fastapi_ecom.utils.idempotency import idempotency_store
 from fastapi_ecom.utils.logging_setup import failure, general, warning
+from fastapi_ecom.utils.order_batcher import order_batcher
+from fastapi_ecom.utils.pagination import next_page, paginate
 
 router = APIRouter(prefix="/order")
 
 
 @router.post("/create", status_code=status.HTTP_201_CREATED, response_model=OrderResultInternal, tags=["order"])
-async def create_order(order: OrderCreate, db: AsyncSession = Depends(get_db), customer_auth=Depends(verify_cust_cred)) -> OrderResultInternal:
+async def create_order(
+    request: Request, order: OrderCreate, db: AsyncSession = Depends(get_db), customer_auth=Depends(verify_cust_cred)
+) -> OrderResultInternal:
     """
     Endpoint to place an order by the authenticated customer.
 
+    :param request: The incoming request, optionally carrying an `Idempotency-Key` header whose
+                    retries are answered with the response of the first attempt.
     :param order: Input data for placing a new order. Must adhere to the `OrderCreate` schema.
     :param db: Active asynchronous database session dependency.
     :param customer_auth: Authenticated customer object.
@@ -42,67 +55,70 @@ async def create_order(order: OrderCreate, db: AsyncSession = Depends(get_db), c
              serialized using the `OrderViewInternal` schema.
 
     :raises HTTPException:
-        If database integrity constraints fails, it returns a 500 Internal Server Error.
+        - If any of the products ordered does not exist, it raises 404 Not Found listing all of
+          them.
+        - If the idempotency key was used for a different request, it returns a 422 Unprocessable
+          Entity status.
+        - If database integrity constraints fails, it returns a 500 Internal Server Error.
     """
-    new_order = Order(
-        user_id=customer_auth.uuid,
-        order_date=order.order_date,
-        total_price=0.0,  # Initial total, calculated below
-        uuid=uuid4().hex[0:8],  # Assign UUID manually; One UUID per transaction
-    )
-    db.add(new_order)
-    try:
-        await db.flush()  # Generate order ID for relations
-    except Exception as expt:  # pragma: no cover
-        """
-        This part of the code cannot be tested as this endpoint performs multiple database
-        interactions due to which mocking one part wont produce the desired result. Thus,
-        we will keep it uncovered until a alternative can be made for testing this exception block.
-        """
-        failure(f"Order creation failed with unexpected error for customer: {customer_auth.email}")
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected database error occurred.") from expt
+    idempotent = await idempotency_store.claim(request, db, f"order:{customer_auth.uuid}", order)
+    if idempotent.replay:
+        return idempotent.replay
 
-    # Create OrderDetail entries and calculate the total price
-    total_price = 0
-    order_items = []
-    for item in order.order_items:
-        query = select(Product).where(Product.uuid == item.product_id)
-        result = await db.execute(query)
-        product = result.scalar_one_or_none()
-        if not product:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Product with ID: {item.product_id} does not exist.")
-        total_price += product.price * item.quantity
-        order_detail = OrderDetail(
-            order_id=new_order.uuid,
-            product_id=item.product_id,
-            quantity=item.quantity,
-            price=product.price,
-            uuid=uuid4().hex[0:8],  # Assign UUID manually; One UUID per transaction
-        )
-        db.add(order_detail)
-        order_items.append(order_detail)
+    # Fetch the prices of all the products referenced by the order in a single query
+    product_ids = list(dict.fromkeys(item.product_id for item in order.order_items))
+    query = select(Product.uuid, Product.price).where(Product.uuid.in_(product_ids))
+    result = await db.execute(query)
+    prices = dict(result.all())
+    missing = [product_id for product_id in product_ids if product_id not in prices]
+    if missing:
+        warning(f"Order creation failed for customer: {customer_auth.email} - Missing products {missing}")
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"Product with ID: {', '.join(missing)} does not exist.")
+
+    # Create the row of the order with its total price along with the rows of its details
+    new_order = {
+        "user_id": customer_auth.uuid,
+        "order_date": order.order_date,
+        "total_price": sum(prices[item.product_id] * item.quantity for item in order.order_items),
+        "uuid": uuid4().hex[0:8],  # Assign UUID manually; One UUID per transaction
+    }
+    order_items = [
+        {
+            "order_id": new_order["uuid"],
+            "product_id": item.product_id,
+            "quantity": item.quantity,
+            "price": prices[item.product_id],
+            "uuid": uuid4().hex[0:8],  # Assign UUID manually; One UUID per transaction
+        }
+        for item in order.order_items
+    ]
 
-    # Update total price of the order
-    new_order.total_price = total_price
+    # Insert the order and then all of its details with a single multi-row insert, in one transaction
+    # along with the orders placed concurrently if group-commit is enabled. The orders claiming an
+    # idempotency key are inserted directly, so that the key commits atomically with the order.
     try:
-        await db.flush()
-    except Exception as expt:  # pragma: no cover
-        """
-        This part of the code cannot be tested as this endpoint performs multiple database
-        interactions due to which mocking one part wont produce the desired result. Thus,
-        we will keep it uncovered until a alternative can be made for testing this exception block.
-        """
+        if order_batcher.enabled and not idempotent.active:
+            await db.commit()  # Hand the connection back to the pool while waiting on the batch
+            await order_batcher.submit(new_order, order_items)
+            # Written by the session of the batch, so that `get_db()` cannot tell that the client wrote
+            sticky_writes.mark(client_key(request))
+        else:
+            await db.execute(insert(Order), [new_order])
+            await db.execute(insert(OrderDetail), order_items)
+    except Exception as expt:
         failure(f"Order creation failed with unexpected error for customer: {customer_auth.email}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected database error occurred.") from expt
-    new_order.order_items = order_items
-    return {"action": "post", "order": OrderViewInternal.model_validate(new_order).model_dump()}
+    result = {"action": "post", "order": OrderViewInternal.model_validate({**new_order, "order_items": order_items}).model_dump()}
+    idempotent.store(status.HTTP_201_CREATED, result)
+    return result
 
 
 @router.get("/search", status_code=status.HTTP_200_OK, response_model=OrderManyResult, tags=["order"])
 async def get_orders(
-    skip: int = Query(0, ge=0, description="Number of records to skip (must be between 0 and int64)"),
+    cursor: str | None = Query(None, description="Cursor returned as `next_cursor` by the previous page"),
+    skip: int = Query(0, ge=0, description="Number of records to skip past the cursor (legacy, capped by the configuration)"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return (must be between 1 and 100)"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     customer_auth=Depends(verify_cust_cred),
 ) -> OrderManyResult:
     """
@@ -118,20 +134,26 @@ async def get_orders(
     lists of model objects. When using SQLAlchemy relationships, Pydantic might misinterpret the
     fields or miss data if any nested models aren't explicitly prepared.
 
-    :param skip: Number of records to skip. Must be between 0 and int64.
+    :param cursor: Cursor returned as `next_cursor` by the previous page, to fetch the page following
+                   it.
+    :param skip: Number of records to skip past the cursor. Must be between 0 and the configured
+                 cap.
     :param limit: Maximum number of records to return. Must be between 1 and 100.
-    :param db: Active asynchronous database session dependency.
+    :param db: Active asynchronous database session dependency on a read replica.
     :param customer_auth: Authenticated customer object.
 
     :return: Dictionary containing the action type and the list of orders with their details.
+             The cursor of the next page is included, None on the last page.
 
     :raises HTTPException:
-        If no products are associated with the authenticated customer, it raises 404 Not Found.
+        - If no products are associated with the authenticated customer, it raises 404 Not Found.
+        - If the cursor is malformed or more records than the configured cap are skipped, it raises
+          422 Unprocessable Entity.
     """
-    general(f"Searching orders for customer {customer_auth.email} with skip={skip}, limit={limit}")
-    query = select(Order).where(Order.user_id == customer_auth.uuid).options(selectinload(Order.order_details)).offset(skip).limit(limit)
-    result = await db.execute(query)
-    orders = result.scalars().unique().all()
+    general(f"Searching orders for customer {customer_auth.email} with cursor={cursor}, skip={skip}, limit={limit}")
+    query = select(Order).where(Order.user_id == customer_auth.uuid).options(selectinload(Order.order_details))
+    result = await db.execute(paginate(query, Order.id, cursor, skip, limit))
+    orders, next_cursor = next_page(result.scalars().unique().all(), limit)
     if not orders:
         warning(f"No order found in database for customer {customer_auth.email}")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No orders in database")
@@ -140,14 +162,15 @@ async def get_orders(
         order_items = [OrderDetailsView(product_id=detail.product_id, quantity=detail.quantity, price=detail.price) for detail in order.order_details]
         order_view_data = OrderView(uuid=order.uuid, order_date=order.order_date, total_price=order.total_price, order_items=order_items)
         order_views.append(order_view_data.model_dump())
-    return {"action": "get", "orders": order_views}
+    return {"action": "get", "orders": order_views, "next_cursor": next_cursor}
 
 
 @router.get("/search/internal", status_code=status.HTTP_200_OK, response_model=OrderManyResultInternal, tags=["order"])
 async def get_orders_internal(
-    skip: int = Query(0, ge=0, description="Number of records to skip (must be between 0 and int64)"),
+    cursor: str | None = Query(None, description="Cursor returned as `next_cursor` by the previous page"),
+    skip: int = Query(0, ge=0, description="Number of records to skip past the cursor (legacy, capped by the configuration)"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return (must be between 1 and 100)"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> OrderManyResultInternal:
     """
     Endpoint fetches a paginated list of orders and its details.
@@ -161,18 +184,24 @@ async def get_orders_internal(
     lists of model objects. When using SQLAlchemy relationships, Pydantic might misinterpret the
     fields or miss data if any nested models aren't explicitly prepared.
 
-    :param skip: Number of records to skip. Must be between 0 and int64.
+    :param cursor: Cursor returned as `next_cursor` by the previous page, to fetch the page following
+                   it.
+    :param skip: Number of records to skip past the cursor. Must be between 0 and the configured
+                 cap.
     :param limit: Maximum number of records to return. Must be between 1 and 100.
-    :param db: Active asynchronous database session dependency.
+    :param db: Active asynchronous database session dependency on a read replica.
 
     :return: Dictionary containing the action type and the list of orders with their details.
+             The cursor of the next page is included, None on the last page.
 
     :raises HTTPException:
-        If no products are associated with the authenticated customer, it raises 404 Not Found.
+        - If no products are associated with the authenticated customer, it raises 404 Not Found.
+        - If the cursor is malformed or more records than the configured cap are skipped, it raises
+          422 Unprocessable Entity.
     """
-    query = select(Order).options(selectinload(Order.order_details)).offset(skip).limit(limit)
+    query = paginate(select(Order).options(selectinload(Order.order_details)), Order.id, cursor, skip, limit)
     result = await db.execute(query)
-    orders = result.scalars().unique().all()
+    orders, next_cursor = next_page(result.scalars().unique().all(), limit)
     if not orders:
         warning("No order found in database")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No orders in database")
@@ -186,17 +215,64 @@ async def get_orders_internal(
             uuid=order.uuid, user_id=order.user_id, order_date=order.order_date, total_price=order.total_price, order_items=order_items
         )
         order_views.append(order_view_data.model_dump())
-    return {"action": "get", "orders": order_views}
+    return {"action": "get", "orders": order_views, "next_cursor": next_cursor}
+
+
+@router.get(
+    "/export/internal",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={status.HTTP_200_OK: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}}},
+    dependencies=[Depends(check_reports_enabled)],
+    tags=["order"],
+)
+async def export_orders_internal(
+    request: Request,
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Format of the export, one order per line or one order detail per row"),
+    start: date | None = Query(None, description="Earliest order date to export, inclusive"),
+    end: date | None = Query(None, description="Latest order date to export, inclusive"),
+    db: AsyncSession = Depends(get_read_db),
+) -> StreamingResponse:
+    """
+    Endpoint streams all the orders and their details, without the pagination of `/search/internal`.
+
+    The orders are read from a server-side cursor and sent as they are read, so that the export
+    runs in constant memory however many orders there are. The export is compressed with gzip if
+    the client accepts it.
+
+    :param request: The incoming request, optionally carrying an `Accept-Encoding` header.
+    :param format: Format of the export. NDJSON yields one order along with its details per line,
+                   CSV yields one row per order detail.
+    :param start: Earliest order date to export, inclusive, if any.
+    :param end: Latest order date to export, inclusive, if any.
+    :param db: Active asynchronous database session dependency on a read replica.
+
+    :return: The streamed export of the orders.
+
+    :raises HTTPException:
+        - If the internal reports are not enabled, as the export requires no authentication, it
+          raises 404 Not Found.
+        - If the start of the date range is after its end, it raises 422 Unprocessable Entity.
+    """
+    if start is not None and end is not None and start > end:
+        warning(f"Order export rejected for date range {start} - {end}")
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="The start of the date range is after its end")
+    general(f"Exporting orders as {format} from {start} to {end}")
+    compress = accepts_gzip(request)
+    headers = {"Content-Disposition": f'attachment; filename="orders.{format}"', "Vary": "Accept-Encoding"}
+    if compress:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(stream_orders(db, start, end, format, compress), media_type=EXPORT_MEDIA_TYPES[format], headers=headers)
 
 
 @router.get("/search/uuid/{order_id}", status_code=status.HTTP_200_OK, response_model=OrderResult, tags=["order"])
-async def get_order_by_uuid(order_id: str, db: AsyncSession = Depends(get_db), customer_auth=Depends(verify_cust_cred)):
+async def get_order_by_uuid(order_id: str, db: AsyncSession = Depends(get_read_db), customer_auth=Depends(verify_cust_cred)):
     """
     Endpoint fetches a specific order and its details by its UUID associated with the authenticated
     customer.
 
     :param order_id: The UUID of the order to retrieve.
-    :param db: Active asynchronous database session dependency.
+    :param db: Active asynchronous database session dependency on a read replica.
     :param customer_auth: Authenticated customer object.
 
     :return: Dictionary containing the action type and order details, validated and
@@ -240,20 +316,26 @@ async def delete_order(order_id: str, db: AsyncSession = Depends(get_db), custom
           raises 404 Not Found.
         - If there are other database errors, it returns a 500 Internal Server Error.
     """
-    query = select(Order).where(and_(Order.user_id == customer_auth.uuid, Order.uuid == order_id)).options(selectinload(Order.order_details))
+    # Delete the details of the order and then the order itself, each returning the deleted rows in
+    # the same round trip. The details are matched through a subquery on the order, so that only the
+    # details of an order owned by the authenticated customer are deleted.
+    owned = select(Order.uuid).where(and_(Order.user_id == customer_auth.uuid, Order.uuid == order_id))
+    query = delete(OrderDetail).where(OrderDetail.order_id.in_(owned)).returning(OrderDetail.product_id, OrderDetail.quantity, OrderDetail.price)
+    result = await db.execute(query)
+    order_items = [OrderDetailsView(product_id=detail.product_id, quantity=detail.quantity, price=detail.price) for detail in result.all()]
+    query = (
+        delete(Order)
+        .where(and_(Order.user_id == customer_auth.uuid, Order.uuid == order_id))
+        .returning(Order.uuid, Order.order_date, Order.total_price)
+    )
     result = await db.execute(query)
-    order_to_delete = result.scalar_one_or_none()
+    order_to_delete = result.one_or_none()
     if not order_to_delete:
         warning(f"Order {order_id} no present in database")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Order not present in database")
-    order_items = [
-        OrderDetailsView(product_id=detail.product_id, quantity=detail.quantity, price=detail.price) for detail in order_to_delete.order_details
-    ]
     order_view = OrderView(
         uuid=order_to_delete.uuid, order_date=order_to_delete.order_date, total_price=order_to_delete.total_price, order_items=order_items
     )
-    query = delete(Order).where(and_(Order.user_id == customer_auth.uuid, Order.uuid == order_id))
-    await db.execute(query)
     try:
         await db.flush()
     except Exception as expt:  # pragma: no cover
@@ -1,17 +1,22 @@
 from datetime import datetime, timezone
+from typing import Literal
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import and_, delete, or_
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import and_, delete, or_, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
-from fastapi_ecom.database.db_setup import get_db
+from fastapi_ecom.database.db_setup import get_db, get_read_db
 from fastapi_ecom.database.models.product import Product
 from fastapi_ecom.database.pydantic_schemas.product import (
+    ProductBulkDelete,
+    ProductBulkResult,
+    ProductBulkUpdate,
     ProductCreate,
+    ProductFacetResult,
+    ProductImportResult,
     ProductManyResult,
     ProductManyResultInternal,
     ProductResultInternal,
@@ -20,18 +25,35 @@ from fastapi_ecom.database.pydantic_schemas.product import (
     ProductViewInternal,
 )
 from fastapi_ecom.utils.auth import verify_business_cred
+from fastapi_ecom.utils.etag import if_match_versions, make_etag
+from fastapi_ecom.utils.facets import product_facets, product_filters
+from fastapi_ecom.utils.fulltext import fulltext_search
+from fastapi_ecom.utils.idempotency import idempotency_store
 from fastapi_ecom.utils.logging_setup import failure, general, success, warning
+from fastapi_ecom.utils.pagination import next_page, paginate
+from fastapi_ecom.utils.product_bulk import (
+    bulk_delete_matching,
+    bulk_delete_products,
+    bulk_update_matching,
+    bulk_update_products,
+    product_changes,
+)
+from fastapi_ecom.utils.product_import import IMPORT_MEDIA_TYPES, import_products
+from fastapi_ecom.utils.response_cache import response_cache
+from fastapi_ecom.utils.search_index import product_index
 
 router = APIRouter(prefix="/product")
 
 
 @router.post("/create", status_code=status.HTTP_201_CREATED, response_model=ProductResultInternal, tags=["product"])
 async def add_product(
-    product: ProductCreate, db: AsyncSession = Depends(get_db), business_auth=Depends(verify_business_cred)
+    request: Request, product: ProductCreate, db: AsyncSession = Depends(get_db), business_auth=Depends(verify_business_cred)
 ) -> ProductResultInternal:
     """
     Endpoint to add a new product by currently authenticated business.
 
+    :param request: The incoming request, optionally carrying an `Idempotency-Key` header whose
+                    retries are answered with the response of the first attempt.
     :param product: Input data for adding a new product. Must adhere to the `ProductCreate` schema.
     :param db: Active asynchronous database session dependency.
     :param business_auth: Authenticated business object.
@@ -41,8 +63,13 @@ async def add_product(
 
     :raises HTTPException:
         - If a uniqueness constraint fails, it returns a 409 Conflict status.
+        - If the idempotency key was used for a different request, it returns a 422 Unprocessable
+          Entity status.
         - If there are other database errors, it returns a 500 Internal Server Error.
     """
+    idempotent = await idempotency_store.claim(request, db, f"product:{business_auth.uuid}", product)
+    if idempotent.replay:
+        return idempotent.replay
     db_product = Product(
         name=product.name.strip(),
         description=product.description.strip(),
@@ -65,120 +92,265 @@ async def add_product(
         """
         failure(f"Product creation failed for '{product.name}' with unexpected error")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected database error occurred.") from expt
+    product_index.track(db, db_product)
+    response_cache.bump_on_commit(db)
     success(f"Product '{product.name}' created successfully by business: {business_auth.uuid}")
-    return {"action": "post", "product": ProductViewInternal.model_validate(db_product).model_dump()}
+    result = {"action": "post", "product": ProductViewInternal.model_validate(db_product).model_dump()}
+    idempotent.store(status.HTTP_201_CREATED, result)
+    return result
+
+
+@router.post(
+    "/import",
+    status_code=status.HTTP_201_CREATED,
+    response_model=ProductImportResult,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {media_type: {"schema": {"type": "string", "format": "binary"}} for media_type in IMPORT_MEDIA_TYPES.values()},
+        }
+    },
+    tags=["product"],
+)
+async def import_product(
+    request: Request,
+    format: Literal["ndjson", "csv"] = Query("ndjson", description="Format of the upload, one product per line or per row after a header"),
+    db: AsyncSession = Depends(get_db),
+    business_auth=Depends(verify_business_cred),
+) -> ProductImportResult:
+    """
+    Endpoint imports many products at once for the currently authenticated business from an upload
+    of rows adhering to the `ProductCreate` schema.
+
+    The upload is parsed as it is received and the products are loaded a chunk at a time, so that
+    the import runs in constant memory however large the upload is. The rows which fail to parse
+    or to validate are reported instead of failing the import, and the other products are added in
+    a single transaction.
+
+    :param request: The incoming request, whose body is the upload.
+    :param format: Format of the upload. NDJSON holds one product per line, CSV holds one product
+                   per row after a header naming the fields.
+    :param db: Active asynchronous database session dependency.
+    :param business_auth: Authenticated business object.
+
+    :return: Dictionary containing the action type, the numbers of products imported and of rows
+             rejected along with the rejected rows, validated and serialized using the
+             `ProductImportResult` schema.
+
+    :raises HTTPException:
+        - If the upload is not valid UTF-8, it returns a 422 Unprocessable Entity status.
+        - If the CSV header lacks a field of the products, it returns a 422 Unprocessable Entity
+          status.
+    """
+    general(f"Importing products as {format} by {business_auth.email}")
+    report = await import_products(db, request.stream(), format, business_auth.uuid)
+    if report["imported"]:
+        product_index.rebuild_on_commit(db)
+        response_cache.bump_on_commit(db)
+    success(f"Imported {report['imported']} products, rejecting {report['failed']} rows, by business: {business_auth.uuid}")
+    return {"action": "post", **report}
 
 
 @router.get("/search", status_code=status.HTTP_200_OK, response_model=ProductManyResult, tags=["product"])
 async def get_products(
-    skip: int = Query(0, ge=0, description="Number of records to skip (must be between 0 and int64)"),
+    request: Request,
+    cursor: str | None = Query(None, description="Cursor returned as `next_cursor` by the previous page"),
+    skip: int = Query(0, ge=0, description="Number of records to skip past the cursor (legacy, capped by the configuration)"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return (must be between 1 and 100)"),
-    db: AsyncSession = Depends(get_db),
+    filters: list = Depends(product_filters),
+    db: AsyncSession = Depends(get_read_db),
 ) -> ProductManyResult:
     """
-    Endpoint fetches a paginated list of products.
-
-    :param skip: Number of records to skip. Must be between 0 and int64.
+    Endpoint fetches a paginated list of products, optionally filtered on their category, price,
+    manufacturing date and expiry date.
+
+    :param request: The incoming request, optionally carrying an `If-None-Match` header.
+    :param cursor: Cursor returned as `next_cursor` by the previous page, to fetch the page following
+                   it.
+    :param skip: Number of records to skip past the cursor. Must be between 0 and the configured
+                 cap.
     :param limit: Maximum number of records to return. Must be between 1 and 100.
-    :param db: Active asynchronous database session dependency.
+    :param filters: Conditions selecting the products, built from the filters of the request.
+    :param db: Active asynchronous database session dependency on a read replica.
 
     :return: Dictionary containing the action type and a list of products, validated and
              serialized using the `ProductView` schema.
+             The cursor of the next page is included, None on the last page.
 
     :raises HTTPException:
         - If no products for the currently authenticated business exists in the database, it raises
           404 Not Found.
+        - If the cursor is malformed, more records than the configured cap are skipped or the start
+          of a filtered range is after its end, it raises 422 Unprocessable Entity.
     """
-    general(f"Searching all products with skip={skip}, limit={limit}")
-    query = select(Product).options(selectinload("*")).offset(skip).limit(limit)
+    general(f"Searching all products with {len(filters)} filters, cursor={cursor}, skip={skip}, limit={limit}")
+    cached = await response_cache.lookup(request)
+    if cached:
+        return cached
+    query = paginate(select(Product).where(*filters), Product.id, cursor, skip, limit)
     result = await db.execute(query)
-    products = result.scalars().all()
+    products, next_cursor = next_page(result.scalars().all(), limit)
     if not products:
         warning("No products found in database")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No product present in database")
     success(f"Found {len(products)} products")
-    return {"action": "get", "products": [ProductView.model_validate(product).model_dump() for product in products]}
+    result = {"action": "get", "products": [ProductView.model_validate(product).model_dump() for product in products], "next_cursor": next_cursor}
+    return await response_cache.store(request, ProductManyResult, result)
+
+
+@router.get("/facets", status_code=status.HTTP_200_OK, response_model=ProductFacetResult, tags=["product"])
+async def get_product_facets(
+    request: Request, filters: list = Depends(product_filters), db: AsyncSession = Depends(get_read_db)
+) -> ProductFacetResult:
+    """
+    Endpoint counts the products per category and per price bucket, optionally filtered as the
+    `search` endpoint filters them, in a single grouped query.
+
+    :param request: The incoming request, optionally carrying an `If-None-Match` header.
+    :param filters: Conditions selecting the products, built from the filters of the request.
+    :param db: Active asynchronous database session dependency on a read replica.
+
+    :return: Dictionary containing the action type, the number of matching products and their
+             counts per category and per price bucket, validated and serialized using the
+             `ProductFacetResult` schema.
+
+    :raises HTTPException: If the start of a filtered range is after its end, it raises 422
+                           Unprocessable Entity.
+    """
+    general(f"Counting the facets of the products with {len(filters)} filters")
+    cached = await response_cache.lookup(request)
+    if cached:
+        return cached
+    facets = await product_facets(db, filters)
+    success(f"Counted the facets of {facets['total']} products")
+    return await response_cache.store(request, ProductFacetResult, {"action": "get", **facets})
 
 
 @router.get("/search/name/{text}", status_code=status.HTTP_200_OK, response_model=ProductManyResult, tags=["product"])
 async def get_product_by_text(
+    request: Request,
     text: str,
-    skip: int = Query(0, ge=0, description="Number of records to skip (must be between 0 and int64)"),
+    mode: Literal["substring", "fulltext", "index"] = Query(
+        "substring", description="Match the text as a substring, or in full-text ranked by relevance from the database or the in-memory index"
+    ),
+    cursor: str | None = Query(None, description="Cursor returned as `next_cursor` by the previous page"),
+    skip: int = Query(0, ge=0, description="Number of records to skip past the cursor (legacy, capped by the configuration)"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return (must be between 1 and 100)"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ) -> ProductManyResult:
     """
     Endpoint fetches a paginated list of products by name or description.
 
+    In the substring mode, the products containing the text in their name or description are
+    listed in the order they were created; on PostgreSQL, the trigram indexes of both columns serve
+    the search. In the full-text mode, the products matching the words of the text are listed by
+    relevance through the full-text index of the database, i.e. a `tsvector` column on PostgreSQL
+    and an FTS5 table on SQLite. In the index mode, the products matching the words of the text in
+    their name, description or category are listed by relevance from the in-memory search index
+    without querying the database, or in the full-text mode if the index is not built.
+
+    :param request: The incoming request, optionally carrying an `If-None-Match` header.
     :param text: The search string used to match product names or descriptions.
-    :param skip: Number of records to skip. Must be between 0 and int64.
+    :param mode: Whether to match the text as a substring, in full-text or from the search index.
+    :param cursor: Cursor returned as `next_cursor` by the previous page, to fetch the page following
+                   it.
+    :param skip: Number of records to skip past the cursor. Must be between 0 and the configured
+                 cap.
     :param limit: Maximum number of records to return. Must be between 1 and 100.
-    :param db: Active asynchronous database session dependency.
+    :param db: Active asynchronous database session dependency on a read replica.
 
     :return: Dictionary containing the action type and a list of products, validated and
              serialized using the `ProductView` schema.
+             The cursor of the next page is included, None on the last page.
 
     :raises HTTPException:
-        If no matching products exists in the database, it raises 404 Not Found.
+        - If no matching products exists in the database, it raises 404 Not Found.
+        - If the cursor is malformed or more records than the configured cap are skipped, it raises
+          422 Unprocessable Entity.
     """
-    general(f"Searching products by text '{text}' with skip={skip}, limit={limit}")
-    query = (
-        select(Product)
-        .where(or_(Product.name.ilike(f"%{text}%"), Product.description.ilike(f"%{text}%")))
-        .options(selectinload("*"))
-        .offset(skip)
-        .limit(limit)
-    )
-    result = await db.execute(query)
-    products = result.scalars().all()
+    general(f"Searching products by text '{text}' in {mode} mode with cursor={cursor}, skip={skip}, limit={limit}")
+    cached = await response_cache.lookup(request)
+    if cached:
+        return cached
+    if mode == "index" and product_index.ready:
+        rows, next_cursor = next_page(product_index.search(text, cursor, skip, limit), limit, ranked=True)
+        if not rows:
+            warning(f"No products found matching text '{text}'")
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No such product present in database")
+        success(f"Found {len(rows)} products matching text '{text}' in the search index")
+        result = {"action": "get", "products": [row[0].view for row in rows], "next_cursor": next_cursor}
+        return await response_cache.store(request, ProductManyResult, result)
+    if mode != "substring":
+        query, rank = fulltext_search(select(Product), db.bind.dialect.name, text)
+        result = await db.execute(paginate(query.add_columns(rank), Product.id, cursor, skip, limit, rank=rank))
+        rows, next_cursor = next_page(result.all(), limit, ranked=True)
+        products = [row[0] for row in rows]
+    else:
+        query = select(Product).where(or_(Product.name.ilike(f"%{text}%"), Product.description.ilike(f"%{text}%")))
+        result = await db.execute(paginate(query, Product.id, cursor, skip, limit))
+        products, next_cursor = next_page(result.scalars().all(), limit)
     if not products:
         warning(f"No products found matching text '{text}'")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No such product present in database")
     success(f"Found {len(products)} products matching text '{text}'")
-    return {"action": "get", "products": [ProductView.model_validate(product).model_dump() for product in products]}
+    result = {"action": "get", "products": [ProductView.model_validate(product).model_dump() for product in products], "next_cursor": next_cursor}
+    return await response_cache.store(request, ProductManyResult, result)
 
 
 @router.get("/search/internal", status_code=status.HTTP_200_OK, response_model=ProductManyResultInternal, tags=["product"])
 async def get_products_internal(
-    skip: int = Query(0, ge=0, description="Number of records to skip (must be between 0 and int64)"),
+    cursor: str | None = Query(None, description="Cursor returned as `next_cursor` by the previous page"),
+    skip: int = Query(0, ge=0, description="Number of records to skip past the cursor (legacy, capped by the configuration)"),
     limit: int = Query(100, ge=1, le=100, description="Maximum number of records to return (must be between 1 and 100)"),
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     business_auth=Depends(verify_business_cred),
 ) -> ProductManyResultInternal:
     """
     Endpoint fetches a paginated list of products associated with the authenticated business.
 
-    :param skip: Number of records to skip. Must be between 0 and int64.
+    :param cursor: Cursor returned as `next_cursor` by the previous page, to fetch the page following
+                   it.
+    :param skip: Number of records to skip past the cursor. Must be between 0 and the configured
+                 cap.
     :param limit: Maximum number of records to return. Must be between 1 and 100.
-    :param db: Active asynchronous database session dependency.
+    :param db: Active asynchronous database session dependency on a read replica.
     :param business_auth: Authenticated business object.
 
     :return: Dictionary containing the action type and a list of products, validated and
              serialized using the `ProductViewInternal` schema.
+             The cursor of the next page is included, None on the last page.
 
     :raises HTTPException:
-        If no products are associated with the authenticated business, it raises 404 Not Found.
+        - If no products are associated with the authenticated business, it raises 404 Not Found.
+        - If the cursor is malformed or more records than the configured cap are skipped, it raises
+          422 Unprocessable Entity.
     """
-    general(f"Searching products for business {business_auth.uuid} with skip={skip}, limit={limit}")
-    query = select(Product).where(Product.business_id == business_auth.uuid).options(selectinload("*")).offset(skip).limit(limit)
-    result = await db.execute(query)
-    products = result.scalars().all()
+    general(f"Searching products for business {business_auth.uuid} with cursor={cursor}, skip={skip}, limit={limit}")
+    query = select(Product).where(Product.business_id == business_auth.uuid)
+    result = await db.execute(paginate(query, Product.id, cursor, skip, limit))
+    products, next_cursor = next_page(result.scalars().all(), limit)
     if not products:
         warning(f"No products found for business {business_auth.email}")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No product present in database")
     success(f"Found {len(products)} products for business {business_auth.email}")
-    return {"action": "get", "products": [ProductViewInternal.model_validate(product).model_dump() for product in products]}
+    return {
+        "action": "get",
+        "products": [ProductViewInternal.model_validate(product).model_dump() for product in products],
+        "next_cursor": next_cursor,
+    }
 
 
 @router.get("/search/uuid/{product_id}", status_code=status.HTTP_200_OK, response_model=ProductResultInternal, tags=["product"])
 async def get_product_by_uuid(
-    product_id: str, db: AsyncSession = Depends(get_db), business_auth=Depends(verify_business_cred)
+    response: Response, product_id: str, db: AsyncSession = Depends(get_read_db), business_auth=Depends(verify_business_cred)
 ) -> ProductResultInternal:
     """
     Endpoint fetches a specific product by its UUID associated with the authenticated business.
 
+    :param response: The outgoing response, carrying the `ETag` of the product to make conditional
+                     updates against.
     :param product_id: The UUID of the product to retrieve.
-    :param db: Active asynchronous database session dependency.
+    :param db: Active asynchronous database session dependency on a read replica.
     :param business_auth: Authenticated business object.
 
     :return: Dictionary containing the action type and product details, validated and
@@ -189,12 +361,13 @@ async def get_product_by_uuid(
         404 Not Found.
     """
     general(f"Searching for product {product_id} for business {business_auth.uuid}")
-    query = select(Product).where(and_(Product.uuid == product_id, Product.business_id == business_auth.uuid)).options(selectinload("*"))
+    query = select(Product).where(and_(Product.uuid == product_id, Product.business_id == business_auth.uuid))
     result = await db.execute(query)
     product_by_uuid = result.scalar_one_or_none()
     if not product_by_uuid:
         warning(f"Product {product_id} not found for business {business_auth.uuid}")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not present in database")
+    response.headers["ETag"] = make_etag(product_by_uuid.version)
     success(f"Found product {product_id} for business {business_auth.uuid}")
     return {"action": "get", "product": ProductViewInternal.model_validate(product_by_uuid)}
 
@@ -217,14 +390,13 @@ async def delete_product(product_id: str, db: AsyncSession = Depends(get_db), bu
         - If there are other database errors, it returns a 500 Internal Server Error.
     """
     general(f"Deleting product {product_id} for business {business_auth.uuid}")
-    query = select(Product).where(and_(Product.uuid == product_id, Product.business_id == business_auth.uuid)).options(selectinload("*"))
+    # Delete the product and fetch the deleted row in a single round trip
+    query = delete(Product).where(and_(Product.uuid == product_id, Product.business_id == business_auth.uuid)).returning(Product)
     result = await db.execute(query)
     product_to_delete = result.scalar_one_or_none()
     if not product_to_delete:
         warning(f"Product {product_id} not found for deletion for business {business_auth.uuid}")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not present in database")
-    query = delete(Product).where(and_(Product.uuid == product_id, Product.business_id == business_auth.uuid))
-    await db.execute(query)
     try:
         await db.flush()
     except Exception as expt:  # pragma: no cover
@@ -235,18 +407,33 @@ async def delete_product(product_id: str, db: AsyncSession = Depends(get_db), bu
         """
         failure(f"Product deletion failed for {product_id} for business {business_auth.uuid}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected database error occurred.") from expt
+    product_index.track(db, product_to_delete, deleted=True)
+    response_cache.bump_on_commit(db)
     success(f"Product {product_id} deleted successfully for business {business_auth.uuid}")
     return {"action": "delete", "product": ProductViewInternal.model_validate(product_to_delete).model_dump()}
 
 
 @router.put("/update/uuid/{product_id}", status_code=status.HTTP_202_ACCEPTED, response_model=ProductResultInternal, tags=["product"])
 async def update_product(
-    product_id: str, product: ProductUpdate, db: AsyncSession = Depends(get_db), business_auth=Depends(verify_business_cred)
+    request: Request,
+    response: Response,
+    product_id: str,
+    product: ProductUpdate,
+    db: AsyncSession = Depends(get_db),
+    business_auth=Depends(verify_business_cred),
 ) -> ProductResultInternal:
     """
     Endpoint to update a product by its UUID associated for an authenticated business.
 
+    Only the fields provided are written, with a single `UPDATE ... RETURNING` statement which
+    bumps the version of the product. The update is made conditional by sending the `ETag` of the
+    product, as returned by the endpoints fetching or updating it, in an `If-Match` header; it is
+    then refused if the product was updated in the meantime.
+
+    :param request: The incoming request, optionally carrying an `If-Match` header.
+    :param response: The outgoing response, carrying the `ETag` of the updated product.
     :param product_id: The UUID of the product to retrieve.
+    :param product: Input data for updating the product. Must adhere to the `ProductUpdate` schema.
     :param db: Active asynchronous database session dependency.
     :param business_auth: Authenticated business object.
 
@@ -256,45 +443,138 @@ async def update_product(
     :raises HTTPException:
         - If no products with the given UUID is associated with the authenticated business, it
           raises 404 Not Found.
+        - If the product does not match the version of the `If-Match` header, it raises 412
+          Precondition Failed.
         - If there are other database errors, it returns a 500 Internal Server Error.
     """
     general(f"Updating product {product_id} for business {business_auth.uuid}")
-    query = select(Product).where(and_(Product.uuid == product_id, Product.business_id == business_auth.uuid)).options(selectinload("*"))
-    result = await db.execute(query)
+    owned = [Product.uuid == product_id, Product.business_id == business_auth.uuid]
+    versions = if_match_versions(request)
+    matched = owned if versions is None else [*owned, Product.version.in_(versions)]
+    changes = product_changes(product)
+    if changes:
+        changes.update(version=Product.version + 1, update_date=datetime.now(timezone.utc))
+        query = update(Product).where(*matched).values(**changes).returning(Product)
+    else:
+        query = select(Product).where(*matched)
+    try:
+        result = await db.execute(query)
+    except Exception as expt:  # pragma: no cover
+        """
+        This part of the code cannot be tested as this endpoint performs multiple database
+        interactions due to which mocking one part wont produce the desired result. Thus,
+        we will keep it uncovered until a alternative can be made for testing this exception block.
+        """
+        failure(f"Product update failed for {product_id} for business {business_auth.uuid} with unexpected error")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected database error occurred.") from expt
     product_to_update = result.scalar_one_or_none()
     if not product_to_update:
+        # Tell a stale version apart from a missing product only once the update did not match
+        if versions is not None and (await db.execute(select(Product.id).where(*owned))).first():
+            warning(f"Product {product_id} update refused for business {business_auth.uuid} - Version does not match {versions}")
+            raise HTTPException(
+                status_code=status.HTTP_412_PRECONDITION_FAILED, detail="Product was modified in the meantime - Please fetch it again"
+            )
         warning(f"Product {product_id} not found for update for business {business_auth.uuid}")
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Product not present in database")
-    is_updated = False
-    if product.name != "":
-        product_to_update.name = product.name
-        is_updated = True
-    if product.description != "":
-        product_to_update.description = product.description
-        is_updated = True
-    if product.category != "":
-        product_to_update.category = product.category
-        is_updated = True
-    if str(product.mfg_date) != "1900-01-01 00:00:00+00:00":
-        product_to_update.mfg_date = product.mfg_date
-        is_updated = True
-    if str(product.exp_date) != "1900-01-01 00:00:00+00:00":
-        product_to_update.exp_date = product.exp_date
-        is_updated = True
-    if product.price != 0.0:
-        product_to_update.price = product.price
-        is_updated = True
-    if is_updated:
-        product_to_update.update_date = datetime.now(timezone.utc)
-        try:
-            await db.flush()
-        except Exception as expt:  # pragma: no cover
-            """
-            This part of the code cannot be tested as this endpoint performs multiple database
-            interactions due to which mocking one part wont produce the desired result. Thus,
-            we will keep it uncovered until a alternative can be made for testing this exception block.
-            """
-            failure(f"Product update failed for {product_id} for business {business_auth.uuid} with unexpected error")
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected database error occurred.") from expt
+    response.headers["ETag"] = make_etag(product_to_update.version)
+    if changes:
+        product_index.track(db, product_to_update)
+        response_cache.bump_on_commit(db)
     success(f"Product {product_id} updated successfully for business {business_auth.uuid}")
     return {"action": "put", "product": ProductViewInternal.model_validate(product_to_update).model_dump()}
+
+
+@router.put("/bulk-update", status_code=status.HTTP_202_ACCEPTED, response_model=ProductBulkResult, tags=["product"])
+async def bulk_update_product(
+    products: ProductBulkUpdate, db: AsyncSession = Depends(get_db), business_auth=Depends(verify_business_cred)
+) -> ProductBulkResult:
+    """
+    Endpoint to update many products of the currently authenticated business at once, either
+    listing them along with their own changes or making the same changes to all the products of a
+    category.
+
+    The products listed are updated a chunk at a time with a single statement per chunk, and the
+    products of a category with a single statement, bumping the version of every product updated.
+    The products listed without any change are left alone.
+
+    :param products: Input data for updating the products. Must adhere to the `ProductBulkUpdate`
+                     schema.
+    :param db: Active asynchronous database session dependency.
+    :param business_auth: Authenticated business object.
+
+    :return: Dictionary containing the action type, the number of products updated and the UUIDs
+             listed which match no product of the business, validated and serialized using the
+             `ProductBulkResult` schema.
+
+    :raises HTTPException: If the products are neither listed nor selected with a category along
+                           with changes, or are both, it raises 422 Unprocessable Entity.
+    """
+    general(f"Updating products in bulk for business {business_auth.uuid}")
+    if bool(products.products) == (products.category is not None):
+        warning(f"Bulk product update rejected for business {business_auth.uuid} - Products listed and selected with a category")
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Either list the products or give their category, but not both"
+        )
+    missing = []
+    if products.category is not None:
+        changes = product_changes(products.changes) if products.changes else {}
+        if not changes:
+            warning(f"Bulk product update rejected for business {business_auth.uuid} - No changes for the category")
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="No changes given for the products of the category")
+        count = await bulk_update_matching(db, business_auth.uuid, [Product.category == products.category], changes)
+    else:
+        # A product listed more than once takes its last changes
+        items = {item.uuid: product_changes(item) for item in products.products}
+        items = {uuid: changes for uuid, changes in items.items() if changes}
+        updated = set(await bulk_update_products(db, business_auth.uuid, list(items.items())))
+        count, missing = len(updated), [uuid for uuid in items if uuid not in updated]
+    if count:
+        product_index.rebuild_on_commit(db)
+        response_cache.bump_on_commit(db)
+    success(f"Updated {count} products in bulk for business {business_auth.uuid}, missing {len(missing)}")
+    return {"action": "put", "count": count, "missing": missing}
+
+
+@router.post("/bulk-delete", status_code=status.HTTP_202_ACCEPTED, response_model=ProductBulkResult, tags=["product"])
+async def bulk_delete_product(
+    products: ProductBulkDelete, db: AsyncSession = Depends(get_db), business_auth=Depends(verify_business_cred)
+) -> ProductBulkResult:
+    """
+    Endpoint to delete many products of the currently authenticated business at once, either
+    listing them or deleting all the products of a category.
+
+    The products listed are deleted a chunk at a time with a single statement per chunk, and the
+    products of a category with a single statement. As the products are listed in the body, the
+    endpoint is reached with `POST` rather than `DELETE`.
+
+    :param products: Input data for deleting the products. Must adhere to the `ProductBulkDelete`
+                     schema.
+    :param db: Active asynchronous database session dependency.
+    :param business_auth: Authenticated business object.
+
+    :return: Dictionary containing the action type, the number of products deleted and the UUIDs
+             listed which match no product of the business, validated and serialized using the
+             `ProductBulkResult` schema.
+
+    :raises HTTPException: If the products are neither listed nor selected with a category, or are
+                           both, it raises 422 Unprocessable Entity.
+    """
+    general(f"Deleting products in bulk for business {business_auth.uuid}")
+    if bool(products.uuids) == (products.category is not None):
+        warning(f"Bulk product delete rejected for business {business_auth.uuid} - Products listed and selected with a category")
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Either list the products or give their category, but not both"
+        )
+    missing = []
+    if products.category is not None:
+        count = await bulk_delete_matching(db, business_auth.uuid, [Product.category == products.category])
+    else:
+        uuids = list(dict.fromkeys(products.uuids))
+        deleted = set(await bulk_delete_products(db, business_auth.uuid, uuids))
+        count, missing = len(deleted), [uuid for uuid in uuids if uuid not in deleted]
+    if count:
+        product_index.rebuild_on_commit(db)
+        response_cache.bump_on_commit(db)
+    success(f"Deleted {count} products in bulk for business {business_auth.uuid}, missing {len(missing)}")
+    return {"action": "delete", "count": count, "missing": missing}
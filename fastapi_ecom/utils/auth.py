@@ -1,34 +1,95 @@
-from fastapi import Depends, HTTPException, status
+from collections.abc import Awaitable, Callable
+from typing import NamedTuple
 
+from fastapi import Depends, HTTPException, Request, Security, status
+from fastapi.security import HTTPBasicCredentials
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastapi_ecom.database.db_setup import get_db
 from fastapi_ecom.database.models.business import Business
 from fastapi_ecom.database.models.customer import Customer
-from fastapi_ecom.utils.basic_auth import verify_basic_business_cred, verify_basic_customer_cred
+from fastapi_ecom.utils.basic_auth import basic_business, basic_customer, security
 from fastapi_ecom.utils.logging_setup import failure
-from fastapi_ecom.utils.oauth import verify_oauth_business_cred, verify_oauth_customer_cred
+from fastapi_ecom.utils.oauth import oauth_business, oauth_customer, oidc
+from fastapi_ecom.utils.token_auth import token_business, token_customer
+
+
+class AuthBackend(NamedTuple):
+    """
+    Pair of functions resolving the principal of a request for one authentication scheme.
+
+    :cvar customer: Awaitable factory resolving the customer of a request or returning None.
+    :cvar business: Awaitable factory resolving the business of a request or returning None.
+    """
+
+    customer: Callable[[Request, AsyncSession], Awaitable[Customer | None]]
+    business: Callable[[Request, AsyncSession], Awaitable[Business | None]]
+
+
+# Registry of the authentication backends keyed on the lowercase scheme of the `Authorization`
+# header they handle.
+auth_backends: dict[str, AuthBackend] = {}
+
+# Scheme assumed for the requests without an `Authorization` header.
+DEFAULT_SCHEME = "basic"
+
+
+def register_backend(scheme: str, backend: AuthBackend) -> None:
+    """
+    Register an authentication backend for a scheme of the `Authorization` header.
+
+    :param scheme: The scheme handled by the backend, e.g. "basic", "bearer" or "token".
+    :param backend: The backend resolving the principals for the scheme.
+
+    :return: None
+    """
+    auth_backends[scheme.lower()] = backend
+
+
+register_backend("basic", AuthBackend(customer=basic_customer, business=basic_business))
+register_backend("bearer", AuthBackend(customer=oauth_customer, business=oauth_business))
+register_backend("token", AuthBackend(customer=token_customer, business=token_business))
+
+
+def pick_backend(request: Request) -> AuthBackend | None:
+    """
+    Pick the authentication backend for a request from the scheme of its `Authorization` header.
+
+    :param request: The incoming request.
+
+    :return: The backend registered for the scheme or None if no backend handles it.
+    """
+    authorization = request.headers.get("Authorization")
+    scheme = authorization.partition(" ")[0].lower() if authorization else DEFAULT_SCHEME
+    return auth_backends.get(scheme)
 
 
 async def verify_cust_cred(
-    basic_customer: Customer | None = Depends(verify_basic_customer_cred), oauth_customer: Customer | None = Depends(verify_oauth_customer_cred)
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    basic: HTTPBasicCredentials | None = Security(security),
+    bearer: str | None = Security(oidc),
 ) -> Customer:
     """
-    Verify customer credentials using either HTTP Basic Authentication or OAuth.
+    Verify customer credentials using either HTTP Basic Authentication, OAuth or signed tokens.
 
-    This function attempts to authenticate a customer using multiple authentication
-    methods. It first tries HTTP Basic Authentication, then falls back to OAuth
-    authentication if basic auth is not provided or fails.
+    This function inspects the scheme of the `Authorization` header once and dispatches the
+    request to the one authentication backend registered for it, so that every request performs
+    at most one customer lookup.
 
-    :param basic_customer: Customer object from HTTP Basic Authentication or None.
-    :param oauth_customer: Customer object from OAuth authentication or None.
+    :param request: The incoming request carrying the credentials.
+    :param db: Database session to query customer data.
+    :param basic: HTTP Basic credentials, declared so that the scheme is documented in OpenAPI.
+    :param bearer: OAuth bearer token, declared so that the scheme is documented in OpenAPI.
 
     :return: The authenticated customer object.
 
-    :raises HTTPException: If neither authentication method succeeds.
+    :raises HTTPException: If the authentication with the picked backend does not succeed.
     """
-    if basic_customer:
-        return basic_customer
-
-    if oauth_customer:
-        return oauth_customer
+    backend = pick_backend(request)
+    customer = await backend.customer(request, db) if backend else None
+    if customer:
+        return customer
 
     failure("Customer authentication failed")
     raise HTTPException(
@@ -38,27 +99,31 @@ async def verify_cust_cred(
 
 
 async def verify_business_cred(
-    basic_business: Business | None = Depends(verify_basic_business_cred), oauth_business: Business | None = Depends(verify_oauth_business_cred)
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+    basic: HTTPBasicCredentials | None = Security(security),
+    bearer: str | None = Security(oidc),
 ) -> Business:
     """
-    Verify business credentials using either HTTP Basic Authentication or OAuth.
+    Verify business credentials using either HTTP Basic Authentication, OAuth or signed tokens.
 
-    This function attempts to authenticate a business using multiple authentication
-    methods. It first tries HTTP Basic Authentication, then falls back to OAuth
-    authentication if basic auth is not provided or fails.
+    This function inspects the scheme of the `Authorization` header once and dispatches the
+    request to the one authentication backend registered for it, so that every request performs
+    at most one business lookup.
 
-    :param basic_business: Business object from HTTP Basic Authentication or None.
-    :param oauth_business: Business object from OAuth authentication or None.
+    :param request: The incoming request carrying the credentials.
+    :param db: Database session to query business data.
+    :param basic: HTTP Basic credentials, declared so that the scheme is documented in OpenAPI.
+    :param bearer: OAuth bearer token, declared so that the scheme is documented in OpenAPI.
 
     :return: The authenticated business object.
 
-    :raises HTTPException: If neither authentication method succeeds.
+    :raises HTTPException: If the authentication with the picked backend does not succeed.
     """
-    if basic_business:
-        return basic_business
-
-    if oauth_business:
-        return oauth_business
+    backend = pick_backend(request)
+    business = await backend.business(request, db) if backend else None
+    if business:
+        return business
 
     failure("Business authentication failed")
     raise HTTPException(
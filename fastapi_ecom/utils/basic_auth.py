@@ -1,14 +1,14 @@
-import bcrypt
-from fastapi import Depends
+from fastapi import Depends, Request
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
 from fastapi_ecom.database.db_setup import get_db
 from fastapi_ecom.database.models.business import Business
 from fastapi_ecom.database.models.customer import Customer
+from fastapi_ecom.utils.hashing import verify_password
 from fastapi_ecom.utils.logging_setup import success, warning
+from fastapi_ecom.utils.principal_cache import principal_cache
 
 # Initialize HTTP Basic Authentication.
 # This will prompt users for a username and password when accessing secured endpoints.
@@ -20,7 +20,9 @@ async def verify_basic_customer_cred(credentials: HTTPBasicCredentials | None =
     Verify customer credentials using HTTP Basic Authentication.
 
     This function retrieves the customer record from the database using the provided username
-    (email address) and verifies the provided password against the stored hashed password.
+    (email address) and verifies the provided password against the stored hashed password. The
+    customer is served from the principal cache when it authenticated recently with the same
+    credentials.
 
     :param credentials: HTTPBasicCredentials containing the username and password.
     :param db: Database session to query customer data.
@@ -30,18 +32,25 @@ async def verify_basic_customer_cred(credentials: HTTPBasicCredentials | None =
     if not credentials:  # pragma: no cover
         return None
 
-    query = select(Customer).where(Customer.email == credentials.username).options(selectinload("*"))
+    generation = principal_cache.generation
+    cached_customer = principal_cache.get("customer", credentials.username, credentials.password)
+    if cached_customer:
+        success(f"Customer authenticated via cached basic auth: {credentials.username}")
+        return cached_customer
+
+    query = select(Customer).where(Customer.email == credentials.username)
     result = await db.execute(query)
     customer_by_email = result.scalar_one_or_none()
 
     if not customer_by_email:
         warning(f"No customer account found for email: {credentials.username}")
         return None
-    elif not bcrypt.checkpw(credentials.password.encode("utf-8"), customer_by_email.password.encode("utf-8")):
+    elif not await verify_password(credentials.password, customer_by_email.password):
         warning(f"Invalid password for customer: {credentials.username}")
         return None
     else:
         success(f"Customer authenticated via basic auth: {credentials.username}")
+        principal_cache.put("customer", credentials.username, credentials.password, customer_by_email, generation)
         return customer_by_email
 
 
@@ -50,7 +59,9 @@ async def verify_basic_business_cred(credentials: HTTPBasicCredentials | None =
     Verify business credentials using HTTP Basic Authentication.
 
     This function retrieves the business record from the database using the provided username
-    (email address) and verifies the provided password against the stored hashed password.
+    (email address) and verifies the provided password against the stored hashed password. The
+    business is served from the principal cache when it authenticated recently with the same
+    credentials.
 
     :param credentials: HTTPBasicCredentials containing the username and password.
     :param db: Database session to query business data.
@@ -60,16 +71,47 @@ async def verify_basic_business_cred(credentials: HTTPBasicCredentials | None =
     if not credentials:  # pragma: no cover
         return None
 
-    query = select(Business).where(Business.email == credentials.username).options(selectinload("*"))
+    generation = principal_cache.generation
+    cached_business = principal_cache.get("business", credentials.username, credentials.password)
+    if cached_business:
+        success(f"Business authenticated via cached basic auth: {credentials.username}")
+        return cached_business
+
+    query = select(Business).where(Business.email == credentials.username)
     result = await db.execute(query)
     business_by_email = result.scalar_one_or_none()
 
     if not business_by_email:
         warning(f"No business account found for email: {credentials.username}")
         return None
-    elif not bcrypt.checkpw(credentials.password.encode("utf-8"), business_by_email.password.encode("utf-8")):
+    elif not await verify_password(credentials.password, business_by_email.password):
         warning(f"Invalid password for business: {credentials.username}")
         return None
     else:
         success(f"Business authenticated via basic auth: {credentials.username}")
+        principal_cache.put("business", credentials.username, credentials.password, business_by_email, generation)
         return business_by_email
+
+
+async def basic_customer(request: Request, db: AsyncSession) -> Customer | None:
+    """
+    Authentication backend resolving the customer of a request via HTTP Basic Authentication.
+
+    :param request: The incoming request carrying the credentials.
+    :param db: Database session to query customer data.
+
+    :return: The customer object if authentication is successful else returns None.
+    """
+    return await verify_basic_customer_cred(await security(request), db)
+
+
+async def basic_business(request: Request, db: AsyncSession) -> Business | None:
+    """
+    Authentication backend resolving the business of a request via HTTP Basic Authentication.
+
+    :param request: The incoming request carrying the credentials.
+    :param db: Database session to query business data.
+
+    :return: The business object if authentication is successful else returns None.
+    """
+    return await verify_basic_business_cred(await security(request), db)
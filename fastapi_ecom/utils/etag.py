@@ -0,0 +1,73 @@
+import hashlib
+
+from fastapi import Request
+
+# Header carrying the entity tags a conditional update is made against
+IF_MATCH_HEADER = "If-Match"
+
+# Header carrying the entity tags of the representations a conditional fetch already holds
+IF_NONE_MATCH_HEADER = "If-None-Match"
+
+
+def make_etag(version: int) -> str:
+    """
+    Build the entity tag of a version of a record.
+
+    :param version: Version of the record.
+
+    :return: The strong entity tag of the version, quoted as per RFC 9110.
+    """
+    return f'"{version}"'
+
+
+def content_etag(body: bytes) -> str:
+    """
+    Build the entity tag of the encoded body of a response.
+
+    :param body: The encoded body of the response.
+
+    :return: The strong entity tag of the body, derived from its BLAKE2b digest.
+    """
+    return f'"{hashlib.blake2b(body, digest_size=12).hexdigest()}"'
+
+
+def if_none_match(request: Request, etag: str) -> bool:
+    """
+    Check whether a conditional fetch already holds the representation with an entity tag.
+
+    The entity tags are compared weakly, as `If-None-Match` does, so `W/"..."` matches as well.
+
+    :param request: The incoming request, optionally carrying an `If-None-Match` header.
+    :param etag: The entity tag of the representation about to be sent.
+
+    :return: True if the header is `*` or lists the entity tag else False.
+    """
+    header = request.headers.get(IF_NONE_MATCH_HEADER)
+    if header is None:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+def if_match_versions(request: Request) -> list[int] | None:
+    """
+    Read the versions a conditional update is made against from the `If-Match` header.
+
+    Only strong entity tags built by `make_etag()` can match, as `If-Match` compares entity tags
+    strongly. Weak or malformed entity tags are ignored, so that a header listing none else
+    matches no version.
+
+    :param request: The incoming request, optionally carrying an `If-Match` header.
+
+    :return: The versions listed by the header, or None if the update is unconditional, i.e. the
+             header is absent or is `*`.
+    """
+    header = request.headers.get(IF_MATCH_HEADER)
+    if header is None or header.strip() == "*":
+        return None
+    versions = []
+    for tag in header.split(","):
+        tag = tag.strip()
+        if len(tag) > 2 and tag[0] == tag[-1] == '"' and tag[1:-1].isdigit():
+            versions.append(int(tag[1:-1]))
+    return versions
@@ -0,0 +1,167 @@
+import csv
+import io
+import json
+import zlib
+from collections.abc import AsyncIterator, Iterable
+from datetime import date, datetime, time
+from typing import Any
+
+from fastapi import Request
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from fastapi_ecom.config import config
+from fastapi_ecom.database.models.order import Order
+from fastapi_ecom.database.models.order_details import OrderDetail
+from fastapi_ecom.utils.logging_setup import failure, success
+
+# Media types of the formats the orders can be exported in
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+# Header of the CSV export, one row per order detail
+CSV_HEADER = ["order_uuid", "user_id", "order_date", "total_price", "product_id", "quantity", "price", "detail_uuid"]
+
+
+def accepts_gzip(request: Request) -> bool:
+    """
+    Check whether the client of a request accepts a response compressed with gzip.
+
+    :param request: The incoming request, optionally carrying an `Accept-Encoding` header.
+
+    :return: True if gzip is listed as an acceptable encoding and not refused with `q=0` else
+             False.
+    """
+    for coding in request.headers.get("Accept-Encoding", "").split(","):
+        name, _, params = coding.partition(";")
+        if name.strip().lower() == "gzip":
+            try:
+                return float(params.replace(" ", "").lower().removeprefix("q=") or 1) > 0
+            except ValueError:
+                return True
+    return False
+
+
+def order_export_query(start: date | None, end: date | None) -> Select:
+    """
+    Build the query selecting the orders to export along with their details, one row per detail.
+
+    The rows of an order are adjacent as they are ordered on the ID of the order, so that an order
+    can be assembled as soon as its last row is read. Orders without details yield a single row
+    whose detail columns are empty.
+
+    :param start: Earliest date of the orders to export, inclusive, if any.
+    :param end: Latest date of the orders to export, inclusive, if any.
+
+    :return: The query selecting the plain columns of the orders and of their details.
+    """
+    query = select(
+        Order.id,
+        Order.uuid,
+        Order.user_id,
+        Order.order_date,
+        Order.total_price,
+        OrderDetail.product_id,
+        OrderDetail.quantity,
+        OrderDetail.price,
+        OrderDetail.uuid,
+    ).outerjoin(OrderDetail, OrderDetail.order_id == Order.uuid)
+    if start is not None:
+        query = query.where(Order.order_date >= start)
+    if end is not None:
+        query = query.where(Order.order_date <= end)
+    return query.order_by(Order.id, OrderDetail.id)
+
+
+def _ndjson(rows: Iterable[Any], pending: dict[str, Any] | None) -> tuple[list[str], dict[str, Any] | None]:
+    """
+    Assemble the rows of a partition into one JSON line per order, shaped as the orders listed by
+    `/order/search/internal`.
+
+    :param rows: The rows of the partition, as selected by `order_export_query()`.
+    :param pending: The order whose rows may continue in this partition, carried over from the
+                    previous one.
+
+    :return: The lines of the orders completed in the partition along with the order whose rows
+             may continue in the next one.
+    """
+    lines = []
+    for row in rows:
+        if pending is None or pending["uuid"] != row[1]:
+            if pending is not None:
+                lines.append(json.dumps(pending) + "\n")
+            pending = {
+                "uuid": row[1],
+                "user_id": row[2],
+                "order_date": datetime.combine(row[3], time()).isoformat(),
+                "total_price": row[4],
+                "order_items": [],
+            }
+        if row[8] is not None:
+            pending["order_items"].append({"product_id": row[5], "quantity": row[6], "price": row[7], "uuid": row[8]})
+    return lines, pending
+
+
+def _csv(rows: Iterable[Any]) -> str:
+    """
+    Write the rows of a partition as CSV, one row per order detail.
+
+    :param rows: The rows of the partition, as selected by `order_export_query()`.
+
+    :return: The CSV text of the partition.
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows((row[1], row[2], row[3].isoformat(), *row[4:]) for row in rows)
+    return buffer.getvalue()
+
+
+async def stream_orders(db: AsyncSession, start: date | None, end: date | None, fmt: str, compress: bool) -> AsyncIterator[bytes]:
+    """
+    Stream the orders along with their details in constant memory.
+
+    The rows are read from a server-side cursor, a partition of the configured size at a time,
+    and every partition is serialized and sent before the next one is fetched, so that neither
+    the database driver nor the service holds more than one partition whatever the number of
+    orders exported. On PostgreSQL, the cursor is read in a `REPEATABLE READ` transaction so that
+    the export is a consistent snapshot of the orders.
+
+    :param db: Database session to read the orders through.
+    :param start: Earliest date of the orders to export, inclusive, if any.
+    :param end: Latest date of the orders to export, inclusive, if any.
+    :param fmt: Format of the export, either "ndjson" or "csv".
+    :param compress: Whether to compress the export with gzip.
+
+    :yield: The chunks of the export.
+    """
+    encoder = zlib.compressobj(wbits=31) if compress else None  # The window bits of a gzip stream
+
+    def encode(text: str) -> bytes:
+        data = text.encode("utf-8")
+        return encoder.compress(data) if encoder else data
+
+    if db.bind.dialect.name == "postgresql":
+        await db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+    exported, pending = 0, None
+    try:
+        if fmt == "csv":
+            yield encode(",".join(CSV_HEADER) + "\r\n")
+        result = await db.stream(order_export_query(start, end), execution_options={"yield_per": config.exptbat})
+        async for rows in result.partitions():
+            if fmt == "csv":
+                chunk = _csv(rows)
+                exported += len(rows)
+            else:
+                lines, pending = _ndjson(rows, pending)
+                chunk = "".join(lines)
+                exported += len(lines)
+            if chunk:
+                yield encode(chunk)
+        if pending is not None:
+            yield encode(json.dumps(pending) + "\n")
+            exported += 1
+    except Exception:
+        failure(f"Order export failed after {exported} {'rows' if fmt == 'csv' else 'orders'}")
+        raise
+    if encoder:
+        yield encoder.flush()
+    success(f"Exported {exported} {'rows' if fmt == 'csv' else 'orders'} as {fmt}")
@@ -0,0 +1,97 @@
+import operator
+from datetime import date, datetime, timezone
+from typing import Any
+
+from fastapi import HTTPException, Query, status
+from sqlalchemy import ColumnElement, case, func, literal_column
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from fastapi_ecom.config import config
+from fastapi_ecom.database.models.product import Product
+from fastapi_ecom.utils.logging_setup import warning
+
+
+def _check_range(start: Any, end: Any, name: str) -> None:
+    if start is not None and end is not None and start > end:
+        warning(f"Rejected product filter with the start of the {name} range after its end")
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"The start of the {name} range is after its end")
+
+
+def product_filters(
+    category: list[str] | None = Query(None, description="Categories of the products, any of them"),
+    min_price: float | None = Query(None, ge=0, description="Lowest price of the products"),
+    max_price: float | None = Query(None, ge=0, description="Highest price of the products"),
+    mfg_from: date | None = Query(None, description="Earliest manufacturing date of the products"),
+    mfg_to: date | None = Query(None, description="Latest manufacturing date of the products"),
+    exp_from: date | None = Query(None, description="Earliest expiry date of the products"),
+    exp_to: date | None = Query(None, description="Latest expiry date of the products"),
+    not_expired: bool = Query(False, description="Keep only the products not expired yet"),
+) -> list[ColumnElement]:
+    """
+    Dependency function turning the filters of the product searches into the conditions selecting
+    the matching products. All the bounds are inclusive.
+
+    :param category: Categories of the products, any of them.
+    :param min_price: Lowest price of the products.
+    :param max_price: Highest price of the products.
+    :param mfg_from: Earliest manufacturing date of the products.
+    :param mfg_to: Latest manufacturing date of the products.
+    :param exp_from: Earliest expiry date of the products.
+    :param exp_to: Latest expiry date of the products.
+    :param not_expired: Whether to keep only the products whose expiry date is not past.
+
+    :return: The conditions selecting the matching products.
+
+    :raises HTTPException: If the start of a range is after its end, it raises 422 Unprocessable
+                           Entity.
+    """
+    _check_range(min_price, max_price, "price")
+    _check_range(mfg_from, mfg_to, "manufacturing date")
+    _check_range(exp_from, exp_to, "expiry date")
+    bounds = [
+        (operator.ge, Product.price, min_price),
+        (operator.le, Product.price, max_price),
+        (operator.ge, Product.mfg_date, mfg_from),
+        (operator.le, Product.mfg_date, mfg_to),
+        (operator.ge, Product.exp_date, exp_from),
+        (operator.le, Product.exp_date, exp_to),
+    ]
+    filters = [compare(column, value) for compare, column, value in bounds if value is not None]
+    if category:
+        filters.append(Product.category.in_(category))
+    if not_expired:
+        filters.append(Product.exp_date >= datetime.now(timezone.utc).date())
+    return filters
+
+
+async def product_facets(db: AsyncSession, filters: list[ColumnElement]) -> dict[str, Any]:
+    """
+    Count the matching products per category and per price bucket, the buckets being bounded by the
+    configured prices.
+
+    Both facets come out of a single pass grouping the products on their category and their price
+    bucket together, which the index on the category along with the price serves without reading
+    the table. The counts of each facet are then summed up from the groups.
+
+    :param db: Active asynchronous database session.
+    :param filters: The conditions selecting the matching products.
+
+    :return: Dictionary containing the number of matching products, their counts per category,
+             most populated first, and their counts per price bucket, cheapest first.
+    """
+    limits = sorted(config.facetprc)
+    bucket = case(*[(Product.price < limit, indx) for indx, limit in enumerate(limits)], else_=len(limits)).label("bucket")
+    # Group on the name of the bucket, as PostgreSQL tells apart the expressions binding the prices
+    query = select(Product.category, bucket, func.count()).where(*filters).group_by(Product.category, literal_column("bucket"))
+    categories: dict[str, int] = {}
+    prices = [0] * (len(limits) + 1)
+    for category, indx, count in (await db.execute(query)).all():
+        categories[category] = categories.get(category, 0) + count
+        prices[indx] += count
+    edges = [None, *limits, None]
+    return {
+        "total": sum(prices),
+        "categories": [{"category": name, "count": count} for name, count in sorted(categories.items(), key=lambda item: (-item[1], item[0]))],
+        "prices": [{"min": edges[indx], "max": edges[indx + 1], "count": count} for indx, count in enumerate(prices)],
+    }
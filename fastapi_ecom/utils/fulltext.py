@@ -0,0 +1,50 @@
+import re
+
+from sqlalchemy import ColumnElement, Select, column, false, func, literal, literal_column, table
+
+from fastapi_ecom.database.models.product import Product
+
+# External content FTS5 table indexing the products on SQLite
+_products_fts = table("products_fts", column("rowid"))
+
+
+def fts5_query(text: str) -> str | None:
+    """
+    Turn a search string into an FTS5 query matching the products containing all of its words.
+
+    The words are quoted so that the operators and the punctuation of the FTS5 query syntax in the
+    search string are taken literally instead of failing the query.
+
+    :param text: The search string.
+
+    :return: The FTS5 query, or None if the search string has no words.
+    """
+    words = re.findall(r"\w+", text)
+    return " ".join(f'"{word}"' for word in words) if words else None
+
+
+def fulltext_search(query: Select, dialect: str, text: str) -> tuple[Select, ColumnElement]:
+    """
+    Restrict a query on the products to those matching a search string in full-text.
+
+    On PostgreSQL, the search string is parsed with `websearch_to_tsquery()` and matched against
+    the generated `search_vector` column through its GIN index, ranked with `ts_rank_cd()`. On
+    SQLite, all the words of the search string are matched against the FTS5 table of the products,
+    ranked with `bm25()`. The name weighs more than the description on both.
+
+    :param query: The query selecting the products to search.
+    :param dialect: Name of the dialect of the database the query is run on.
+    :param text: The search string.
+
+    :return: The query restricted to the matching products along with their relevance, higher
+             first.
+    """
+    if dialect == "postgresql":
+        tsquery = func.websearch_to_tsquery("english", text)
+        search_vector = literal_column("products.search_vector")
+        return query.where(search_vector.op("@@")(tsquery)), func.ts_rank_cd(search_vector, tsquery)
+    match = fts5_query(text)
+    if match is None:
+        return query.where(false()), literal(0.0)
+    query = query.join(_products_fts, _products_fts.c.rowid == Product.id).where(literal_column("products_fts").op("MATCH")(match))
+    return query, -func.bm25(literal_column("products_fts"), 10.0, 1.0)
@@ -0,0 +1,160 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from time import perf_counter
+
+import bcrypt
+from fastapi import HTTPException, status
+
+from fastapi_ecom.config import config
+from fastapi_ecom.utils.logging_setup import failure
+
+
+class PasswordHasher:
+    """
+    Runs the bcrypt hashing and verification of passwords on a dedicated pool of workers, so that
+    these CPU bound operations never block the event loop serving the other requests.
+
+    A semaphore admits a bounded number of operations to the workers at once, the others wait for
+    their turn and new ones are rejected once too many are waiting.
+
+    :ivar admitted: Number of operations currently admitted to the workers.
+    :ivar waiting: Number of operations currently waiting for admission.
+    :ivar peak_waiting: Highest number of operations which waited for admission at once.
+    :ivar completed: Number of operations completed so far.
+    :ivar rejected: Number of operations rejected as too many were waiting.
+    :ivar wait_total: Total seconds spent by the operations waiting for admission.
+    :ivar wait_max: Longest seconds spent by an operation waiting for admission.
+    """
+
+    def __init__(self) -> None:
+        self._executor: Executor | None = None
+        self._admission: asyncio.Semaphore | None = None
+        self.admitted = 0
+        self.waiting = 0
+        self.peak_waiting = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    @property
+    def executor(self) -> Executor:
+        """
+        Lazy-loaded pool of workers, either threads or processes as per the configuration.
+
+        :return: The executor running the bcrypt operations.
+        """
+        if self._executor is None:
+            executor_class = ProcessPoolExecutor if config.hashpool == "process" else ThreadPoolExecutor
+            self._executor = executor_class(max_workers=config.hashwrkr)
+        return self._executor
+
+    @property
+    def admission(self) -> asyncio.Semaphore:
+        """
+        Lazy-loaded semaphore admitting the operations to the workers.
+
+        :return: The semaphore bounding the number of admitted operations.
+        """
+        if self._admission is None:
+            self._admission = asyncio.Semaphore(config.hashlimt)
+        return self._admission
+
+    async def run(self, func: Callable[..., object], *args: object) -> object:
+        """
+        Run a bcrypt operation on the workers once it is admitted.
+
+        :param func: The bcrypt function to run.
+        :param args: Positional arguments for the function.
+
+        :return: The result of the function.
+
+        :raises HTTPException: If too many operations are already waiting, it returns a 503 Service
+                               Unavailable status.
+        """
+        start = perf_counter()
+        admission = self.admission
+        if admission.locked():
+            if config.hashqmax and self.waiting >= config.hashqmax:
+                self.rejected += 1
+                failure("Password hashing rejected - Too many operations waiting for admission")
+                raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Server is busy - Please try again")
+            self.waiting += 1
+            self.peak_waiting = max(self.peak_waiting, self.waiting)
+            try:
+                await admission.acquire()
+            finally:
+                self.waiting -= 1
+        else:
+            await admission.acquire()
+        wait = perf_counter() - start
+        self.wait_total += wait
+        self.wait_max = max(self.wait_max, wait)
+        self.admitted += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+        finally:
+            self.admitted -= 1
+            self.completed += 1
+            admission.release()
+
+    def report(self) -> dict[str, int | float]:
+        """
+        Report the live usage of the password hashing workers.
+
+        :return: Dictionary containing the worker and admission limits, the admitted and waiting
+                 operations along with the time spent by the operations waiting for admission.
+        """
+        return {
+            "workers": config.hashwrkr,
+            "limit": config.hashlimt,
+            "admitted": self.admitted,
+            "waiting": self.waiting,
+            "peak_waiting": self.peak_waiting,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "wait_avg_ms": (self.wait_total / self.completed * 1000) if self.completed else 0.0,
+            "wait_max_ms": self.wait_max * 1000,
+        }
+
+    def shutdown(self) -> None:
+        """
+        Shut the workers down; they are started again on the next operation.
+
+        :return: None
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        self._executor = None
+        self._admission = None
+
+
+# Password hasher shared by all the requests of the service.
+password_hasher = PasswordHasher()
+
+
+async def hash_password(password: str) -> str:
+    """
+    Hash a password with a fresh salt using bcrypt off the event loop.
+
+    :param password: The plain text password.
+
+    :return: The bcrypt hash of the password.
+    """
+    hashed_password = await password_hasher.run(bcrypt.hashpw, password.encode("utf-8"), bcrypt.gensalt())
+    return hashed_password.decode("utf-8")
+
+
+async def verify_password(password: str, hashed_password: str | None) -> bool:
+    """
+    Verify a password against its bcrypt hash off the event loop.
+
+    :param password: The plain text password.
+    :param hashed_password: The stored bcrypt hash, None for accounts without a password.
+
+    :return: True if the password matches the hash else False.
+    """
+    if not hashed_password:
+        return False
+    return await password_hasher.run(bcrypt.checkpw, password.encode("utf-8"), hashed_password.encode("utf-8"))
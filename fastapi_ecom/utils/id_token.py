@@ -0,0 +1,140 @@
+import asyncio
+from time import monotonic
+from typing import Any
+
+from joserfc import jwt
+from joserfc.errors import InvalidKeyIdError, JoseError
+from joserfc.jwk import KeySet
+
+from fastapi_ecom.config import config
+
+
+def looks_like_jwt(token: str) -> bool:
+    """
+    Check whether a bearer token has the shape of a JSON Web Token rather than an opaque access
+    token.
+
+    :param token: The bearer token.
+
+    :return: True if the token consists of three segments and starts with an encoded JSON header
+             else False.
+    """
+    return token.startswith("eyJ") and token.count(".") == 2
+
+
+class IDTokenVerifier:
+    """
+    Verifies the ID tokens issued by the OAuth provider locally against the signing keys (JWKS) it
+    publishes, so that authenticating with an ID token costs no call to the provider.
+
+    The keys are fetched from the `jwks_uri` of the discovery document of the provider once and
+    cached. They are fetched again when they grow older than the configured time to live or when a
+    token is signed with an unknown key ID, as happens when the provider rotates its keys; the
+    latter at most once per configured interval so that tokens with forged key IDs cannot make
+    the service hammer the provider.
+
+    :ivar client: The OAuth client registered for the provider.
+    :ivar verified: Number of tokens verified successfully.
+    :ivar rejected: Number of tokens which failed the verification.
+    :ivar refreshes: Number of times the keys were fetched from the provider.
+    """
+
+    def __init__(self, client: Any) -> None:
+        self.client = client
+        self._keys: KeySet | None = None
+        self._fetched = 0.0
+        self._lock: asyncio.Lock | None = None
+        self.verified = 0
+        self.rejected = 0
+        self.refreshes = 0
+
+    async def _refresh(self, fetched: float) -> KeySet:
+        """
+        Fetch the signing keys from the provider unless another caller did in the meantime.
+
+        :param fetched: When the keys the caller found stale were fetched.
+
+        :return: The signing keys of the provider.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if self._keys is None or self._fetched == fetched:
+                self._keys = KeySet.import_key_set(await self.client.fetch_jwk_set(force=True))
+                self._fetched = monotonic()
+                self.refreshes += 1
+        return self._keys
+
+    async def keys(self) -> KeySet:
+        """
+        Provide the cached signing keys of the provider, fetching them when they are missing or
+        older than the configured time to live.
+
+        :return: The signing keys of the provider.
+        """
+        if self._keys is None or monotonic() - self._fetched > config.jwksttl:
+            return await self._refresh(self._fetched)
+        return self._keys
+
+    async def _claims(self, token: str) -> dict[str, Any]:
+        """
+        Check the signature of an ID token and validate its claims.
+
+        :param token: The encoded ID token.
+
+        :return: The claims of the token.
+
+        :raises JoseError: If the signature or the claims of the token are invalid.
+        """
+        metadata = await self.client.load_server_metadata()
+        algorithms = metadata.get("id_token_signing_alg_values_supported") or ["RS256"]
+        try:
+            decoded = jwt.decode(token, await self.keys(), algorithms=algorithms)
+        except InvalidKeyIdError:
+            if monotonic() - self._fetched < config.jwksmiss:
+                raise
+            decoded = jwt.decode(token, await self._refresh(self._fetched), algorithms=algorithms)
+        issuer = metadata.get("issuer", "")
+        registry = jwt.JWTClaimsRegistry(
+            leeway=config.jwtleway,
+            iss={"essential": True, "values": [issuer, issuer.removeprefix("https://")]},
+            aud={"essential": True, "value": self.client.client_id},
+            exp={"essential": True},
+            sub={"essential": True},
+            email={"essential": True},
+        )
+        registry.validate(decoded.claims)
+        if decoded.claims.get("email_verified") is False:
+            raise JoseError("Email address of the token is not verified")
+        return decoded.claims
+
+    async def verify(self, token: str) -> dict[str, Any] | None:
+        """
+        Verify an ID token locally.
+
+        :param token: The encoded ID token.
+
+        :return: The claims of the token or None if the token is invalid.
+
+        :raises Exception: If the signing keys cannot be fetched from the provider.
+        """
+        try:
+            claims = await self._claims(token)
+        except JoseError:
+            self.rejected += 1
+            return None
+        self.verified += 1
+        return claims
+
+    def clear(self) -> None:
+        """
+        Forget the signing keys and reset the counters.
+
+        :return: None
+        """
+        self._keys = None
+        self._fetched = 0.0
+        self._lock = None
+        self.verified = 0
+        self.rejected = 0
+        self.refreshes = 0
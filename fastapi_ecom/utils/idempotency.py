@@ -0,0 +1,253 @@
+import asyncio
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from fastapi import HTTPException, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from sqlalchemy import delete, event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import Session, SessionTransaction
+
+from fastapi_ecom.config import config
+from fastapi_ecom.database import get_async_session
+from fastapi_ecom.database.models.idempotency_key import IdempotencyKey
+from fastapi_ecom.utils.logging_setup import failure, general, warning
+
+# Header carrying the idempotency key of a request
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+
+
+class IdempotentRequest:
+    """
+    Handle on the idempotency key presented by a request to a creating endpoint.
+
+    :ivar replay: Stored response to return instead of processing the request again, or None if
+                  the request has to be processed.
+    """
+
+    def __init__(self, record: IdempotencyKey | None = None, replay: JSONResponse | None = None) -> None:
+        self._record = record
+        self.replay = replay
+
+    @property
+    def active(self) -> bool:
+        """
+        Check whether the response of the request has to be recorded for its idempotency key.
+
+        :return: True if the request claimed an idempotency key else False.
+        """
+        return self._record is not None
+
+    def store(self, status_code: int, body: dict[str, Any]) -> None:
+        """
+        Record the response produced for the request, so that it is committed along with the
+        changes made by the request and replayed to its retries.
+
+        :param status_code: Status code of the response.
+        :param body: Body of the response.
+
+        :return: None
+        """
+        if self._record is None:
+            return
+        self._record.status_code = status_code
+        self._record.response = json.dumps(jsonable_encoder(body))
+
+
+class IdempotencyStore:
+    """
+    Store of the idempotency keys presented to the creating endpoints, backed by the
+    `idempotency_keys` table, so that a client retrying a request is answered with the response of
+    the first attempt instead of creating the resource again.
+
+    The key is claimed by inserting it in a savepoint of the session of the request and its
+    response is committed in the same transaction as the changes made by the request, so either
+    both are kept or neither is. A retry arriving while the first attempt is in flight waits for it
+    to finish; within the process through a future, and across processes on the unique constraint
+    of the key, which PostgreSQL holds until the first attempt commits or rolls back.
+
+    :ivar claimed: Number of keys claimed by a request to be processed.
+    :ivar replayed: Number of requests answered with a stored response.
+    :ivar waited: Number of requests which waited on a request in flight with the same key.
+    :ivar swept: Number of expired keys removed by the sweeper.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[tuple[str, str], asyncio.Future] = {}
+        self.claimed = 0
+        self.replayed = 0
+        self.waited = 0
+        self.swept = 0
+
+    @staticmethod
+    def fingerprint(payload: BaseModel) -> str:
+        """
+        Compute the fingerprint of the body of a request.
+
+        :param payload: The validated body of the request.
+
+        :return: The SHA-256 digest of the serialized body.
+        """
+        return hashlib.sha256(payload.model_dump_json().encode("utf-8")).hexdigest()
+
+    async def _lookup(self, db: AsyncSession, scope: str, key: str) -> tuple[IdempotencyKey, bool] | None:
+        """
+        Look an idempotency key up.
+
+        :param db: Database session of the request.
+        :param scope: Endpoint and principal the key is presented by.
+        :param key: The idempotency key.
+
+        :return: The stored key along with whether it is still live, or None if it is not stored.
+        """
+        now = datetime.now(timezone.utc)
+        query = select(IdempotencyKey, IdempotencyKey.expiry_date > now).where(IdempotencyKey.scope == scope, IdempotencyKey.key == key)
+        result = await db.execute(query)
+        row = result.one_or_none()
+        return (row[0], bool(row[1])) if row else None
+
+    def _replay(self, record: IdempotencyKey, fingerprint: str) -> IdempotentRequest:
+        """
+        Answer a request with the response stored for its idempotency key.
+
+        :param record: The stored key.
+        :param fingerprint: Fingerprint of the body of the request.
+
+        :return: Handle carrying the stored response.
+
+        :raises HTTPException:
+            - If the key was presented with another body before, it raises 422 Unprocessable
+              Entity.
+            - If the response for the key is not stored yet, it raises 409 Conflict.
+        """
+        if record.fingerprint != fingerprint:
+            warning(f"Idempotency key reused with a different request in scope: {record.scope}")
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Idempotency key already used for a different request")
+        if record.response is None:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Request with the same idempotency key in progress - Please try again")
+        self.replayed += 1
+        general(f"Replaying the stored response for an idempotency key in scope: {record.scope}")
+        return IdempotentRequest(
+            replay=JSONResponse(status_code=record.status_code, content=json.loads(record.response), headers={"Idempotent-Replayed": "true"})
+        )
+
+    def _release(self, slot: tuple[str, str], future: asyncio.Future) -> None:
+        """
+        Wake the requests waiting on a request in flight once its transaction is over.
+
+        :param slot: Scope and idempotency key of the request in flight.
+        :param future: The future the requests are waiting on.
+
+        :return: None
+        """
+        if self._inflight.get(slot) is future:
+            del self._inflight[slot]
+        if not future.done():
+            future.set_result(None)
+
+    async def claim(self, request: Request, db: AsyncSession, scope: str, payload: BaseModel) -> IdempotentRequest:
+        """
+        Claim the idempotency key presented by a request, or fetch the response stored for it.
+
+        :param request: The incoming request carrying the `Idempotency-Key` header.
+        :param db: Database session of the request, which commits the changes made by it.
+        :param scope: Endpoint and principal the key is presented by.
+        :param payload: The validated body of the request.
+
+        :return: Handle carrying the stored response to replay, or the handle recording the
+                 response of the request if it has to be processed.
+
+        :raises HTTPException:
+            - If the key was presented with another body before, it raises 422 Unprocessable
+              Entity.
+            - If the request in flight with the same key does not finish in time, it raises 409
+              Conflict.
+        """
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not key:
+            return IdempotentRequest()
+        fingerprint = self.fingerprint(payload)
+        slot = (scope, key)
+        while True:
+            inflight = self._inflight.get(slot)
+            if inflight is not None:
+                self.waited += 1
+                try:
+                    await asyncio.wait_for(asyncio.shield(inflight), config.idemwait)
+                except TimeoutError as expt:
+                    raise HTTPException(
+                        status_code=status.HTTP_409_CONFLICT, detail="Request with the same idempotency key in progress - Please try again"
+                    ) from expt
+                continue
+            stored = await self._lookup(db, scope, key)
+            if stored and stored[1]:
+                return self._replay(stored[0], fingerprint)
+            if slot not in self._inflight:
+                break
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[slot] = future
+        record = IdempotencyKey(
+            scope=scope, key=key, fingerprint=fingerprint, expiry_date=datetime.now(timezone.utc) + timedelta(seconds=config.idemttl)
+        )
+        try:
+            async with db.begin_nested():
+                if stored:
+                    await db.delete(stored[0])  # Expired but not swept yet
+                    await db.flush()
+                db.add(record)
+        except IntegrityError:
+            # Claimed by another process in the meantime, whose transaction is over by now
+            self._release(slot, future)
+            stored = await self._lookup(db, scope, key)
+            if not stored:
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT, detail="Request with the same idempotency key in progress - Please try again"
+                ) from None
+            return self._replay(stored[0], fingerprint)
+
+        def release(session: Session, transaction: SessionTransaction) -> None:
+            if transaction.parent is None:
+                self._release(slot, future)
+
+        event.listen(db.sync_session, "after_transaction_end", release)
+        self.claimed += 1
+        return IdempotentRequest(record=record)
+
+    async def sweep(self) -> int:
+        """
+        Remove the expired idempotency keys.
+
+        :return: Number of keys removed.
+        """
+        async with get_async_session()() as db:
+            result = await db.execute(delete(IdempotencyKey).where(IdempotencyKey.expiry_date <= datetime.now(timezone.utc)))
+            await db.commit()
+        self.swept += result.rowcount
+        return result.rowcount
+
+    async def sweeper(self) -> None:
+        """
+        Remove the expired idempotency keys periodically until cancelled.
+
+        :return: None
+        """
+        while True:
+            await asyncio.sleep(config.idemswep)
+            try:
+                swept = await self.sweep()
+            except Exception as expt:
+                failure(f"Sweeping expired idempotency keys failed: {expt}")
+                continue
+            if swept:
+                general(f"Swept {swept} expired idempotency keys")
+
+
+# Store shared by all the requests of the service.
+idempotency_store = IdempotencyStore()
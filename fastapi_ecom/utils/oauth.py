@@ -3,18 +3,22 @@ from uuid import uuid4
 
 from authlib.integrations.starlette_client import OAuth
 from authlib.oidc.core import UserInfo
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OpenIdConnect
+from httpx import HTTPStatusError
 from pydantic import BaseModel
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
 
 from fastapi_ecom.config import config
 from fastapi_ecom.database.db_setup import get_db
 from fastapi_ecom.database.models.business import Business
 from fastapi_ecom.database.models.customer import Customer
+from fastapi_ecom.utils.id_token import IDTokenVerifier, looks_like_jwt
 from fastapi_ecom.utils.logging_setup import failure, general, success, warning
+from fastapi_ecom.utils.userinfo_cache import userinfo_cache
 
 server_metadata_url = "https://accounts.google.com/.well-known/openid-configuration"
 
@@ -30,6 +34,9 @@ oauth.register(
     client_kwargs={"scope": "openid email profile"},
 )
 
+# Verifier of the ID tokens issued by Google, shared by all the requests of the service.
+id_token_verifier = IDTokenVerifier(oauth.google)
+
 
 class OIDCUser(BaseModel):
     """
@@ -53,12 +60,54 @@ class OIDCUser(BaseModel):
         return cls(**fields)
 
 
+async def fetch_userinfo(token: str) -> OIDCUser | None:
+    """
+    Resolve an access token to its user with the userinfo endpoint of the Google OAuth provider.
+
+    :param token: The OIDC access token.
+
+    :return: The OIDC user object or None if the provider rejects the token.
+
+    :raises Exception: If the provider cannot be reached or fails otherwise.
+    """
+    try:
+        userinfo = await oauth.google.userinfo(token={"access_token": token})
+    except HTTPStatusError as expt:
+        if expt.response.status_code in (status.HTTP_400_BAD_REQUEST, status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN):
+            return None
+        raise
+    return OIDCUser.from_userinfo(userinfo)
+
+
+async def verify_id_token(token: str) -> OIDCUser | None:
+    """
+    Validate an ID token of the Google OAuth provider locally against its cached signing keys.
+
+    :param token: The encoded ID token.
+
+    :return: The authenticated OIDC user object or None if authentication fails.
+    """
+    try:
+        claims = await id_token_verifier.verify(token)
+    except Exception:
+        warning("OAuth ID token validation failed - Signing keys unavailable")
+        return None
+    if not claims:
+        warning("OAuth ID token validation failed")
+        return None
+    success(f"OAuth ID token validated successfully for user: {claims['email']}")
+    return OIDCUser.from_userinfo(claims)
+
+
 async def current_user(token: str = Depends(oidc)) -> OIDCUser | None:
     """
     Extract and validate the current authenticated user from OIDC token.
 
     This function processes the Bearer token from the Authorization header, validates it with
-    the Google OAuth provider, and returns the authenticated user information.
+    the Google OAuth provider, and returns the authenticated user information. The users of the
+    tokens validated recently, and the tokens rejected recently, are served from the userinfo
+    cache without calling the provider again. ID tokens are verified locally instead, when
+    enabled in the configuration.
 
     :param token: Bearer token containing the OIDC access token.
 
@@ -74,13 +123,65 @@ async def current_user(token: str = Depends(oidc)) -> OIDCUser | None:
     if token_type.lower() != "bearer":
         warning("Invalid OAuth token - Non Bearer")
         return None
+    if config.idtoken and looks_like_jwt(token):
+        return await verify_id_token(token)
     try:
-        userinfo = await oauth.google.userinfo(token={"access_token": token})
-        success(f"OAuth token validated successfully for user: {userinfo.get('email')}")
+        oidc_user = await userinfo_cache.fetch(token, fetch_userinfo)
     except Exception:
         warning("OAuth token validation failed")
         return None
-    return OIDCUser.from_userinfo(userinfo)
+    if not oidc_user:
+        warning("OAuth token validation failed - Token rejected by provider")
+        return None
+    success(f"OAuth token validated successfully for user: {oidc_user.email}")
+    return oidc_user
+
+
+def oauth_changes(principal: Customer | Business, oidc: OIDCUser) -> dict[str, str | bool]:
+    """
+    Compute the OAuth information of a customer or a business which differs from the one the OAuth
+    provider reports.
+
+    :param principal: The customer or business object linked to the OAuth user.
+    :param oidc: Authenticated OIDC user object containing user information.
+
+    :return: Dictionary of the attributes to update along with their new values, empty when the
+             record is up to date.
+    """
+    oauth_info = {"oauth_provider": "google", "oauth_id": oidc.sub, "oauth_email": oidc.email, "is_verified": True}
+    return {item: value for item, value in oauth_info.items() if getattr(principal, item) != value}
+
+
+async def create_oauth_principal(db: AsyncSession, model: type[Customer] | type[Business], oidc: OIDCUser) -> Customer | Business | None:
+    """
+    Create a customer or a business for an OAuth user in a single `INSERT ... ON CONFLICT DO
+    NOTHING` statement, so that concurrent first requests of the same user do not fail on the
+    uniqueness of the email address.
+
+    :param db: Database session to create the record with.
+    :param model: The model of the record, either `Customer` or `Business`.
+    :param oidc: Authenticated OIDC user object containing user information.
+
+    :return: The created record or None if a concurrent request created it first.
+    """
+    insert = postgresql_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+    query = (
+        insert(model)
+        .values(
+            email=oidc.email,
+            name=oidc.name,
+            uuid=uuid4().hex[0:8],
+            is_verified=True,  # OAuth emails are pre-verified
+            oauth_provider="google",
+            oauth_id=oidc.sub,
+            oauth_email=oidc.email,
+            created_via_oauth=True,
+        )
+        .on_conflict_do_nothing(index_elements=[model.email])
+        .returning(model)
+    )
+    result = await db.execute(query)
+    return result.scalar_one_or_none()
 
 
 async def verify_oauth_customer_cred(oidc: OIDCUser = Depends(current_user), db: AsyncSession = Depends(get_db)) -> Customer:
@@ -89,8 +190,9 @@ async def verify_oauth_customer_cred(oidc: OIDCUser = Depends(current_user), db:
 
     This function first checks if a customer with the OAuth email exists in the
     regular email column (basic auth users). If found, it updates that record with
-    OAuth information. If not found, it checks for existing OAuth users, and finally
-    creates a new customer record if none exists.
+    OAuth information when it differs from the stored one. If not found, it checks for
+    existing OAuth users, and finally creates a new customer record if none exists.
+    Requests of customers whose records are up to date do not write to the database.
 
     :param oidc: Authenticated OIDC user object containing user information.
     :param db: Database session to query and create customer data.
@@ -102,46 +204,39 @@ async def verify_oauth_customer_cred(oidc: OIDCUser = Depends(current_user), db:
     if not oidc:
         return None
 
-    query = select(Customer).where(Customer.email == oidc.email).options(selectinload("*"))
+    query = select(Customer).where(Customer.email == oidc.email)
     result = await db.execute(query)
     customer_by_email = result.scalar_one_or_none()
     if customer_by_email:
-        general(f"Updating existing customer with OAuth info: {oidc.email}")
-        customer_by_email.oauth_provider = "google"
-        customer_by_email.oauth_id = oidc.sub
-        customer_by_email.oauth_email = oidc.email
-        customer_by_email.is_verified = True
-        customer_by_email.update_date = datetime.now(timezone.utc)
-        db.add(customer_by_email)
-        try:
-            await db.flush()
-        except Exception as expt:  # pragma: no cover
-            # HTTP status code 500 is already tested in other parts of the codebase
-            failure("Failed to update customer details in database due to unexpected error")
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected database error occurred.") from expt
+        changes = oauth_changes(customer_by_email, oidc)
+        if changes:
+            general(f"Updating existing customer with OAuth info: {oidc.email}")
+            for item, value in changes.items():
+                setattr(customer_by_email, item, value)
+            customer_by_email.update_date = datetime.now(timezone.utc)
+            try:
+                await db.flush()
+            except Exception as expt:  # pragma: no cover
+                # HTTP status code 500 is already tested in other parts of the codebase
+                failure("Failed to update customer details in database due to unexpected error")
+                raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected database error occurred.") from expt
     else:
-        query = select(Customer).where(Customer.oauth_email == oidc.email).options(selectinload("*"))
+        query = select(Customer).where(Customer.oauth_email == oidc.email)
         result = await db.execute(query)
         customer_by_email = result.scalar_one_or_none()
         if not customer_by_email:
             general(f"Creating new customer via OAuth: {oidc.email}")
-            customer_by_email = Customer(
-                email=oidc.email,
-                name=oidc.name,
-                uuid=uuid4().hex[0:8],
-                is_verified=True,  # OAuth emails are pre-verified
-                oauth_provider="google",
-                oauth_id=oidc.sub,
-                oauth_email=oidc.email,
-                created_via_oauth=True,
-            )
-            db.add(customer_by_email)
             try:
-                await db.flush()
+                customer_by_email = await create_oauth_principal(db, Customer, oidc)
             except Exception as expt:  # pragma: no cover
                 # HTTP status code 500 is already tested in other parts of the codebase
                 failure("Failed to create customer account in database due to unexpected error")
                 raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected database error occurred.") from expt
+            if not customer_by_email:  # pragma: no cover
+                # Created by a concurrent request of the same customer in the meantime
+                query = select(Customer).where(Customer.email == oidc.email)
+                result = await db.execute(query)
+                customer_by_email = result.scalar_one()
     success(f"Customer OAuth authentication successful: {oidc.email}")
     return customer_by_email
 
@@ -152,8 +247,9 @@ async def verify_oauth_business_cred(oidc: OIDCUser = Depends(current_user), db:
 
     This function first checks if a business with the OAuth email exists in the
     regular email column (basic auth users). If found, it updates that record with
-    OAuth information. If not found, it checks for existing OAuth users, and finally
-    creates a new business record if none exists.
+    OAuth information when it differs from the stored one. If not found, it checks for
+    existing OAuth users, and finally creates a new business record if none exists.
+    Requests of businesses whose records are up to date do not write to the database.
 
     :param oidc: Authenticated OIDC user object containing user information.
     :param db: Database session to query and create business data.
@@ -165,45 +261,62 @@ async def verify_oauth_business_cred(oidc: OIDCUser = Depends(current_user), db:
     if not oidc:
         return None
 
-    query = select(Business).where(Business.email == oidc.email).options(selectinload("*"))
+    query = select(Business).where(Business.email == oidc.email)
     result = await db.execute(query)
     business_by_email = result.scalar_one_or_none()
     if business_by_email:
-        general(f"Updating existing business with OAuth info: {oidc.email}")
-        business_by_email.oauth_provider = "google"
-        business_by_email.oauth_id = oidc.sub
-        business_by_email.oauth_email = oidc.email
-        business_by_email.is_verified = True
-        business_by_email.update_date = datetime.now(timezone.utc)
-        db.add(business_by_email)
-        try:
-            await db.flush()
-        except Exception as expt:  # pragma: no cover
-            # HTTP status code 500 is already tested in other parts of the codebase
-            failure("Failed to update business details in database due to unexpected error")
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected database error occurred.") from expt
+        changes = oauth_changes(business_by_email, oidc)
+        if changes:
+            general(f"Updating existing business with OAuth info: {oidc.email}")
+            for item, value in changes.items():
+                setattr(business_by_email, item, value)
+            business_by_email.update_date = datetime.now(timezone.utc)
+            try:
+                await db.flush()
+            except Exception as expt:  # pragma: no cover
+                # HTTP status code 500 is already tested in other parts of the codebase
+                failure("Failed to update business details in database due to unexpected error")
+                raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected database error occurred.") from expt
     else:
-        query = select(Business).where(Business.oauth_email == oidc.email).options(selectinload("*"))
+        query = select(Business).where(Business.oauth_email == oidc.email)
         result = await db.execute(query)
         business_by_email = result.scalar_one_or_none()
         if not business_by_email:
             general(f"Creating new business via OAuth: {oidc.email}")
-            business_by_email = Business(
-                email=oidc.email,
-                name=oidc.name,
-                uuid=uuid4().hex[0:8],
-                is_verified=True,  # OAuth emails are pre-verified
-                oauth_provider="google",
-                oauth_id=oidc.sub,
-                oauth_email=oidc.email,
-                created_via_oauth=True,
-            )
-            db.add(business_by_email)
             try:
-                await db.flush()
+                business_by_email = await create_oauth_principal(db, Business, oidc)
             except Exception as expt:  # pragma: no cover
                 # HTTP status code 500 is already tested in other parts of the codebase
                 failure("Failed to create business account in database due to unexpected error")
                 raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected database error occurred.") from expt
+            if not business_by_email:  # pragma: no cover
+                # Created by a concurrent request of the same business in the meantime
+                query = select(Business).where(Business.email == oidc.email)
+                result = await db.execute(query)
+                business_by_email = result.scalar_one()
     success(f"Business OAuth authentication successful: {oidc.email}")
     return business_by_email
+
+
+async def oauth_customer(request: Request, db: AsyncSession) -> Customer | None:
+    """
+    Authentication backend resolving the customer of a request via an OAuth bearer token.
+
+    :param request: The incoming request carrying the bearer token.
+    :param db: Database session to query and create customer data.
+
+    :return: The customer object if authentication is successful else returns None.
+    """
+    return await verify_oauth_customer_cred(await current_user(await oidc(request)), db)
+
+
+async def oauth_business(request: Request, db: AsyncSession) -> Business | None:
+    """
+    Authentication backend resolving the business of a request via an OAuth bearer token.
+
+    :param request: The incoming request carrying the bearer token.
+    :param db: Database session to query and create business data.
+
+    :return: The business object if authentication is successful else returns None.
+    """
+    return await verify_oauth_business_cred(await current_user(await oidc(request)), db)
@@ -0,0 +1,155 @@
+import asyncio
+from typing import Any
+
+from sqlalchemy import insert
+
+from fastapi_ecom.config import config
+from fastapi_ecom.database import get_async_session
+from fastapi_ecom.database.models.order import Order
+from fastapi_ecom.database.models.order_details import OrderDetail
+from fastapi_ecom.utils.logging_setup import failure, warning
+
+
+class OrderBatcher:
+    """
+    Group-commit writer coalescing the orders placed concurrently into a single transaction, so
+    that a burst of orders waits on one commit of the database instead of one commit per order.
+
+    The first order submitted opens a batch which is written once the configured window elapses
+    or the batch reaches its maximum size, whichever comes first. All the orders and all their
+    details of a batch are inserted with one multi-row insert per table and committed together. If
+    the transaction of a batch fails, its orders are written again one at a time, so that only the
+    callers whose orders are at fault get an error.
+
+    :ivar batches: Number of batches committed.
+    :ivar orders: Number of orders committed as part of a batch.
+    :ivar retries: Number of batches whose orders had to be written again one at a time.
+    """
+
+    def __init__(self) -> None:
+        self._pending: list[tuple[dict[str, Any], list[dict[str, Any]], asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._writers: set[asyncio.Task] = set()
+        self.batches = 0
+        self.orders = 0
+        self.retries = 0
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Check whether the orders are to be written in batches.
+
+        :return: True if a batching window is configured else False.
+        """
+        return config.ordbwin > 0
+
+    async def submit(self, order: dict[str, Any], details: list[dict[str, Any]]) -> None:
+        """
+        Submit an order to the next batch and wait until it is committed.
+
+        :param order: Row of the order to insert.
+        :param details: Rows of the details of the order to insert.
+
+        :return: None
+
+        :raises Exception: Re-raises the error which prevented the order from being committed.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((order, details, future))
+        if len(self._pending) >= config.ordbmax:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(config.ordbwin / 1000, self._flush)
+        await future
+
+    def _flush(self) -> None:
+        """
+        Close the batch being filled and write it in the background.
+
+        :return: None
+        """
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            writer = asyncio.create_task(self._write(batch))
+            self._writers.add(writer)
+            writer.add_done_callback(self._writers.discard)
+
+    async def _commit(self, batch: list[tuple[dict[str, Any], list[dict[str, Any]], asyncio.Future]]) -> None:
+        """
+        Insert the orders of a batch along with all their details in one transaction.
+
+        :param batch: Rows of the orders and of their details along with the futures of their
+                      callers.
+
+        :return: None
+        """
+        async with get_async_session()() as db:
+            await db.execute(insert(Order), [order for order, _details, _future in batch])
+            details = [detail for _order, details, _future in batch for detail in details]
+            if details:
+                await db.execute(insert(OrderDetail), details)
+            await db.commit()
+
+    async def _write(self, batch: list[tuple[dict[str, Any], list[dict[str, Any]], asyncio.Future]]) -> None:
+        """
+        Write a batch and settle the futures of its callers.
+
+        :param batch: Rows of the orders and of their details along with the futures of their
+                      callers.
+
+        :return: None
+        """
+        try:
+            await self._commit(batch)
+        except Exception as expt:
+            if len(batch) == 1:
+                failure(f"Order batch failed for order: {batch[0][0]['uuid']}")
+                if not batch[0][2].done():
+                    batch[0][2].set_exception(expt)
+                return
+            warning(f"Order batch of {len(batch)} orders failed - Writing them one at a time")
+            self.retries += 1
+            for entry in batch:
+                await self._write([entry])
+            return
+        self.batches += 1
+        self.orders += len(batch)
+        for _order, _details, future in batch:
+            if not future.done():
+                future.set_result(None)
+
+    async def drain(self) -> None:
+        """
+        Write the batch being filled and wait for all the batches in flight to be committed.
+
+        :return: None
+        """
+        self._flush()
+        if self._writers:
+            await asyncio.gather(*self._writers, return_exceptions=True)
+
+    def report(self) -> dict[str, int | float]:
+        """
+        Report the usage of the batcher.
+
+        :return: Dictionary containing the window and maximum size of the batches along with the
+                 orders waiting for the next batch, the batches and orders committed and the
+                 batches written again one order at a time.
+        """
+        return {
+            "window": config.ordbwin,
+            "max_batch": config.ordbmax,
+            "pending": len(self._pending),
+            "batches": self.batches,
+            "orders": self.orders,
+            "retries": self.retries,
+            "average_batch": self.orders / self.batches if self.batches else 0.0,
+        }
+
+
+# Batcher shared by all the requests of the service.
+order_batcher = OrderBatcher()
@@ -0,0 +1,124 @@
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from typing import Any
+
+from fastapi import HTTPException, status
+from sqlalchemy import ColumnElement, Select, and_, or_
+from sqlalchemy.orm import InstrumentedAttribute
+
+from fastapi_ecom.config import config
+from fastapi_ecom.utils.logging_setup import warning
+
+
+def encode_cursor(last_id: int, rank: float | None = None) -> str:
+    """
+    Encode the position after the last record of a page into an opaque cursor.
+
+    :param last_id: ID of the last record of the page.
+    :param rank: Relevance of the last record of the page, if the records are ranked.
+
+    :return: The URL safe cursor pointing after the record.
+    """
+    position = {"id": last_id} if rank is None else {"id": last_id, "rank": rank}
+    return base64.urlsafe_b64encode(json.dumps(position).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, ranked: bool = False) -> tuple[int, float | None]:
+    """
+    Decode an opaque cursor into the position it points after.
+
+    :param cursor: The cursor returned as `next_cursor` by the previous page.
+    :param ranked: Whether the cursor has to carry the relevance of the record, i.e. whether it
+                   was returned by a page of ranked records.
+
+    :return: ID of the last record of the previous page along with its relevance, if ranked.
+
+    :raises HTTPException: If the cursor is malformed, it raises 422 Unprocessable Entity.
+    """
+    try:
+        position = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        last_id, rank = position["id"], position["rank"] if ranked else None
+    except (binascii.Error, UnicodeDecodeError, ValueError, TypeError, KeyError) as expt:
+        warning(f"Rejected malformed pagination cursor: {cursor}")
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Invalid pagination cursor") from expt
+    if not isinstance(last_id, int) or isinstance(last_id, bool) or (ranked and (not isinstance(rank, int | float) or isinstance(rank, bool))):
+        warning(f"Rejected malformed pagination cursor: {cursor}")
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Invalid pagination cursor")
+    return last_id, rank
+
+
+def check_skip(skip: int) -> None:
+    """
+    Reject skipping more records than the configured cap, as the skipped records are read and
+    discarded.
+
+    :param skip: Number of records to skip.
+
+    :return: None
+
+    :raises HTTPException: If more records than the configured cap are skipped, it raises 422
+                           Unprocessable Entity.
+    """
+    if skip > config.skipmax:
+        warning(f"Rejected pagination skipping {skip} records")
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Cannot skip more than {config.skipmax} records - Paginate with the cursor instead",
+        )
+
+
+def paginate(query: Select, column: InstrumentedAttribute, cursor: str | None, skip: int, limit: int, rank: ColumnElement | None = None) -> Select:
+    """
+    Restrict a query to one page of records ordered on their ID, or on their relevance first if
+    they are ranked.
+
+    A page following a cursor seeks directly past the last record of the previous page on the
+    index of the ID, whatever the depth of the page. The legacy `skip` reads and discards the
+    records it skips, so it is capped to the configured number of records. One record more than
+    the page holds is fetched to tell whether a next page exists.
+
+    :param query: The query selecting the records to paginate.
+    :param column: The ID column the records are ordered and sought on.
+    :param cursor: The cursor returned as `next_cursor` by the previous page, if any.
+    :param skip: Number of records to skip past the cursor, or from the start without a cursor.
+    :param limit: Maximum number of records in the page.
+    :param rank: Relevance of the records, higher first, if they are ranked. The ties are ordered on
+                 the ID.
+
+    :return: The query restricted to the page.
+
+    :raises HTTPException:
+        - If the cursor is malformed, it raises 422 Unprocessable Entity.
+        - If more records than the configured cap are skipped, it raises 422 Unprocessable Entity.
+    """
+    check_skip(skip)
+    if cursor is not None:
+        last_id, last_rank = decode_cursor(cursor, ranked=rank is not None)
+        if rank is None:
+            query = query.where(column > last_id)
+        else:
+            query = query.where(or_(rank < last_rank, and_(rank == last_rank, column > last_id)))
+    query = query.order_by(column) if rank is None else query.order_by(rank.desc(), column)
+    if skip:
+        query = query.offset(skip)
+    return query.limit(limit + 1)
+
+
+def next_page(records: Sequence[Any], limit: int, ranked: bool = False) -> tuple[Sequence[Any], str | None]:
+    """
+    Split the records fetched for a page from the one telling whether a next page exists.
+
+    :param records: The records fetched by a query restricted with `paginate()`. Ranked records
+                    are rows of the record along with its relevance.
+    :param limit: Maximum number of records in the page.
+    :param ranked: Whether the records are ranked.
+
+    :return: The records of the page along with the cursor of the next page, or None if it is the
+             last page.
+    """
+    if len(records) <= limit:
+        return records, None
+    last = records[limit - 1]
+    return records[:limit], encode_cursor(last[0].id, last[1]) if ranked else encode_cursor(last.id)
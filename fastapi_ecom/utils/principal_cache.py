@@ -0,0 +1,166 @@
+import hashlib
+import hmac
+import secrets
+from collections import OrderedDict
+from time import monotonic
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastapi_ecom.config import config
+from fastapi_ecom.database.models.business import Business
+from fastapi_ecom.database.models.customer import Customer
+
+
+def token_kind(kind: str) -> str:
+    """
+    Name the kind under which the principals authenticated via signed tokens are cached, apart
+    from those authenticated via HTTP Basic Authentication.
+
+    :param kind: Kind of the principal, either "business" or "customer".
+
+    :return: The kind of the entries of the principals authenticated via signed tokens.
+    """
+    return f"{kind}:token"
+
+
+class PrincipalCache:
+    """
+    Bounded LRU cache of the principals authenticated via HTTP Basic Authentication or signed
+    tokens, so that a client sending many requests is not looked up in the database, and verified
+    with bcrypt, for every single one of them.
+
+    The principals are keyed on their kind and the email address or UUID they authenticated with,
+    along with a keyed digest of the secret they presented, i.e. their password or the version of
+    their credentials. The digest is computed with HMAC-SHA256 under a random key which never
+    leaves the process, so no password is kept in plain text, and is compared in constant time.
+    The entries expire after the configured time to live and are invalidated explicitly when their
+    account is changed or removed.
+
+    :ivar hits: Number of authentications served from the cache.
+    :ivar misses: Number of authentications which had to be verified against the database.
+    :ivar generation: Counter bumped on every invalidation, so that an authentication verified
+                      against the database before an invalidation does not populate the cache.
+    """
+
+    def __init__(self) -> None:
+        self._key = secrets.token_bytes(32)
+        self._entries: OrderedDict[tuple[str, str], tuple[bytes, Business | Customer, float]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+
+    def _digest(self, secret: str) -> bytes:
+        """
+        Compute the keyed digest of a secret.
+
+        :param secret: The plain text password or the version of the credentials.
+
+        :return: The HMAC-SHA256 digest of the secret under the key of the process.
+        """
+        return hmac.new(self._key, secret.encode("utf-8"), hashlib.sha256).digest()
+
+    def get(self, kind: str, ident: str, secret: str) -> Business | Customer | None:
+        """
+        Fetch a principal which authenticated recently with the same credentials.
+
+        :param kind: Kind of the principal, either "business" or "customer".
+        :param ident: Email address or UUID the principal authenticates with.
+        :param secret: Password or version of the credentials the principal authenticates with.
+
+        :return: The cached principal if the credentials match a live entry else None.
+        """
+        if config.authcttl <= 0:
+            return None
+        entry = self._entries.get((kind, ident))
+        if entry is not None and entry[2] < monotonic():
+            self._entries.pop((kind, ident), None)
+            entry = None
+        if entry is None or not hmac.compare_digest(entry[0], self._digest(secret)):
+            self.misses += 1
+            return None
+        self._entries.move_to_end((kind, ident))
+        self.hits += 1
+        return entry[1]
+
+    def put(self, kind: str, ident: str, secret: str, principal: Business | Customer, generation: int) -> None:
+        """
+        Remember a principal which has just been authenticated against the database.
+
+        :param kind: Kind of the principal, either "business" or "customer".
+        :param ident: Email address or UUID the principal authenticated with.
+        :param secret: Password or version of the credentials the principal authenticated with.
+        :param principal: The authenticated principal.
+        :param generation: Value of `generation` read before the principal was looked up; the
+                           principal is not cached if an invalidation happened in the meantime.
+
+        :return: None
+        """
+        if config.authcttl <= 0 or generation != self.generation:
+            return
+        self._entries[(kind, ident)] = (self._digest(secret), principal, monotonic() + config.authcttl)
+        self._entries.move_to_end((kind, ident))
+        while len(self._entries) > config.authcsze:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, kind: str, *idents: str) -> None:
+        """
+        Forget the principal authenticating with any of the email addresses or UUIDs, via HTTP
+        Basic Authentication and signed tokens alike.
+
+        :param kind: Kind of the principal, either "business" or "customer".
+        :param idents: Email addresses or UUIDs the principal authenticates with.
+
+        :return: None
+        """
+        self.generation += 1
+        for ident in idents:
+            self._entries.pop((kind, ident), None)
+            self._entries.pop((token_kind(kind), ident), None)
+
+    def invalidate_on_commit(self, db: AsyncSession, kind: str, *idents: str) -> None:
+        """
+        Forget the principal authenticating with any of the email addresses or UUIDs now and once
+        more when the transaction changing or removing its account commits, so that an
+        authentication reading the account before the commit cannot keep the former state cached.
+
+        :param db: Database session changing or removing the account.
+        :param kind: Kind of the principal, either "business" or "customer".
+        :param idents: Email addresses or UUIDs the principal authenticates with.
+
+        :return: None
+        """
+        self.invalidate(kind, *idents)
+        event.listen(db.sync_session, "after_commit", lambda session: self.invalidate(kind, *idents), once=True)
+
+    def report(self) -> dict[str, int | float]:
+        """
+        Report the usage of the cache.
+
+        :return: Dictionary containing the size, capacity and time to live of the cache along with
+                 its hits, misses and hit rate.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "capacity": config.authcsze,
+            "ttl": config.authcttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """
+        Forget all the principals and reset the counters.
+
+        :return: None
+        """
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.generation += 1
+
+
+# Cache shared by all the requests of the service.
+principal_cache = PrincipalCache()
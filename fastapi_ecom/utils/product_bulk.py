@@ -0,0 +1,162 @@
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy import ColumnElement, case, cast, column, delete, func, literal, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastapi_ecom.config import config
+from fastapi_ecom.database.models.product import Product
+from fastapi_ecom.database.pydantic_schemas.product import ProductUpdate
+
+# Attributes of the products which can be changed in bulk
+BULK_FIELDS = ["name", "description", "category", "mfg_date", "exp_date", "price"]
+
+
+def product_changes(product: ProductUpdate) -> dict[str, Any]:
+    """
+    Pick the changes made to a product out of an update, leaving out the fields holding their
+    default.
+
+    :param product: The update of the product.
+
+    :return: The changes, keyed on the attributes of the product.
+    """
+    changes = {item: getattr(product, item) for item in ["name", "description", "category"] if getattr(product, item) != ""}
+    # The dates left out of the request keep their default, which is not validated into a datetime
+    changes.update(
+        {
+            item: getattr(product, item)
+            for item in ["mfg_date", "exp_date"]
+            if item in product.model_fields_set and str(getattr(product, item)) != "1900-01-01 00:00:00+00:00"
+        }
+    )
+    if product.price != 0.0:
+        changes["price"] = product.price
+    return changes
+
+
+def _chunks(items: list, size: int) -> list[list]:
+    return [items[start : start + size] for start in range(0, len(items), size)]
+
+
+def _values_update(business_id: str, chunk: list[tuple[str, dict[str, Any]]], fields: list[str]) -> Any:
+    """
+    Build the statement changing a chunk of products joined to a `VALUES` list of their changes,
+    the attributes left unchanged for a product being `NULL` in its row.
+
+    :param business_id: UUID of the business owning the products.
+    :param chunk: The UUIDs of the products along with their changes.
+    :param fields: The attributes changed for any of the products.
+
+    :return: The statement, returning the UUIDs of the products changed.
+    """
+    table = Product.__table__
+    names = {field: getattr(Product, field).property.columns[0].name for field in ["uuid", *fields]}
+    rows = values(*[column(name, table.c[name].type) for name in names.values()], name="changes")
+    rows = rows.data([(uuid, *[changes.get(field) for field in fields]) for uuid, changes in chunk])
+    # Cast the changes, as a column of the list holding nothing but NULL is typed as text
+    changes = {
+        field: func.coalesce(cast(rows.c[names[field]], table.c[names[field]].type), getattr(Product, field)) for field in fields
+    }
+    return (
+        update(Product)
+        .where(Product.uuid == rows.c.uuid, Product.business_id == business_id)
+        .values(**changes, version=Product.version + 1, update_date=datetime.now(timezone.utc))
+        .returning(Product.uuid)
+    )
+
+
+def _case_update(business_id: str, chunk: list[tuple[str, dict[str, Any]]], fields: list[str]) -> Any:
+    """
+    Build the statement changing a chunk of products with a `CASE` on their UUID per attribute, for
+    the databases which cannot join an `UPDATE` to a `VALUES` list.
+
+    :param business_id: UUID of the business owning the products.
+    :param chunk: The UUIDs of the products along with their changes.
+    :param fields: The attributes changed for any of the products.
+
+    :return: The statement, returning the UUIDs of the products changed.
+    """
+    changes = {}
+    for field in fields:
+        attribute = getattr(Product, field)
+        whens = {uuid: literal(item[field], attribute.type) for uuid, item in chunk if field in item}
+        changes[field] = case(whens, value=Product.uuid, else_=attribute)
+    return (
+        update(Product)
+        .where(Product.uuid.in_([uuid for uuid, _ in chunk]), Product.business_id == business_id)
+        .values(**changes, version=Product.version + 1, update_date=datetime.now(timezone.utc))
+        .returning(Product.uuid)
+    )
+
+
+async def bulk_update_products(db: AsyncSession, business_id: str, items: list[tuple[str, dict[str, Any]]]) -> list[str]:
+    """
+    Change many products of a business, each with its own changes, a chunk at a time.
+
+    Every chunk is changed with a single statement; on PostgreSQL, it joins the products to a
+    `VALUES` list of their changes, and elsewhere, it picks the changes with a `CASE` on the UUID
+    of the products. The version of every product changed is bumped.
+
+    :param db: Active asynchronous database session.
+    :param business_id: UUID of the business owning the products.
+    :param items: The UUIDs of the products along with their changes, keyed on their attributes.
+
+    :return: The UUIDs of the products changed, leaving out those which the business does not own.
+    """
+    build = _values_update if db.bind.dialect.name == "postgresql" else _case_update
+    changed = []
+    for chunk in _chunks(items, config.bulkbat):
+        fields = [field for field in BULK_FIELDS if any(field in changes for _, changes in chunk)]
+        changed.extend((await db.execute(build(business_id, chunk, fields))).scalars())
+    return changed
+
+
+async def bulk_update_matching(db: AsyncSession, business_id: str, filters: list[ColumnElement], changes: dict[str, Any]) -> int:
+    """
+    Apply the same changes to all the products of a business matching the filters, with a single
+    statement.
+
+    :param db: Active asynchronous database session.
+    :param business_id: UUID of the business owning the products.
+    :param filters: The conditions selecting the products.
+    :param changes: The changes, keyed on the attributes of the products.
+
+    :return: The number of products changed.
+    """
+    query = (
+        update(Product)
+        .where(Product.business_id == business_id, *filters)
+        .values(**changes, version=Product.version + 1, update_date=datetime.now(timezone.utc))
+    )
+    return (await db.execute(query)).rowcount
+
+
+async def bulk_delete_products(db: AsyncSession, business_id: str, uuids: list[str]) -> list[str]:
+    """
+    Delete many products of a business, a chunk of UUIDs per statement.
+
+    :param db: Active asynchronous database session.
+    :param business_id: UUID of the business owning the products.
+    :param uuids: The UUIDs of the products.
+
+    :return: The UUIDs of the products deleted, leaving out those which the business does not own.
+    """
+    deleted = []
+    for chunk in _chunks(uuids, config.bulkbat):
+        query = delete(Product).where(Product.uuid.in_(chunk), Product.business_id == business_id).returning(Product.uuid)
+        deleted.extend((await db.execute(query)).scalars())
+    return deleted
+
+
+async def bulk_delete_matching(db: AsyncSession, business_id: str, filters: list[ColumnElement]) -> int:
+    """
+    Delete all the products of a business matching the filters, with a single statement.
+
+    :param db: Active asynchronous database session.
+    :param business_id: UUID of the business owning the products.
+    :param filters: The conditions selecting the products.
+
+    :return: The number of products deleted.
+    """
+    return (await db.execute(delete(Product).where(Product.business_id == business_id, *filters))).rowcount
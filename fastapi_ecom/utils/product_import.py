@@ -0,0 +1,243 @@
+import codecs
+import csv
+import json
+import secrets
+from collections.abc import AsyncIterator
+from datetime import datetime, timezone
+from typing import Any
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from fastapi_ecom.config import config
+from fastapi_ecom.database.models.product import Product
+from fastapi_ecom.database.pydantic_schemas.product import ProductCreate
+from fastapi_ecom.utils.logging_setup import warning
+
+# Media types of the formats the products can be imported from
+IMPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+# Attributes of the products written by an import, in the order of the records loaded
+IMPORT_FIELDS = ["name", "description", "category", "mfg_date", "exp_date", "price", "business_id", "creation_date", "update_date", "uuid"]
+
+# Columns of the products table the attributes are stored in
+IMPORT_COLUMNS = [getattr(Product, field).property.columns[0].name for field in IMPORT_FIELDS]
+
+
+def _too_long(number: int, what: str) -> HTTPException:
+    """
+    Reject an import holding a line or a record longer than the configured limit.
+
+    :param number: The number of the line or of the first line of the record.
+    :param what: What is too long, either "Line" or "Record".
+
+    :return: The exception answering 422 Unprocessable Entity.
+    """
+    warning(f"Rejected product import whose {what.lower()} {number} is longer than {config.imptlmax} characters")
+    return HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"{what} {number} is longer than {config.imptlmax} characters")
+
+
+async def _lines(stream: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, str]]:
+    """
+    Split a stream of bytes encoded with UTF-8 into lines, holding no more than one line at a time.
+
+    :param stream: The chunks of the body of the request.
+
+    :yield: The number of each line, starting at 1, along with the line without its line break.
+
+    :raises HTTPException:
+        - If the stream is not valid UTF-8, it raises 422 Unprocessable Entity.
+        - If a line is longer than the configured limit, it raises 422 Unprocessable Entity.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer, number = "", 0
+    try:
+        async for chunk in stream:
+            buffer += decoder.decode(chunk)
+            *lines, buffer = buffer.split("\n")
+            for line in lines:
+                number += 1
+                if len(line) > config.imptlmax:
+                    raise _too_long(number, "Line")
+                yield number, line.removesuffix("\r")
+            if len(buffer) > config.imptlmax:
+                raise _too_long(number + 1, "Line")
+        buffer += decoder.decode(b"", final=True)
+    except UnicodeDecodeError as expt:
+        warning(f"Rejected product import which is not valid UTF-8 after line {number}")
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="The upload is not valid UTF-8") from expt
+    if buffer.strip():
+        yield number + 1, buffer.removesuffix("\r")
+
+
+async def _ndjson_rows(stream: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, dict[str, Any] | str]]:
+    """
+    Parse a stream of NDJSON into one object per line, skipping the blank lines.
+
+    :param stream: The chunks of the body of the request.
+
+    :yield: The number of each line along with its object, or the reason it could not be parsed.
+    """
+    async for number, line in _lines(stream):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            yield number, "Line is not valid JSON"
+            continue
+        yield number, row if isinstance(row, dict) else "Line is not a JSON object"
+
+
+async def _csv_rows(stream: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, dict[str, Any] | str]]:
+    """
+    Parse a stream of CSV with a header into one object per record, skipping the blank lines.
+
+    A record spans several lines as long as one of its quoted fields is left open, i.e. as long as
+    it holds an odd number of quotes, so that no more than one record is held at a time.
+
+    :param stream: The chunks of the body of the request.
+
+    :yield: The number of the first line of each record along with its object keyed on the header,
+            or the reason it could not be parsed.
+
+    :raises HTTPException:
+        - If the header lacks a field of the products, it raises 422 Unprocessable Entity.
+        - If a record is longer than the configured limit, it raises 422 Unprocessable Entity.
+    """
+    header, record, first, length = None, [], 0, 0
+    async for number, line in _lines(stream):
+        if not record:
+            if not line.strip():
+                continue
+            first, length = number, 0
+        record.append(line)
+        length += len(line) + 1
+        if length > config.imptlmax:
+            raise _too_long(first, "Record")
+        if sum(part.count('"') for part in record) % 2:
+            continue
+        fields = next(csv.reader(["\n".join(record)]))
+        record = []
+        if header is None:
+            header = [field.strip() for field in fields]
+            missing = [field for field in ProductCreate.model_fields if field not in header]
+            if missing:
+                warning(f"Rejected product import whose CSV header lacks {missing}")
+                raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=f"The CSV header lacks the fields: {', '.join(missing)}")
+            continue
+        if len(fields) != len(header):
+            yield first, f"Record holds {len(fields)} fields instead of {len(header)}"
+            continue
+        yield first, dict(zip(header, fields, strict=True))
+    if record:
+        yield first, "Record ends within a quoted field"
+
+
+async def _fresh_uuids(db: AsyncSession, count: int) -> list[str]:
+    """
+    Draw UUIDs for a chunk of products, none of which is taken by a product already stored, the
+    ones loaded earlier in the import included, or by another product of the chunk.
+
+    The UUIDs of the products are 8 hexadecimal characters, so that tens of thousands of them drawn
+    at once are likely to hit a few taken ones, which are drawn again.
+
+    :param db: Active asynchronous database session.
+    :param count: Number of UUIDs to draw.
+
+    :return: The UUIDs drawn.
+    """
+    fresh: set[str] = set()
+    while len(fresh) < count:
+        drawn = {secrets.token_hex(4) for _ in range(count - len(fresh))} - fresh
+        taken = set((await db.execute(select(Product.uuid).where(Product.uuid.in_(drawn)))).scalars())
+        fresh |= drawn - taken
+    return list(fresh)
+
+
+async def _load(db: AsyncSession, records: list[tuple]) -> None:
+    """
+    Load a chunk of products into the products table, drawing their UUIDs.
+
+    On PostgreSQL, the records are copied with the binary `COPY` protocol of asyncpg, which spares
+    parsing and planning an `INSERT` for them. Elsewhere, they are inserted with a multi-row
+    `INSERT`.
+
+    :param db: Active asynchronous database session.
+    :param records: The records of the products, holding the attributes in `IMPORT_FIELDS` but the
+                    UUID.
+
+    :return: None
+    """
+    records = [(*record, uuid) for record, uuid in zip(records, await _fresh_uuids(db, len(records)), strict=True)]
+    if db.bind.dialect.driver == "asyncpg":
+        connection = await (await db.connection()).get_raw_connection()
+        await connection.driver_connection.copy_records_to_table(Product.__tablename__, records=records, columns=IMPORT_COLUMNS)
+        db.sync_session.info["has_writes"] = True  # Written behind the back of the session
+    else:
+        await db.execute(insert(Product), [dict(zip(IMPORT_FIELDS, record, strict=True)) for record in records])
+
+
+async def import_products(db: AsyncSession, stream: AsyncIterator[bytes], fmt: str, business_id: str) -> dict[str, Any]:
+    """
+    Import the products of a business from a stream of NDJSON or CSV rows adhering to the
+    `ProductCreate` schema.
+
+    The rows are parsed as they arrive, validated one by one and loaded a chunk at a time, so that
+    the memory used does not grow with the size of the upload. The rows failing to parse or to
+    validate are left out and reported, up to the configured number of errors, while the others
+    are loaded in the transaction of the session.
+
+    :param db: Active asynchronous database session.
+    :param stream: The chunks of the body of the request.
+    :param fmt: Format of the rows, either "ndjson" or "csv".
+    :param business_id: UUID of the business the products are imported for.
+
+    :return: Dictionary containing the numbers of products imported and of rows left out along
+             with the errors of the rows left out.
+
+    :raises HTTPException: If the upload cannot be parsed at all, it raises 422 Unprocessable Entity.
+    """
+    rows = _ndjson_rows(stream) if fmt == "ndjson" else _csv_rows(stream)
+    report: dict[str, Any] = {"imported": 0, "failed": 0, "errors": []}
+    chunk: list[tuple] = []
+
+    def fail(line: int, detail: str) -> None:
+        report["failed"] += 1
+        if len(report["errors"]) < config.impterrs:
+            report["errors"].append({"line": line, "detail": detail})
+
+    async for line, row in rows:
+        if isinstance(row, str):
+            fail(line, row)
+            continue
+        try:
+            product = ProductCreate.model_validate(row)
+        except ValidationError as expt:
+            fail(line, "; ".join(f"{'.'.join(map(str, error['loc']))}: {error['msg']}" for error in expt.errors()))
+            continue
+        now = datetime.now(timezone.utc)
+        chunk.append(
+            (
+                product.name.strip(),
+                product.description.strip(),
+                product.category.strip(),
+                product.mfg_date.date(),
+                product.exp_date.date(),
+                product.price,
+                business_id,
+                now,
+                now,
+            )
+        )
+        if len(chunk) >= config.imptbat:
+            await _load(db, chunk)
+            report["imported"] += len(chunk)
+            chunk = []
+    if chunk:
+        await _load(db, chunk)
+        report["imported"] += len(chunk)
+    return report
@@ -0,0 +1,195 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from time import monotonic
+from typing import Any
+from urllib.parse import urlencode
+
+from fastapi import Request, Response, status
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastapi_ecom.config import config
+from fastapi_ecom.database.routing import client_key, sticky_writes
+from fastapi_ecom.utils.etag import content_etag, if_none_match
+
+
+class ResponseCacheBackend(ABC):
+    """
+    Storage of the encoded responses of the response cache, which other backends, e.g. one shared
+    by the processes of the service, implement the same methods of.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> tuple[bytes, str] | None:
+        """
+        Fetch a live response.
+
+        :param key: Key of the response.
+
+        :return: The encoded body of the response along with its entity tag, or None if it is
+                 missing or expired.
+        """
+
+    @abstractmethod
+    async def set(self, key: str, body: bytes, etag: str, ttl: float) -> None:
+        """
+        Store a response.
+
+        :param key: Key of the response.
+        :param body: The encoded body of the response.
+        :param etag: The entity tag of the response.
+        :param ttl: Seconds for which the response is live.
+
+        :return: None
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """
+        Forget all the responses.
+
+        :return: None
+        """
+
+
+class MemoryBackend(ResponseCacheBackend):
+    """
+    Bounded LRU storage of the encoded responses in the memory of the process, whose entries
+    expire after their time to live.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[str, tuple[bytes, str, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> tuple[bytes, str] | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[2] < monotonic():
+            self._entries.pop(key, None)
+            return None
+        self._entries.move_to_end(key)
+        return entry[0], entry[1]
+
+    async def set(self, key: str, body: bytes, etag: str, ttl: float) -> None:
+        self._entries[key] = (body, etag, monotonic() + ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > config.rspcsze:
+            self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+
+class ResponseCache:
+    """
+    Cache of the encoded responses of the public endpoints listing the catalog, so that the same
+    page is neither queried from the database nor serialized again for every client asking for it.
+
+    The responses are keyed on the path and the query parameters of the request along with the
+    version of the catalog, which the endpoints changing the products or the businesses bump when
+    their transaction commits; the responses cached before are then never served again and age
+    out of the backend. As the version is held by the process, the changes made by the other
+    processes of the service show up once the responses expire. Every response carries the entity
+    tag of its body, and a request already holding it is answered with 304 Not Modified. A client
+    which has just written reads its own writes from the primary database, bypassing the cache.
+
+    :ivar version: Version of the catalog, bumped on every change.
+    :ivar hits: Number of responses served from the cache.
+    :ivar misses: Number of responses which had to be built.
+    """
+
+    def __init__(self, backend: ResponseCacheBackend | None = None) -> None:
+        self.backend = backend or MemoryBackend()
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _bypass(request: Request) -> bool:
+        return config.rspcttl <= 0 or sticky_writes.is_sticky(client_key(request))
+
+    def _key(self, request: Request) -> str:
+        return f"{self.version}:{request.url.path}?{urlencode(sorted(request.query_params.multi_items()))}"
+
+    @staticmethod
+    def _respond(request: Request, body: bytes, etag: str) -> Response:
+        if if_none_match(request, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+        return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+    async def lookup(self, request: Request) -> Response | None:
+        """
+        Fetch the response cached for a request.
+
+        :param request: The incoming request.
+
+        :return: The cached response, or 304 Not Modified if the request already holds it, or None
+                 if it has to be built.
+        """
+        if self._bypass(request):
+            return None
+        # Key the response on the version read before the catalog is, as a change may commit meanwhile
+        request.state.response_cache_key = self._key(request)
+        entry = await self.backend.get(request.state.response_cache_key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return self._respond(request, *entry)
+
+    async def store(self, request: Request, schema: type[BaseModel], result: dict[str, Any]) -> Response:
+        """
+        Encode the response built for a request and cache it, if it was looked up in the cache.
+
+        :param request: The incoming request, looked up with `lookup()` beforehand.
+        :param schema: The response model of the endpoint, which the result is validated against.
+        :param result: The result built by the endpoint.
+
+        :return: The encoded response, or 304 Not Modified if the request already holds it.
+        """
+        body = schema.model_validate(result).model_dump_json().encode("utf-8")
+        etag = content_etag(body)
+        key = getattr(request.state, "response_cache_key", None)
+        if key is not None:
+            await self.backend.set(key, body, etag, config.rspcttl)
+        return self._respond(request, body, etag)
+
+    def bump(self) -> None:
+        """
+        Bump the version of the catalog, so that none of the responses cached before is served.
+
+        :return: None
+        """
+        self.version += 1
+
+    def bump_on_commit(self, db: AsyncSession) -> None:
+        """
+        Bump the version of the catalog now and once more when the transaction changing it commits,
+        so that a response built from the catalog read before the commit cannot stay cached.
+
+        :param db: Database session changing the catalog.
+
+        :return: None
+        """
+        self.bump()
+        event.listen(db.sync_session, "after_commit", lambda session: self.bump(), once=True)
+
+    async def clear(self) -> None:
+        """
+        Forget all the responses and reset the counters.
+
+        :return: None
+        """
+        await self.backend.clear()
+        self.hits = 0
+        self.misses = 0
+        self.bump()
+
+
+# Cache shared by all the requests of the service.
+response_cache = ResponseCache()
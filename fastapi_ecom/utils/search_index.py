@@ -0,0 +1,300 @@
+import asyncio
+import heapq
+import math
+import re
+from collections import Counter
+from typing import Any, NamedTuple
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+from sqlalchemy.orm import Session
+
+from fastapi_ecom.config import config
+from fastapi_ecom.database import get_async_session
+from fastapi_ecom.database.models.product import Product
+from fastapi_ecom.database.pydantic_schemas.product import ProductView
+from fastapi_ecom.utils.logging_setup import failure, general
+from fastapi_ecom.utils.pagination import check_skip, decode_cursor
+
+# Weight of the occurrences of a term in each field of a product, the name weighing the most
+FIELD_WEIGHTS = {"name": 3.0, "category": 2.0, "description": 1.0}
+
+# Saturation of the term frequency and normalization of the length of the products for BM25
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def tokenize(text: str) -> list[str]:
+    """
+    Split a text into the terms it is indexed and searched by.
+
+    The words are lowercased and a trailing plural `s` is dropped, so that a search for `lamps`
+    finds a `lamp` and the other way around.
+
+    :param text: The text to split.
+
+    :return: The terms of the text, in order.
+    """
+    return [word[:-1] if len(word) > 3 and word.endswith("s") and not word.endswith("ss") else word for word in re.findall(r"\w+", text.lower())]
+
+
+class IndexedProduct(NamedTuple):
+    """
+    Product held by the search index.
+
+    :ivar id: ID of the product, which the ties in relevance are ordered on.
+    :ivar view: The product serialized using the `ProductView` schema.
+    """
+
+    id: int
+    view: dict[str, Any]
+
+
+class ProductSearchIndex:
+    """
+    In-memory inverted index of the name, the description and the category of the products,
+    answering the full-text searches without a round trip to the database.
+
+    The index is built from the products table on startup and kept current by the endpoints
+    writing the products, whose changes are applied once their transaction commits, so that a
+    rolled back change never shows up. The changes committed while the index is being built are
+    applied again on top of it. As every process of the service holds its own index, the changes
+    made by the other processes only show up once the index is built again, which happens
+    periodically if configured.
+
+    The products matching all the terms of a search are ranked with BM25 over the weighted
+    occurrences of the terms in their fields.
+
+    :ivar builds: Number of times the index was built.
+    """
+
+    def __init__(self) -> None:
+        self._products: dict[int, IndexedProduct] = {}
+        self._lengths: dict[int, float] = {}
+        self._postings: dict[str, dict[int, float]] = {}
+        self._total_length = 0.0
+        self._replay: list[tuple[int, dict[str, Any] | None]] | None = None
+        self._building = asyncio.Lock()
+        self.ready = False
+        self.builds = 0
+        self._tasks: set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._products)
+
+    def clear(self) -> None:
+        """
+        Forget every product and mark the index as not built.
+
+        :return: None
+        """
+        self._products, self._lengths, self._postings, self._total_length = {}, {}, {}, 0.0
+        self._replay = None
+        self._building = asyncio.Lock()
+        self.ready = False
+
+    def _terms(self, view: dict[str, Any]) -> Counter[str]:
+        frequencies: Counter[str] = Counter()
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(view[field]):
+                frequencies[term] += weight
+        return frequencies
+
+    def _remove(self, product_id: int) -> None:
+        product = self._products.pop(product_id, None)
+        if product is None:
+            return
+        self._total_length -= self._lengths.pop(product_id)
+        for term in self._terms(product.view):
+            postings = self._postings[term]
+            del postings[product_id]
+            if not postings:
+                del self._postings[term]
+
+    def _put(self, product_id: int, view: dict[str, Any] | None) -> None:
+        """
+        Index a product, replacing its previous version, or remove it.
+
+        :param product_id: ID of the product.
+        :param view: The product serialized using the `ProductView` schema, or None to remove it.
+
+        :return: None
+        """
+        self._remove(product_id)
+        if view is None:
+            return
+        frequencies = self._terms(view)
+        length = sum(frequencies.values())
+        self._products[product_id] = IndexedProduct(product_id, view)
+        self._lengths[product_id] = length
+        self._total_length += length
+        for term, frequency in frequencies.items():
+            self._postings.setdefault(term, {})[product_id] = frequency
+
+    def _apply(self, changes: list[tuple[int, dict[str, Any] | None]]) -> None:
+        if self._replay is not None:
+            self._replay.extend(changes)
+        if self.ready:
+            for product_id, view in changes:
+                self._put(product_id, view)
+
+    def track(self, db: AsyncSession, product: Product, deleted: bool = False) -> None:
+        """
+        Apply a change made to a product to the index once the session it was made in commits.
+
+        :param db: Database session the change is made in.
+        :param product: The product created, updated or deleted.
+        :param deleted: Whether the product was deleted.
+
+        :return: None
+        """
+        if not self.ready and self._replay is None:
+            return
+        self._defer(db, [(product.id, None if deleted else ProductView.model_validate(product).model_dump())])
+
+    def drop(self, db: AsyncSession, product_ids: list[int]) -> None:
+        """
+        Remove deleted products from the index once the session they were deleted in commits, for
+        the products deleted without being loaded.
+
+        :param db: Database session the products are deleted in.
+        :param product_ids: IDs of the products deleted.
+
+        :return: None
+        """
+        if not self.ready and self._replay is None:
+            return
+        self._defer(db, [(product_id, None) for product_id in product_ids])
+
+    def _defer(self, db: AsyncSession, changes: list[tuple[int, dict[str, Any] | None]]) -> None:
+        pending = db.sync_session.info.setdefault("search_index", [])
+        if not pending:
+
+            def apply(session: Session) -> None:
+                self._apply(session.info.pop("search_index", []))
+
+            def discard(session: Session, *args: Any) -> None:
+                session.info.pop("search_index", None)
+
+            event.listen(db.sync_session, "after_commit", apply, once=True)
+            event.listen(db.sync_session, "after_soft_rollback", discard, once=True)
+        pending.extend(changes)
+
+    def rebuild_on_commit(self, db: AsyncSession) -> None:
+        """
+        Build the index again in the background once the session commits, for changes made to too
+        many products at once to track them one by one.
+
+        :param db: Database session the changes are made in.
+
+        :return: None
+        """
+        if not self.ready and self._replay is None:
+            return
+
+        def schedule(session: Session) -> None:
+            task = asyncio.get_running_loop().create_task(self.rebuild())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        event.listen(db.sync_session, "after_commit", schedule, once=True)
+
+    async def build(self, chunk: int = 1000) -> None:
+        """
+        Build the index from all the products of the database. The current index keeps answering
+        the searches until the new one replaces it.
+
+        The builds requested on startup, periodically and after the changes made in bulk run one
+        after the other, each capturing the changes committed during its own scan.
+
+        :param chunk: Number of products read from the database at a time.
+
+        :return: None
+        """
+        async with self._building:
+            fresh = ProductSearchIndex()
+            replay = self._replay = []
+            try:
+                async with get_async_session()() as db:
+                    result = await db.stream(select(Product).execution_options(yield_per=chunk))
+                    async for partition in result.scalars().partitions():
+                        for product in partition:
+                            fresh._put(product.id, ProductView.model_validate(product).model_dump())
+                        await asyncio.sleep(0)  # Let the requests through between two partitions
+                for product_id, view in replay:
+                    fresh._put(product_id, view)
+            finally:
+                self._replay = None
+            self._products, self._lengths, self._postings, self._total_length = fresh._products, fresh._lengths, fresh._postings, fresh._total_length
+            self.ready = True
+            self.builds += 1
+
+    def search(self, text: str, cursor: str | None, skip: int, limit: int) -> list[tuple[IndexedProduct, float]]:
+        """
+        Fetch one page of the products matching all the terms of a search string, most relevant
+        first and the ties ordered on their ID.
+
+        :param text: The search string.
+        :param cursor: The cursor returned as `next_cursor` by the previous page, if any.
+        :param skip: Number of products to skip past the cursor, or from the start without a cursor.
+        :param limit: Maximum number of products in the page.
+
+        :return: The products of the page along with their relevance, plus the one following the
+                 page if there is one, as expected by `next_page()`.
+
+        :raises HTTPException:
+            - If the cursor is malformed, it raises 422 Unprocessable Entity.
+            - If more products than the configured cap are skipped, it raises 422 Unprocessable
+              Entity.
+        """
+        check_skip(skip)
+        position = decode_cursor(cursor, ranked=True) if cursor is not None else None
+        terms = set(tokenize(text))
+        postings = sorted((self._postings.get(term, {}) for term in terms), key=len)
+        if not postings or not postings[0]:
+            return []
+        count = len(self._products)
+        average = self._total_length / count
+        scores = {}
+        for product_id in postings[0]:
+            if all(product_id in other for other in postings[1:]):
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[product_id] / average)
+                score = 0.0
+                for other in postings:
+                    frequency = other[product_id]
+                    score += math.log(1 + (count - len(other) + 0.5) / (len(other) + 0.5)) * frequency * (BM25_K1 + 1) / (frequency + norm)
+                scores[product_id] = score
+        if position is not None:
+            last_id, last_rank = position
+            scores = {key: score for key, score in scores.items() if score < last_rank or (score == last_rank and key > last_id)}
+        ranked = heapq.nsmallest(skip + limit + 1, scores.items(), key=lambda item: (-item[1], item[0]))[skip:]
+        return [(self._products[product_id], score) for product_id, score in ranked]
+
+    async def refresher(self) -> None:
+        """
+        Build the index again periodically until cancelled, to pick up the changes made by the
+        other processes of the service.
+
+        :return: None
+        """
+        while True:
+            await asyncio.sleep(config.srchrfsh)
+            await self.rebuild()
+
+    async def rebuild(self) -> None:
+        """
+        Build the index again, logging the failure instead of raising it.
+
+        :return: None
+        """
+        try:
+            await self.build()
+        except Exception as expt:
+            failure(f"Building the product search index failed: {expt}")
+            return
+        general(f"Built the product search index of {len(self)} products")
+
+
+# Index shared by all the requests of the service.
+product_index = ProductSearchIndex()
@@ -0,0 +1,127 @@
+from fastapi import HTTPException, Request, status
+from itsdangerous import BadSignature, URLSafeTimedSerializer
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from fastapi_ecom.config import config
+from fastapi_ecom.database.models.business import Business
+from fastapi_ecom.database.models.customer import Customer
+from fastapi_ecom.utils.logging_setup import failure, success, warning
+from fastapi_ecom.utils.principal_cache import principal_cache, token_kind
+
+# Secret keys which anyone can sign the tokens with, e.g. the one of the example configuration
+UNSAFE_KEYS = {"", "example"}
+
+
+def tokens_enabled() -> bool:
+    """
+    Check whether a secret key is configured to sign the tokens, the keys left empty or as in the
+    example configuration being known to anyone.
+
+    :return: True if the tokens can be issued and accepted else False.
+    """
+    return config.tokenkey not in UNSAFE_KEYS
+
+
+def get_serializer() -> URLSafeTimedSerializer:
+    """
+    Provide the serializer signing the tokens with the secret key from the configuration.
+
+    :return: The serializer of the tokens.
+    """
+    return URLSafeTimedSerializer(config.tokenkey, salt="fastapi-ecom-token")
+
+
+def issue_token(kind: str, principal: Customer | Business) -> str:
+    """
+    Issue a signed token for a customer or a business which just authenticated with its
+    credentials.
+
+    The token carries the kind and the UUID of the principal along with the version of its
+    credentials, and expires after the seconds configured in `tokenttl`.
+
+    :param kind: Kind of the principal, either "business" or "customer".
+    :param principal: The authenticated customer or business object.
+
+    :return: The signed token.
+
+    :raises HTTPException: If no secret key is configured to sign the tokens, it raises 503 Service
+                           Unavailable.
+    """
+    if not tokens_enabled():
+        failure(f"Token refused for {kind}: {principal.email} - No secret key is configured")
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Tokens are disabled until a secret key is configured")
+    return get_serializer().dumps({"kind": kind, "uuid": principal.uuid, "version": principal.version})
+
+
+async def verify_token_cred(request: Request, db: AsyncSession, model: type[Customer] | type[Business]) -> Customer | Business | None:
+    """
+    Verify a signed token presented with the "Token" scheme of the `Authorization` header.
+
+    The principal is served from the principal cache when it presented a token with the same
+    version of its credentials recently, under a kind of its own so that the version of the
+    credentials is never taken for a password by HTTP Basic Authentication, otherwise it is
+    looked up in the database by its UUID. No password is verified either way. No token is
+    accepted while no secret key is configured.
+
+    :param request: The incoming request carrying the token.
+    :param db: Database session to query the principal.
+    :param model: The model of the principal, either `Customer` or `Business`.
+
+    :return: The customer or business object if the token is valid, unexpired and not revoked else
+             returns None.
+    """
+    kind = model.__name__.lower()
+    if not tokens_enabled():
+        warning(f"Invalid {kind} token - No secret key is configured")
+        return None
+    token = request.headers.get("Authorization", "").partition(" ")[2]
+    try:
+        payload = get_serializer().loads(token, max_age=config.tokenttl)
+    except BadSignature:
+        warning(f"Invalid {kind} token - Bad signature or expired")
+        return None
+    if payload.get("kind") != kind:
+        warning(f"Invalid {kind} token - Issued for a {payload.get('kind')}")
+        return None
+
+    generation = principal_cache.generation
+    secret = f"version:{payload['version']}"
+    principal = principal_cache.get(token_kind(kind), payload["uuid"], secret)
+    if principal:
+        success(f"{model.__name__} authenticated via cached token: {principal.email}")
+        return principal
+
+    query = select(model).where(model.uuid == payload["uuid"])
+    result = await db.execute(query)
+    principal = result.scalar_one_or_none()
+    if not principal or principal.version != payload["version"]:
+        warning(f"Revoked {kind} token for: {payload['uuid']}")
+        return None
+    success(f"{model.__name__} authenticated via token: {principal.email}")
+    principal_cache.put(token_kind(kind), principal.uuid, secret, principal, generation)
+    return principal
+
+
+async def token_customer(request: Request, db: AsyncSession) -> Customer | None:
+    """
+    Authentication backend resolving the customer of a request via a signed token.
+
+    :param request: The incoming request carrying the token.
+    :param db: Database session to query customer data.
+
+    :return: The customer object if authentication is successful else returns None.
+    """
+    return await verify_token_cred(request, db, Customer)
+
+
+async def token_business(request: Request, db: AsyncSession) -> Business | None:
+    """
+    Authentication backend resolving the business of a request via a signed token.
+
+    :param request: The incoming request carrying the token.
+    :param db: Database session to query business data.
+
+    :return: The business object if authentication is successful else returns None.
+    """
+    return await verify_token_cred(request, db, Business)
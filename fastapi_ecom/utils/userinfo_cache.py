@@ -0,0 +1,129 @@
+import asyncio
+import hashlib
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from typing import Any
+
+from fastapi_ecom.config import config
+
+
+class UserinfoCache:
+    """
+    Bounded LRU cache of the users which the OAuth provider resolved the bearer tokens to, so
+    that a client sending many requests with the same token does not cost a round trip to the
+    provider for every single one of them.
+
+    The entries are keyed on the SHA-256 digest of the token, so no token is kept in plain text.
+    Tokens the provider rejected are remembered for a shorter time to live, and concurrent
+    lookups of the same token share a single call to the provider.
+
+    :ivar hits: Number of lookups served from the cache.
+    :ivar misses: Number of lookups which had to call the provider.
+    :ivar coalesced: Number of lookups which joined a call to the provider already in flight.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    async def _load(self, key: str, token: str, loader: Callable[[str], Awaitable[Any]]) -> Any:
+        """
+        Resolve a token with the provider and remember the result.
+
+        :param key: Digest of the token.
+        :param token: The bearer token.
+        :param loader: Awaitable factory resolving the token with the provider.
+
+        :return: The user the token resolves to or None if the provider rejected the token.
+        """
+        result = await loader(token)
+        ttl = config.oidcttl if result is not None else config.oidcneg
+        if ttl > 0:
+            self._entries[key] = (result, monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > config.oidcsze:
+                self._entries.popitem(last=False)
+        return result
+
+    def _settle(self, key: str, task: asyncio.Task) -> None:
+        """
+        Forget a call to the provider once it is over.
+
+        :param key: Digest of the token.
+        :param task: The task calling the provider.
+
+        :return: None
+        """
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def fetch(self, token: str, loader: Callable[[str], Awaitable[Any]]) -> Any:
+        """
+        Resolve a bearer token to its user, from the cache when possible.
+
+        Failures of the provider other than rejecting the token are raised to every caller
+        waiting on the call and are not remembered.
+
+        :param token: The bearer token.
+        :param loader: Awaitable factory resolving the token with the provider; it returns None
+                       when the provider rejects the token.
+
+        :return: The user the token resolves to or None if the provider rejected the token.
+        """
+        key = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        entry = self._entries.get(key)
+        if entry is not None and entry[1] >= monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+        self._entries.pop(key, None)
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._load(key, token, loader))
+            task.add_done_callback(lambda done: self._settle(key, done))
+            self._inflight[key] = task
+        else:
+            self.coalesced += 1
+        # Shielded so that a caller going away does not cancel the call the others are waiting on.
+        return await asyncio.shield(task)
+
+    def report(self) -> dict[str, int | float]:
+        """
+        Report the usage of the cache.
+
+        :return: Dictionary containing the size, capacity and times to live of the cache along with
+                 its hits, misses, coalesced lookups and hit rate.
+        """
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "size": len(self._entries),
+            "capacity": config.oidcsze,
+            "ttl": config.oidcttl,
+            "negative_ttl": config.oidcneg,
+            "inflight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+        }
+
+    def clear(self) -> None:
+        """
+        Forget all the tokens and reset the counters.
+
+        :return: None
+        """
+        self._entries.clear()
+        self._inflight.clear()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+
+# Cache shared by all the requests of the service.
+userinfo_cache = UserinfoCache()
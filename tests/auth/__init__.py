@@ -0,0 +1,84 @@
+import asyncio
+from functools import cache
+from time import time
+
+from fastapi import FastAPI, Header, HTTPException, status
+from joserfc import jwt
+from joserfc.jwk import KeySet, RSAKey
+
+from fastapi_ecom.config import config
+
+
+@cache
+def _test_signing_key(kid: str) -> RSAKey:
+    """
+    Provides an RSA key for signing the ID tokens of the stand-in OAuth provider.
+
+    :param kid: Key ID of the signing key.
+
+    :return: The private RSA key, generated once per key ID.
+    """
+    return RSAKey.generate_key(2048, parameters={"kid": kid}, private=True)
+
+
+def _test_id_token(kid: str = "test-key", **claims: object) -> str:
+    """
+    Provides an ID token issued by the stand-in OAuth provider.
+
+    :param kid: Key ID of the key signing the token.
+    :param claims: Claims overriding the ones of a valid token for the `delete` user.
+
+    :return: The encoded ID token.
+    """
+    now = int(time())
+    payload = {
+        "iss": "http://oidc",
+        "aud": config.GOOGLE_CLIENT_ID,
+        "sub": "delete_sub",
+        "email": "delete@example.com",
+        "email_verified": True,
+        "name": "delete user",
+        "iat": now,
+        "exp": now + 3600,
+    }
+    payload.update(claims)
+    return jwt.encode({"alg": "RS256", "kid": kid}, payload, _test_signing_key(kid))
+
+
+def _test_oidc_provider() -> FastAPI:
+    """
+    Provides a local stand-in for the OAuth provider serving its discovery document, its signing
+    keys and its userinfo endpoint, counting the calls made to the latter two in
+    `state.jwks_calls` and `state.userinfo_calls`. The key IDs published are listed in
+    `state.kids` so that tests can rotate them.
+
+    :return: A FastAPI app instance standing in for the OAuth provider.
+    """
+    provider = FastAPI()
+    provider.state.userinfo_calls = 0
+    provider.state.jwks_calls = 0
+    provider.state.kids = ["test-key"]
+    users = {
+        "valid-token": {"email": "delete@example.com", "name": "delete user", "sub": "delete_sub"},
+        "other-token": {"email": "dummy_user@example.com", "name": "dummy user", "sub": "dummy_user_sub"},
+    }
+
+    @provider.get("/.well-known/openid-configuration")
+    async def discovery() -> dict[str, str]:
+        return {"issuer": "http://oidc", "userinfo_endpoint": "http://oidc/userinfo", "jwks_uri": "http://oidc/jwks"}
+
+    @provider.get("/jwks")
+    async def jwks() -> dict[str, list]:
+        provider.state.jwks_calls += 1
+        return KeySet([_test_signing_key(kid) for kid in provider.state.kids]).as_dict(private=False)
+
+    @provider.get("/userinfo")
+    async def userinfo(authorization: str = Header("")) -> dict[str, str]:
+        provider.state.userinfo_calls += 1
+        await asyncio.sleep(0.05)  # Round trip to the provider, long enough for the lookups to overlap
+        token = authorization.removeprefix("Bearer ")
+        if token not in users:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+        return users[token]
+
+    return provider
@@ -0,0 +1,150 @@
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+
+from fastapi_ecom.config import config
+from fastapi_ecom.utils.oauth import id_token_verifier
+from tests.auth import _test_id_token
+
+
+@pytest.mark.parametrize(
+    "claims, status",
+    [
+        pytest.param({}, 200, id="AUTH ID Token - Verify a valid ID token locally"),
+        pytest.param({"exp": 1}, 401, id="AUTH ID Token - Reject an expired ID token"),
+        pytest.param({"aud": "another-client"}, 401, id="AUTH ID Token - Reject an ID token issued for another client"),
+        pytest.param({"iss": "http://another-issuer"}, 401, id="AUTH ID Token - Reject an ID token issued by another issuer"),
+        pytest.param({"email_verified": False}, 401, id="AUTH ID Token - Reject an ID token with an unverified email address"),
+    ],
+)
+async def test_id_token(
+    client: AsyncClient,
+    db_test_create: None,
+    db_test_data: None,
+    oidc_provider: FastAPI,
+    mocker: MockerFixture,
+    claims: dict[str, object],
+    status: int,
+) -> None:
+    """
+    Test that the ID tokens are verified locally against the cached signing keys of the provider,
+    without calling its userinfo endpoint.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param oidc_provider: Fixture which points the OAuth client to a local stand-in provider.
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+    :param claims: Claims overriding the ones of a valid ID token.
+    :param status: Expected status code of the requests.
+
+    :return:
+    """
+    """
+    Mock the password check for failing basic auth
+    """
+    mocker.patch("bcrypt.checkpw", return_value=False)
+
+    """
+    Perform the action of visiting the endpoint twice with the same ID token
+    """
+    token = _test_id_token(**claims)
+    responses = [await client.get("/api/v1/business/me", headers={"Authorization": f"Bearer {token}"}) for _ in range(2)]
+
+    """
+    Test the responses
+    """
+    assert [response.status_code for response in responses] == [status] * 2
+    if status == 200:
+        assert responses[0].json()["email"] == "delete@example.com"
+    assert oidc_provider.state.userinfo_calls == 0
+    assert oidc_provider.state.jwks_calls == 1
+
+
+@pytest.mark.parametrize(
+    "jwksmiss, status, jwks_calls",
+    [
+        pytest.param(0, 200, 2, id="AUTH ID Token - Fetch the signing keys again when the provider rotates them"),
+        pytest.param(3600, 401, 1, id="AUTH ID Token - Limit the fetches of the signing keys caused by unknown key IDs"),
+    ],
+)
+async def test_id_token_rotation(
+    client: AsyncClient,
+    db_test_create: None,
+    db_test_data: None,
+    oidc_provider: FastAPI,
+    mocker: MockerFixture,
+    jwksmiss: int,
+    status: int,
+    jwks_calls: int,
+) -> None:
+    """
+    Test that the signing keys are fetched again when an ID token is signed with an unknown key ID,
+    at most once per configured interval.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param oidc_provider: Fixture which points the OAuth client to a local stand-in provider.
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+    :param jwksmiss: Minimum seconds between two fetches of the signing keys.
+    :param status: Expected status code of the request with the rotated key.
+    :param jwks_calls: Expected number of fetches of the signing keys.
+
+    :return:
+    """
+    """
+    Mock the password check for failing basic auth and set the interval between the fetches
+    """
+    mocker.patch("bcrypt.checkpw", return_value=False)
+    mocker.patch.object(config, "jwksmiss", jwksmiss)
+
+    """
+    Perform the action of visiting the endpoint before and after the provider rotates its keys
+    """
+    before = await client.get("/api/v1/business/me", headers={"Authorization": f"Bearer {_test_id_token()}"})
+    oidc_provider.state.kids = ["rotated-key"]
+    after = await client.get("/api/v1/business/me", headers={"Authorization": f"Bearer {_test_id_token(kid='rotated-key')}"})
+
+    """
+    Test the responses
+    """
+    assert before.status_code == 200
+    assert after.status_code == status
+    assert oidc_provider.state.jwks_calls == jwks_calls
+    assert id_token_verifier.refreshes == jwks_calls
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="AUTH ID Token - Reject an ID token signed with another key")])
+async def test_id_token_forged(
+    client: AsyncClient, db_test_create: None, db_test_data: None, oidc_provider: FastAPI, mocker: MockerFixture, _: None
+) -> None:
+    """
+    Test that an ID token carrying a known key ID but signed with another key is rejected.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param oidc_provider: Fixture which points the OAuth client to a local stand-in provider.
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+
+    :return:
+    """
+    """
+    Mock the password check for failing basic auth and forge a token signed with another key
+    """
+    mocker.patch("bcrypt.checkpw", return_value=False)
+    header, payload, _signature = _test_id_token().split(".")
+    forged = ".".join([header, payload, _test_id_token(kid="forged-key").split(".")[2]])
+
+    """
+    Perform the action of visiting the endpoint
+    """
+    response = await client.get("/api/v1/business/me", headers={"Authorization": f"Bearer {forged}"})
+
+    """
+    Test the response
+    """
+    assert response.status_code == 401
+    assert id_token_verifier.rejected == 1
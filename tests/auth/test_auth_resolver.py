@@ -0,0 +1,59 @@
+import re
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+
+from tests.auth import _test_id_token
+
+
+@pytest.mark.parametrize(
+    "authorization, status, lookups",
+    [
+        pytest.param(None, 200, 1, id="AUTH Resolver - Look the business up once via HTTP Basic Authentication"),
+        pytest.param("Bearer valid-token", 200, 1, id="AUTH Resolver - Look the business up once via OAuth access token"),
+        pytest.param("Bearer ID_TOKEN", 200, 1, id="AUTH Resolver - Look the business up once via OAuth ID token"),
+        pytest.param("Digest unsupported", 401, 0, id="AUTH Resolver - Look nothing up for an unsupported scheme"),
+    ],
+)
+async def test_auth_resolver(
+    client: AsyncClient,
+    db_test_create: None,
+    db_test_data: None,
+    oidc_provider: FastAPI,
+    query_counter: list[str],
+    authorization: str | None,
+    status: int,
+    lookups: int,
+) -> None:
+    """
+    Test that an authenticated request is dispatched to the one authentication backend of the
+    scheme of its `Authorization` header and looks the principal up at most once.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param oidc_provider: Fixture which points the OAuth client to a local stand-in provider.
+    :param query_counter: Fixture which records the SQL statements sent to the database.
+    :param authorization: Value of the `Authorization` header, HTTP Basic credentials when None.
+    :param status: Expected status code of the request.
+    :param lookups: Expected number of statements looking a principal up, all of them businesses.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint with the credentials of the scheme
+    """
+    if authorization is None:
+        kwargs = {"auth": ("test_business@example.com", "test_business")}
+    else:
+        kwargs = {"headers": {"Authorization": authorization.replace("ID_TOKEN", _test_id_token())}}
+    query_counter.clear()
+    response = await client.get("/api/v1/business/me", **kwargs)
+
+    """
+    Test the response and the statements sent to the database
+    """
+    assert response.status_code == status
+    principal_lookups = [re.search(r"FROM (businesses|customers)\s+WHERE", statement) for statement in query_counter]
+    assert [lookup.group(1) for lookup in principal_lookups if lookup] == ["businesses"] * lookups
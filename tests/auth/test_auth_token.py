@@ -0,0 +1,203 @@
+import re
+
+import pytest
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+
+from fastapi_ecom.config import config
+from fastapi_ecom.utils.principal_cache import principal_cache
+from fastapi_ecom.utils.token_auth import get_serializer
+
+
+@pytest.mark.parametrize(
+    "kind",
+    [
+        pytest.param("business", id="AUTH Token - Authenticate a business with a session token"),
+        pytest.param("customer", id="AUTH Token - Authenticate a customer with a session token"),
+    ],
+)
+async def test_token(client: AsyncClient, token_key: None, db_test_create: None, db_test_data: None, query_counter: list[str], kind: str) -> None:
+    """
+    Test that a session token issued after a login with HTTP Basic Authentication authenticates
+    the subsequent requests, which are served from the principal cache once the token was seen.
+
+    :param client: The test client to send HTTP requests.
+    :param token_key: Fixture to configure a secret key signing the session tokens.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param query_counter: Fixture which records the SQL statements sent to the database.
+    :param kind: Kind of the principal obtaining the token.
+
+    :return:
+    """
+    """
+    Perform the action of obtaining a token and visiting the endpoint twice with it
+    """
+    issued = await client.post(f"/api/v1/{kind}/token", auth=("delete@example.com", "delete"))
+    headers = {"Authorization": f"Token {issued.json()['token']}"}
+    query_counter.clear()
+    responses = [await client.get(f"/api/v1/{kind}/me", headers=headers) for _ in range(2)]
+
+    """
+    Test the responses and the statements sent to the database
+    """
+    assert issued.status_code == 201
+    assert {**issued.json(), "token": None} == {"action": "post", "token": None, "token_type": "Token", "expires_in": config.tokenttl}
+    assert [response.status_code for response in responses] == [200] * 2
+    assert responses[1].json()["email"] == "delete@example.com"
+    assert len([statement for statement in query_counter if re.search(r"FROM (businesses|customers)\s+WHERE", statement)]) == 1
+    assert principal_cache.hits == 1
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        pytest.param({"password": "changed"}, id="AUTH Token - Revoke the tokens when the password changes"),
+        pytest.param({"email": "changed@example.com"}, id="AUTH Token - Revoke the tokens when the email address changes"),
+    ],
+)
+async def test_token_revoked(client: AsyncClient, token_key: None, db_test_create: None, db_test_data: None, payload: dict[str, str]) -> None:
+    """
+    Test that the session tokens issued before a change of the credentials are rejected, even once
+    they have been cached.
+
+    :param client: The test client to send HTTP requests.
+    :param token_key: Fixture to configure a secret key signing the session tokens.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param payload: A dictionary containing the data for updating the business.
+
+    :return:
+    """
+    """
+    Perform the action of obtaining a token, using it and then changing the credentials
+    """
+    issued = await client.post("/api/v1/business/token", auth=("delete@example.com", "delete"))
+    headers = {"Authorization": f"Token {issued.json()['token']}"}
+    before = await client.get("/api/v1/business/me", headers=headers)
+    updated = await client.put("/api/v1/business/update/me", json=payload, headers=headers)
+    after = await client.get("/api/v1/business/me", headers=headers)
+
+    """
+    Test the responses
+    """
+    assert before.status_code == 200
+    assert updated.status_code == 202
+    assert after.status_code == 401
+
+
+@pytest.mark.parametrize(
+    "presented, status",
+    [
+        pytest.param("TOKEN", 403, id="AUTH Token - Refuse to issue a token to a token"),
+        pytest.param("TOKEN-tampered", 401, id="AUTH Token - Reject a token with a bad signature"),
+        pytest.param("CUSTOMER_TOKEN", 401, id="AUTH Token - Reject a token issued for another kind of principal"),
+        pytest.param("EXPIRED_TOKEN", 401, id="AUTH Token - Reject an expired token"),
+    ],
+)
+async def test_token_rejected(
+    client: AsyncClient, token_key: None, db_test_create: None, db_test_data: None, mocker: MockerFixture, presented: str, status: int
+) -> None:
+    """
+    Test that the tokens which are tampered with, issued for another kind of principal or expired
+    are rejected, and that a token cannot be exchanged for another one.
+
+    :param client: The test client to send HTTP requests.
+    :param token_key: Fixture to configure a secret key signing the session tokens.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+    :param presented: Placeholder of the token presented to the endpoint.
+    :param status: Expected status code of the request.
+
+    :return:
+    """
+    """
+    Obtain the tokens and make the expired one older than the configured lifetime
+    """
+    business = (await client.post("/api/v1/business/token", auth=("delete@example.com", "delete"))).json()["token"]
+    customer = (await client.post("/api/v1/customer/token", auth=("delete@example.com", "delete"))).json()["token"]
+    if presented == "EXPIRED_TOKEN":
+        mocker.patch.object(config, "tokenttl", -1)
+    presented = presented.replace("CUSTOMER_TOKEN", customer).replace("EXPIRED_TOKEN", business).replace("TOKEN", business)
+
+    """
+    Perform the action of visiting the endpoint
+    """
+    response = await client.post("/api/v1/business/token", headers={"Authorization": f"Token {presented}"})
+
+    """
+    Test the response
+    """
+    assert response.status_code == status
+
+
+@pytest.mark.parametrize(
+    "kind, uuid",
+    [
+        pytest.param("business", "5c1c48fb", id="AUTH Token - Refuse the version of the credentials of a business as a password"),
+        pytest.param("customer", "2b203687", id="AUTH Token - Refuse the version of the credentials of a customer as a password"),
+    ],
+)
+async def test_token_not_password(client: AsyncClient, token_key: None, db_test_create: None, db_test_data: None, kind: str, uuid: str) -> None:
+    """
+    Test that the principal cached after presenting a session token cannot be authenticated with
+    HTTP Basic Authentication by its UUID and the version of its credentials.
+
+    :param client: The test client to send HTTP requests.
+    :param token_key: Fixture to configure a secret key signing the session tokens.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param kind: Kind of the principal obtaining the token.
+    :param uuid: UUID of the principal obtaining the token.
+
+    :return:
+    """
+    """
+    Perform the action of obtaining a token, using it and then presenting the cached secret as a password
+    """
+    issued = await client.post(f"/api/v1/{kind}/token", auth=("delete@example.com", "delete"))
+    with_token = await client.get(f"/api/v1/{kind}/me", headers={"Authorization": f"Token {issued.json()['token']}"})
+    with_basic = await client.get(f"/api/v1/{kind}/me", auth=(uuid, "version:0"))
+
+    """
+    Test the responses
+    """
+    assert with_token.status_code == 200
+    assert with_basic.status_code == 401
+
+
+@pytest.mark.parametrize(
+    "tokenkey",
+    [
+        pytest.param("example", id="AUTH Token - Refuse the tokens signed with the key of the example configuration"),
+        pytest.param("", id="AUTH Token - Refuse the tokens without a secret key"),
+    ],
+)
+async def test_token_unsafe_key(client: AsyncClient, db_test_create: None, db_test_data: None, mocker: MockerFixture, tokenkey: str) -> None:
+    """
+    Test that no session token is issued or accepted while the secret key signing them is known to
+    anyone.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+    :param tokenkey: The secret key configured.
+
+    :return:
+    """
+    """
+    Perform the action of obtaining a token and presenting one forged with the key
+    """
+    mocker.patch.object(config, "tokenkey", tokenkey)
+    issued = await client.post("/api/v1/business/token", auth=("delete@example.com", "delete"))
+    forged = get_serializer().dumps({"kind": "business", "uuid": "5c1c48fb", "version": 0})
+    response = await client.get("/api/v1/business/me", headers={"Authorization": f"Token {forged}"})
+
+    """
+    Test the responses
+    """
+    assert issued.status_code == 503
+    assert issued.json()["detail"] == "Tokens are disabled until a secret key is configured"
+    assert response.status_code == 401
@@ -0,0 +1,78 @@
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastapi_ecom.database import get_async_session
+from fastapi_ecom.database.models.business import Business
+
+
+@pytest.mark.parametrize(
+    "token, email, created",
+    [
+        pytest.param("valid-token", "delete@example.com", False, id="AUTH OAuth Upsert - Link an existing business and skip the writes afterwards"),
+        pytest.param("other-token", "dummy_user@example.com", True, id="AUTH OAuth Upsert - Create a new business and skip the writes afterwards"),
+    ],
+)
+async def test_oauth_upsert(
+    client: AsyncClient,
+    db_test_create: None,
+    db_test_data: None,
+    oidc_provider: FastAPI,
+    mocker: MockerFixture,
+    token: str,
+    email: str,
+    created: bool,
+) -> None:
+    """
+    Test that the OAuth requests write the OAuth information of the business to the database only
+    when it differs from the stored one.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param oidc_provider: Fixture which points the OAuth client to a local stand-in provider.
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+    :param token: Bearer token to authenticate with.
+    :param email: Email address of the user of the token.
+    :param created: Whether the business is created by the first request.
+
+    :return:
+    """
+    """
+    Mock the password check for failing basic auth and spy on the commits
+    """
+    mocker.patch("bcrypt.checkpw", return_value=False)
+    spy_commit = mocker.spy(AsyncSession, "commit")
+
+    """
+    Perform the action of visiting the endpoint with the token of a user unknown to the database
+    """
+    first = await client.get("/api/v1/business/me", headers={"Authorization": f"Bearer {token}"})
+
+    """
+    Test the response and the commit of the OAuth information
+    """
+    assert first.status_code == 200
+    assert spy_commit.call_count == 1
+    async with get_async_session()() as db:
+        business = (await db.execute(select(Business).where(Business.email == email))).scalar_one()
+    assert business.oauth_provider == "google"
+    assert business.oauth_email == email
+    assert business.is_verified is True
+    assert business.created_via_oauth is created
+
+    """
+    Perform the action of visiting the endpoint again with the same token
+    """
+    spy_commit.reset_mock()
+    second = await client.get("/api/v1/business/me", headers={"Authorization": f"Bearer {token}"})
+
+    """
+    Test the response and that nothing is written
+    """
+    assert second.status_code == 200
+    assert second.json()["email"] == email
+    assert spy_commit.call_count == 0
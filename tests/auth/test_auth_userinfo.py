@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+
+from fastapi_ecom.config import config
+
+
+@pytest.mark.parametrize(
+    "token, status, ttl",
+    [
+        pytest.param("valid-token", 200, 300, id="AUTH Userinfo - Serve the user of a valid token from the cache"),
+        pytest.param("invalid-token", 401, 300, id="AUTH Userinfo - Remember a token rejected by the provider"),
+        pytest.param("valid-token", 200, 0, id="AUTH Userinfo - Call the provider every time when the cache is disabled"),
+    ],
+)
+async def test_userinfo_cache(
+    client: AsyncClient,
+    internal_reports: None,
+    db_test_create: None,
+    db_test_data: None,
+    oidc_provider: FastAPI,
+    mocker: MockerFixture,
+    token: str,
+    status: int,
+    ttl: int,
+) -> None:
+    """
+    Test that the users of the OAuth bearer tokens are resolved with the provider once and served
+    from the cache afterwards.
+
+    :param client: The test client to send HTTP requests.
+    :param internal_reports: Fixture to enable the endpoints of the Internal API.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param oidc_provider: Fixture which points the OAuth client to a local stand-in provider.
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+    :param token: Bearer token to authenticate with.
+    :param status: Expected status code of the requests.
+    :param ttl: Seconds for which the tokens are remembered.
+
+    :return:
+    """
+    """
+    Mock the password check for failing basic auth and set the time to live of the cache
+    """
+    mocker.patch("bcrypt.checkpw", return_value=False)
+    mocker.patch.object(config, "oidcttl", ttl)
+    mocker.patch.object(config, "oidcneg", ttl)
+
+    """
+    Perform the action of visiting the endpoint repeatedly with the same token
+    """
+    responses = [await client.get("/api/v1/business/me", headers={"Authorization": f"Bearer {token}"}) for _ in range(3)]
+    report = (await client.get("/api/v1/internal/userinfo")).json()["userinfo"]
+
+    """
+    Test the responses
+    """
+    assert [response.status_code for response in responses] == [status] * 3
+    if ttl:
+        assert oidc_provider.state.userinfo_calls == 1
+        assert report["size"] == 1
+        assert report["misses"] == 1
+        assert report["hits"] == 2
+    else:
+        assert oidc_provider.state.userinfo_calls == 3
+        assert report["size"] == 0
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="AUTH Userinfo - Share one call to the provider among concurrent requests")])
+async def test_userinfo_cache_coalesce(
+    client: AsyncClient, internal_reports: None, db_test_create: None, db_test_data: None, oidc_provider: FastAPI, mocker: MockerFixture, _: None
+) -> None:
+    """
+    Test that the concurrent requests carrying the same OAuth bearer token share a single call to
+    the provider.
+
+    :param client: The test client to send HTTP requests.
+    :param internal_reports: Fixture to enable the endpoints of the Internal API.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param oidc_provider: Fixture which points the OAuth client to a local stand-in provider.
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+
+    :return:
+    """
+    """
+    Mock the password check for failing basic auth
+    """
+    mocker.patch("bcrypt.checkpw", return_value=False)
+
+    """
+    Perform the action of visiting the endpoint concurrently with the same token
+    """
+    responses = await asyncio.gather(*(client.get("/api/v1/business/me", headers={"Authorization": "Bearer valid-token"}) for _ in range(5)))
+    report = (await client.get("/api/v1/internal/userinfo")).json()["userinfo"]
+
+    """
+    Test the responses
+    """
+    assert [response.status_code for response in responses] == [200] * 5
+    assert oidc_provider.state.userinfo_calls == 1
+    assert report["misses"] == 1
+    assert report["coalesced"] == 4
+    assert report["inflight"] == 0
@@ -260,7 +260,7 @@ async def test_get_businesses(client: AsyncClient, db_test_create: None, db_test
     Test the response
     """
     assert response.status_code == 200
-    assert response.json() == {"action": "get", "businesses": businesses}
+    assert response.json() == {"action": "get", "businesses": businesses, "next_cursor": None}
 
 
 @pytest.mark.parametrize("_", [pytest.param(None, id="BUSINESS GET Endpoint - Fail to fetch business")])
@@ -285,3 +285,34 @@ async def test_get_businesses_fail(
 
     assert response.status_code == 404
     assert response.json()["detail"] == "No business present in database"
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="BUSINESS GET Endpoint - Walk the businesses two at a time with the cursor")])
+async def test_get_businesses_cursor(client: AsyncClient, db_test_create: None, db_test_data: None, _: None) -> None:
+    """
+    Test that following the cursor of the `get` endpoint of the Business API walks all the businesses
+    exactly once.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint page after page
+    """
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2} if cursor is None else {"limit": 2, "cursor": cursor}
+        response = await client.get("/api/v1/business/search", params=params)
+        assert response.status_code == 200
+        seen.extend(item["email"] for item in response.json()["businesses"])
+        cursor = response.json()["next_cursor"]
+        if cursor is None:
+            break
+
+    """
+    Test that every business is seen once in order
+    """
+    assert seen == [item.email for item in _test_data_business().values()]
@@ -1,5 +1,7 @@
-from collections.abc import AsyncGenerator, Callable
+import secrets
+from collections.abc import AsyncGenerator, Callable, Generator
 from pathlib import PosixPath
+from types import SimpleNamespace
 
 import pytest
 from click.testing import CliRunner
@@ -7,12 +9,19 @@ from fastapi import FastAPI
 from fastapi.security import HTTPBasicCredentials
 from httpx import ASGITransport, AsyncClient
 from pytest_mock import MockerFixture
-from sqlalchemy import URL
+from sqlalchemy import URL, Engine, event
 
 from fastapi_ecom.app import app
 from fastapi_ecom.config import config as cnfg
-from fastapi_ecom.database import baseobjc, get_async_session, get_engine
+from fastapi_ecom.database import baseobjc, dispose_async_session, get_async_session, get_engine
 from fastapi_ecom.utils.basic_auth import security
+from fastapi_ecom.utils.hashing import password_hasher
+from fastapi_ecom.utils.oauth import id_token_verifier, oauth
+from fastapi_ecom.utils.principal_cache import principal_cache
+from fastapi_ecom.utils.response_cache import response_cache
+from fastapi_ecom.utils.search_index import product_index
+from fastapi_ecom.utils.userinfo_cache import userinfo_cache
+from tests.auth import _test_oidc_provider
 from tests.business import _test_data_business
 from tests.customer import _test_data_customer
 from tests.order import _test_data_order_details, _test_data_orders
@@ -54,10 +63,18 @@ async def client(test_app: FastAPI) -> AsyncGenerator[AsyncClient, None]:
 
 
 @pytest.fixture
-async def get_test_database_url(tmp_path: PosixPath, mocker: MockerFixture) -> URL:
+async def get_test_database_url(tmp_path: PosixPath, mocker: MockerFixture) -> AsyncGenerator[URL, None]:
     """
     Fixture to provide the database URL for testing and setting the echo for sqlalchemy.
 
+    The process-wide engine is disposed after the test so that the next test does not reuse a
+    connection pool bound to the database of a previous test, and the password hashing workers are
+    shut down so that their admission semaphore is not bound to the event loop of a previous test.
+    The authenticated principals, the users of the OAuth bearer tokens and the signing keys of the
+    OAuth provider are forgotten so that no test authenticates from the caches of a previous test,
+    and so are the products of the search index and the cached responses so that no test is
+    answered from those of a previous test.
+
     :param tmp_path: Inbuilt fixture which provides temporary directory.
     :param mocker: Mock fixture to be used for mocking desired functionality.
 
@@ -69,7 +86,14 @@ async def get_test_database_url(tmp_path: PosixPath, mocker: MockerFixture) -> U
     )
     mocker.patch.object(URL, "create", return_value=SQLALCHEMY_DATABASE_URL)
     cnfg.confecho = False
-    return SQLALCHEMY_DATABASE_URL
+    yield SQLALCHEMY_DATABASE_URL
+    await dispose_async_session()
+    password_hasher.shutdown()
+    principal_cache.clear()
+    userinfo_cache.clear()
+    id_token_verifier.clear()
+    product_index.clear()
+    await response_cache.clear()
 
 
 @pytest.fixture
@@ -113,6 +137,18 @@ async def db_test_data(get_test_database_url: URL) -> None:
     await db.commit()
 
 
+@pytest.fixture
+async def db_test_index(db_test_data: None) -> None:
+    """
+    Fixture to build the product search index from the initial test data.
+
+    :param db_test_data: Fixture to populate the test database with initial test data.
+
+    :return:
+    """
+    await product_index.build()
+
+
 @pytest.fixture
 async def override_security(mocker: MockerFixture) -> Callable[[], HTTPBasicCredentials]:
     """
@@ -138,3 +174,88 @@ async def apply_security_override(test_app, override_security) -> None:
     :return:
     """
     test_app.dependency_overrides[security] = override_security
+
+
+@pytest.fixture
+async def oidc_provider(mocker: MockerFixture) -> FastAPI:
+    """
+    Fixture to point the Google OAuth client to a local stand-in for the OAuth provider.
+
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+
+    :return: FastAPI app instance standing in for the OAuth provider.
+    """
+    provider = _test_oidc_provider()
+    mocker.patch.object(oauth.google, "client_kwargs", {**oauth.google.client_kwargs, "transport": ASGITransport(app=provider)})
+    mocker.patch.object(oauth.google, "_server_metadata_url", "http://oidc/.well-known/openid-configuration")
+    mocker.patch.object(oauth.google, "server_metadata", {})
+    return provider
+
+
+@pytest.fixture
+async def token_key(mocker: MockerFixture) -> None:
+    """
+    Fixture to configure a secret key signing the session tokens, which are refused with the key
+    of the example configuration.
+
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+
+    :return:
+    """
+    mocker.patch.object(cnfg, "tokenkey", secrets.token_hex(32))
+
+
+@pytest.fixture
+async def internal_reports(mocker: MockerFixture) -> None:
+    """
+    Fixture to enable the endpoints which require no authentication, i.e. those of the Internal
+    API reporting the operational state of the service and the export of the orders.
+
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+
+    :return:
+    """
+    mocker.patch.object(cnfg, "intlrprt", True)
+
+
+@pytest.fixture
+def query_counter() -> Generator[list[str], None, None]:
+    """
+    Fixture to record the SQL statements sent to the database by any engine during the test.
+
+    :return: List collecting the SQL statements in the order they are executed.
+    """
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        statements.append(statement)
+
+    event.listen(Engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(Engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def query_meter(query_counter: list[str]) -> Generator[SimpleNamespace, None, None]:
+    """
+    Fixture to record the SQL statements sent to the database during the test along with the
+    number of rows loaded from them into model instances, related ones included.
+
+    :param query_counter: Fixture which records the SQL statements sent to the database.
+
+    :return: Namespace holding the SQL statements as `statements` and the number of model instances
+             loaded as `rows`, both of which are reset by its `reset()` method.
+    """
+    meter = SimpleNamespace(statements=query_counter, rows=0)
+
+    def load(target, context) -> None:
+        meter.rows += 1
+
+    def reset() -> None:
+        meter.statements.clear()
+        meter.rows = 0
+
+    meter.reset = reset
+    event.listen(baseobjc, "load", load, propagate=True)
+    yield meter
+    event.remove(baseobjc, "load", load)
@@ -0,0 +1,95 @@
+from types import SimpleNamespace
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.future import select
+
+from fastapi_ecom.database import get_async_session
+from fastapi_ecom.database.models.business import Business
+from fastapi_ecom.database.models.product import Product
+
+
+@pytest.mark.parametrize(
+    "method, path, statements, rows",
+    [
+        pytest.param("get", "/api/v1/product/search", 1, 5, id="DATABASE Budget - Fetch the products"),
+        pytest.param("get", "/api/v1/product/search/name/test", 1, 5, id="DATABASE Budget - Fetch the products matching a text"),
+        pytest.param("get", "/api/v1/product/facets", 1, 0, id="DATABASE Budget - Count the facets of the products"),
+        pytest.param("get", "/api/v1/product/search/internal", 2, 3, id="DATABASE Budget - Fetch the products of a business"),
+        pytest.param("get", "/api/v1/product/search/uuid/d5cf6983", 2, 2, id="DATABASE Budget - Fetch a product of a business"),
+        pytest.param("put", "/api/v1/product/update/uuid/d5cf6983", 2, 2, id="DATABASE Budget - Update a product of a business"),
+        pytest.param("delete", "/api/v1/product/delete/uuid/d5cf6983", 2, 2, id="DATABASE Budget - Delete a product of a business"),
+        pytest.param("get", "/api/v1/business/search", 1, 3, id="DATABASE Budget - Fetch the businesses"),
+        pytest.param("get", "/api/v1/business/me", 1, 1, id="DATABASE Budget - Authenticate a business"),
+        pytest.param("get", "/api/v1/customer/search", 1, 3, id="DATABASE Budget - Fetch the customers"),
+        pytest.param("get", "/api/v1/customer/me", 1, 1, id="DATABASE Budget - Authenticate a customer"),
+        pytest.param("get", "/api/v1/order/search", 3, 3, id="DATABASE Budget - Fetch the orders of a customer"),
+        pytest.param("get", "/api/v1/order/search/internal", 2, 5, id="DATABASE Budget - Fetch the orders"),
+        pytest.param("get", "/api/v1/order/search/uuid/375339b1", 3, 3, id="DATABASE Budget - Fetch an order of a customer"),
+    ],
+)
+async def test_endpoint_budget(
+    client: AsyncClient,
+    db_test_create: None,
+    db_test_data: None,
+    apply_security_override: None,
+    query_meter: SimpleNamespace,
+    method: str,
+    path: str,
+    statements: int,
+    rows: int,
+) -> None:
+    """
+    Test that an endpoint stays within its budget of SQL statements and of rows loaded into model
+    instances, so that a relationship loaded without being needed by the response shows up.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param apply_security_override: Fixture to set up test client with dependency override for `security`.
+    :param query_meter: Fixture which records the SQL statements and the rows loaded from them.
+    :param method: HTTP method of the request.
+    :param path: Path of the endpoint.
+    :param statements: The most SQL statements the endpoint may send.
+    :param rows: The most rows the endpoint may load into model instances.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint
+    """
+    query_meter.reset()
+    response = await client.request(method, path, json={"price": 30.0} if method == "put" else None)
+
+    """
+    Test the response and the budget
+    """
+    assert response.status_code < 300
+    assert len(query_meter.statements) <= statements, query_meter.statements
+    assert query_meter.rows <= rows
+
+
+async def test_relationship_not_loaded(db_test_create: None, db_test_data: None) -> None:
+    """
+    Test that a relationship which the query did not load explicitly raises instead of being
+    loaded behind the back of the query.
+
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+
+    :return:
+    """
+    """
+    Perform the action of fetching a business and a product without their relationships
+    """
+    async with get_async_session()() as db:
+        business = (await db.execute(select(Business).where(Business.uuid == "5c1c48fb"))).scalar_one()
+        product = (await db.execute(select(Product).where(Product.uuid == "d5cf6983"))).scalar_one()
+
+        """
+        Test that their relationships raise
+        """
+        for related in [lambda: business.products, lambda: product.businesses, lambda: product.order_details]:
+            with pytest.raises(InvalidRequestError, match="lazy='raise'"):
+                related()
@@ -0,0 +1,72 @@
+import pytest
+from pytest_mock import MockerFixture
+
+from fastapi_ecom.config import config
+from fastapi_ecom.database import _read_only_sessionmaker, get_engine
+from fastapi_ecom.database.pool import MonitoredPool
+
+
+@pytest.mark.parametrize(
+    "stmtcach",
+    [
+        pytest.param(100, id="DATABASE Engine - Build an asyncpg engine caching the prepared statements"),
+        pytest.param(0, id="DATABASE Engine - Build an asyncpg engine without caching the prepared statements"),
+    ],
+)
+async def test_get_engine_asyncpg(mocker: MockerFixture, stmtcach: int) -> None:
+    """
+    Test that the asynchronous engine is built for the asyncpg driver of the default
+    configuration, with the prepared statement cache sized from the configuration.
+
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+    :param stmtcach: The number of prepared statements cached per connection.
+
+    :return:
+    """
+    """
+    Perform the action of building the engine for the asyncpg driver
+    """
+    mocker.patch.object(config, "dtbsdriver", "postgresql+asyncpg")
+    mocker.patch.object(config, "stmtcach", stmtcach)
+    engine = get_engine()
+
+    """
+    Test the engine and the arguments its connections are opened with
+    """
+    try:
+        assert engine.dialect.driver == "asyncpg"
+        assert isinstance(engine.pool, MonitoredPool)
+        assert engine.url.query["prepared_statement_cache_size"] == str(stmtcach)
+        assert engine.dialect.create_connect_args(engine.url)[1]["prepared_statement_cache_size"] == stmtcach
+    finally:
+        await engine.dispose()
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="DATABASE Engine - Read through READ ONLY transactions on PostgreSQL")])
+async def test_read_only_sessionmaker_asyncpg(mocker: MockerFixture, _: None) -> None:
+    """
+    Test that the read-only sessions on PostgreSQL run their statements in a `READ ONLY`
+    transaction rather than relying on the guard of the ORM alone.
+
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+
+    :return:
+    """
+    """
+    Perform the action of building the read-only session factory for the asyncpg driver
+    """
+    mocker.patch.object(config, "dtbsdriver", "postgresql+asyncpg")
+    engine = get_engine()
+    sessionmaker = _read_only_sessionmaker(engine)
+
+    """
+    Test the execution options of the sessions, which the dialect applies to their connections
+    """
+    try:
+        bind = sessionmaker.kw["bind"]
+        assert bind.get_execution_options()["postgresql_readonly"] is True
+        assert "isolation_level" not in bind.get_execution_options()
+        assert "postgresql_readonly" in engine.dialect.connection_characteristics
+        assert sessionmaker.kw["info"] == {"read_only": True}
+    finally:
+        await engine.dispose()
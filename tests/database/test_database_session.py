@@ -0,0 +1,102 @@
+from datetime import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.security import HTTPBasicCredentials
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+from sqlalchemy import delete
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.requests import Request
+
+from fastapi_ecom.database.db_setup import get_read_db
+from fastapi_ecom.database.models.product import Product
+from fastapi_ecom.utils.basic_auth import security
+
+
+@pytest.mark.parametrize(
+    "method, path, commits",
+    [
+        pytest.param("get", "/api/v1/product/search/internal", 0, id="DATABASE Session - Skip the commit of a request which only reads"),
+        pytest.param("post", "/api/v1/product/create", 1, id="DATABASE Session - Commit the request which writes"),
+    ],
+)
+async def test_get_db_commit(
+    test_app: FastAPI,
+    client: AsyncClient,
+    db_test_create: None,
+    db_test_data: None,
+    mocker: MockerFixture,
+    method: str,
+    path: str,
+    commits: int,
+) -> None:
+    """
+    Test that the session of a request is committed only when the request writes to the database.
+
+    :param test_app: The fixture which returns the FastAPI app instance.
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param mocker: The mocker fixture of `pytest_mock`.
+    :param method: The HTTP method of the request.
+    :param path: The path of the endpoint to visit.
+    :param commits: Expected number of commits.
+
+    :return:
+    """
+    """
+    Mock `HTTPBasic.__call__`, override the `security` dependency and spy on the commits
+    """
+    mock_credentials = HTTPBasicCredentials(username="test_business@example.com", password="test_business")
+    mocker.patch("fastapi.security.http.HTTPBasic.__call__", return_value=mock_credentials)
+    test_app.dependency_overrides[security] = lambda: mock_credentials
+    spy_commit = mocker.spy(AsyncSession, "commit")
+
+    """
+    Perform the action of visiting the endpoint
+    """
+    payload = {
+        "name": "commit_prod",
+        "description": "Commit Test Product",
+        "category": "test",
+        "mfg_date": datetime.now().isoformat(),
+        "exp_date": datetime.now().isoformat(),
+        "price": 10.0,
+    }
+    response = await client.request(method, path, json=payload if method == "post" else None)
+
+    """
+    Test the response and the commits
+    """
+    assert response.status_code in (200, 201)
+    assert spy_commit.call_count == commits
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="DATABASE Session - Refuse to write through a read-only session")])
+async def test_get_read_db_read_only(db_test_create: None, db_test_data: None, _: None) -> None:
+    """
+    Test that the session provided for reading refuses to write to the database.
+
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+
+    :return:
+    """
+    """
+    Perform the action of writing through the read-only session
+    """
+    request = Request({"type": "http", "headers": []})
+    sessions = get_read_db(request)
+    db = await anext(sessions)
+
+    """
+    Test that both the statements and the flushes are refused
+    """
+    with pytest.raises(InvalidRequestError):
+        await db.execute(delete(Product))
+    db.add(Product(name="x", category="x", mfg_date=datetime.now(), exp_date=datetime.now(), price=1.0, business_id="x"))
+    with pytest.raises(InvalidRequestError):
+        await db.flush()
+    await sessions.aclose()
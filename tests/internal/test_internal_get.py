@@ -0,0 +1,282 @@
+import asyncio
+
+import bcrypt
+import pytest
+from fastapi import HTTPException
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+
+from fastapi_ecom.config import config
+from fastapi_ecom.database import dispose_async_session
+from fastapi_ecom.utils.hashing import hash_password, password_hasher, verify_password
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="INTERNAL GET Endpoint - Report the usage of the database connection pool")])
+async def test_get_pool_stats(client: AsyncClient, internal_reports: None, db_test_create: None, db_test_data: None, _: None) -> None:
+    """
+    Test the `pool` endpoint of the Internal API.
+
+    :param client: The test client to send HTTP requests.
+    :param internal_reports: Fixture to enable the endpoints of the Internal API.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoints
+    """
+    await client.get("/api/v1/product/search")
+    response = await client.get("/api/v1/internal/pool")
+
+    """
+    Test the response
+    """
+    assert response.status_code == 200
+    pool = response.json()["pool"]
+    assert pool["size"] == config.poolsize
+    assert pool["max_overflow"] == config.maxovflw
+    assert pool["timeout"] == config.pooltmot
+    assert pool["checked_out"] == 0
+    assert pool["idle"] >= 1
+    assert pool["checkouts"] >= 2  # One for populating the test data and one for the search
+    assert pool["timeouts"] == 0
+    assert pool["wait_max_ms"] >= pool["wait_avg_ms"] >= 0
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="INTERNAL GET Endpoint - Fail to report the pool which is not set up")])
+async def test_get_pool_stats_fail(client: AsyncClient, internal_reports: None, _: None) -> None:
+    """
+    Test the `pool` endpoint of the Internal API when the database connection pool is not set up.
+
+    :param client: The test client to send HTTP requests.
+    :param internal_reports: Fixture to enable the endpoints of the Internal API.
+
+    :return:
+    """
+    """
+    Ensure that the database connection pool is not set up
+    """
+    await dispose_async_session()
+
+    """
+    Perform the action of visiting the endpoint
+    """
+    response = await client.get("/api/v1/internal/pool")
+
+    """
+    Test the response
+    """
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Database connection pool is not set up"
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="INTERNAL GET Endpoint - Report the usage of the password hashing workers")])
+async def test_get_hashing_stats(client: AsyncClient, internal_reports: None, db_test_create: None, _: None) -> None:
+    """
+    Test the `hashing` endpoint of the Internal API.
+
+    :param client: The test client to send HTTP requests.
+    :param internal_reports: Fixture to enable the endpoints of the Internal API.
+    :param db_test_create: Fixture which creates a test database.
+
+    :return:
+    """
+    """
+    Perform the action of hashing a password and visiting the endpoint
+    """
+    await hash_password("password")
+    response = await client.get("/api/v1/internal/hashing")
+
+    """
+    Test the response
+    """
+    assert response.status_code == 200
+    hashing = response.json()["hashing"]
+    assert hashing["workers"] == config.hashwrkr
+    assert hashing["limit"] == config.hashlimt
+    assert hashing["admitted"] == 0
+    assert hashing["waiting"] == 0
+    assert hashing["completed"] >= 1
+    assert hashing["wait_max_ms"] >= hashing["wait_avg_ms"] >= 0
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="INTERNAL GET Endpoint - Reject the password hashing when too many operations are waiting")])
+async def test_get_hashing_stats_reject(client: AsyncClient, internal_reports: None, db_test_create: None, mocker: MockerFixture, _: None) -> None:
+    """
+    Test the `hashing` endpoint of the Internal API after rejecting the password hashing operations
+    which found too many operations waiting for admission.
+
+    :param client: The test client to send HTTP requests.
+    :param internal_reports: Fixture to enable the endpoints of the Internal API.
+    :param db_test_create: Fixture which creates a test database.
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+
+    :return:
+    """
+    """
+    Admit one operation at once and let only one wait for admission
+    """
+    mocker.patch.object(config, "hashlimt", 1)
+    mocker.patch.object(config, "hashqmax", 1)
+    password_hasher.shutdown()
+
+    """
+    Perform the action of hashing passwords concurrently and visiting the endpoint
+    """
+    hashed_password = bcrypt.hashpw(b"password", bcrypt.gensalt(rounds=4)).decode("utf-8")
+    results = await asyncio.gather(*(verify_password("password", hashed_password) for _ in range(3)), return_exceptions=True)
+    response = await client.get("/api/v1/internal/hashing")
+
+    """
+    Test the response
+    """
+    rejected = [item for item in results if isinstance(item, HTTPException)]
+    assert results.count(True) == 2
+    assert len(rejected) == 1
+    assert rejected[0].status_code == 503
+    assert rejected[0].detail == "Server is busy - Please try again"
+    assert response.status_code == 200
+    hashing = response.json()["hashing"]
+    assert hashing["limit"] == 1
+    assert hashing["rejected"] == 1
+    assert hashing["peak_waiting"] == 1
+
+
+@pytest.mark.parametrize(
+    "payload, status",
+    [
+        pytest.param({"name": "renamed"}, 200, id="INTERNAL GET Endpoint - Report the principal cache and invalidate it on update of the account"),
+        pytest.param({"password": "changed"}, 401, id="INTERNAL GET Endpoint - Report the principal cache and forget the former password on update"),
+    ],
+)
+async def test_get_principal_cache_stats(
+    client: AsyncClient,
+    internal_reports: None,
+    db_test_create: None,
+    db_test_data: None,
+    apply_security_override: None,
+    payload: dict[str, str],
+    status: int,
+) -> None:
+    """
+    Test the `principals` endpoint of the Internal API.
+
+    :param client: The test client to send HTTP requests.
+    :param internal_reports: Fixture to enable the endpoints of the Internal API.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param apply_security_override: Fixture to set up test client with dependency override for `security`.
+    :param payload: A dictionary containing the data for updating business.
+    :param status: Expected status code of authenticating with the former credentials after the update.
+
+    :return:
+    """
+    """
+    Perform the action of authenticating twice with the same credentials
+    """
+    await client.get("/api/v1/business/me")
+    await client.get("/api/v1/business/me")
+    response = await client.get("/api/v1/internal/principals")
+
+    """
+    Test the response
+    """
+    assert response.status_code == 200
+    principals = response.json()["principals"]
+    assert principals["size"] == 1
+    assert principals["capacity"] == config.authcsze
+    assert principals["hits"] == 1
+    assert principals["misses"] == 1
+    assert principals["hit_rate"] == 0.5
+
+    """
+    Perform the action of updating the account and authenticating again with the same credentials
+    """
+    await client.put("/api/v1/business/update/me", json=payload)
+    response = await client.get("/api/v1/business/me")
+
+    """
+    Test the response
+    """
+    assert response.status_code == status
+    principals = (await client.get("/api/v1/internal/principals")).json()["principals"]
+    assert principals["hits"] == 2
+    assert principals["misses"] == 2
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="INTERNAL GET Endpoint - Report the usage of the order batching")])
+async def test_get_order_batch_stats(
+    client: AsyncClient,
+    internal_reports: None,
+    db_test_create: None,
+    db_test_data: None,
+    apply_security_override: None,
+    mocker: MockerFixture,
+    _: None,
+) -> None:
+    """
+    Test the `orders` endpoint of the Internal API.
+
+    :param client: The test client to send HTTP requests.
+    :param internal_reports: Fixture to enable the endpoints of the Internal API.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param apply_security_override: Fixture to set up test client with dependency override for `security`.
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+
+    :return:
+    """
+    """
+    Enable group-commit and perform the action of placing two orders concurrently
+    """
+    mocker.patch.object(config, "ordbwin", 20)
+    before = (await client.get("/api/v1/internal/orders")).json()["orders"]
+    payload = {"order_date": "2026-01-01T00:00:00", "order_items": [{"product_id": "3250fcbe", "quantity": 1}]}
+    await asyncio.gather(*(client.post("/api/v1/order/create", json=payload) for _ in range(2)))
+    response = await client.get("/api/v1/internal/orders")
+
+    """
+    Test the response
+    """
+    assert response.status_code == 200
+    orders = response.json()["orders"]
+    assert orders["window"] == 20
+    assert orders["max_batch"] == config.ordbmax
+    assert orders["pending"] == 0
+    assert orders["batches"] - before["batches"] == 1
+    assert orders["orders"] - before["orders"] == 2
+    assert orders["average_batch"] > 0
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        pytest.param("pool", id="INTERNAL GET Endpoint - Hide the usage of the database connection pool by default"),
+        pytest.param("hashing", id="INTERNAL GET Endpoint - Hide the usage of the password hashing workers by default"),
+        pytest.param("principals", id="INTERNAL GET Endpoint - Hide the usage of the principal cache by default"),
+        pytest.param("userinfo", id="INTERNAL GET Endpoint - Hide the usage of the userinfo cache by default"),
+        pytest.param("orders", id="INTERNAL GET Endpoint - Hide the usage of the order batching by default"),
+    ],
+)
+async def test_get_internal_disabled(client: AsyncClient, db_test_create: None, path: str) -> None:
+    """
+    Test that the endpoints of the Internal API, which require no authentication, answer 404 unless
+    the configuration enables them.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param path: Path of the endpoint under the Internal API.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint
+    """
+    response = await client.get(f"/api/v1/internal/{path}")
+
+    """
+    Test the response
+    """
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Not Found"
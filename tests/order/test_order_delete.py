@@ -1,6 +1,11 @@
+import re
+
 import pytest
 from httpx import AsyncClient
+from sqlalchemy.future import select
 
+from fastapi_ecom.database import get_async_session
+from fastapi_ecom.database.models.order_details import OrderDetail
 from tests.order import _test_data_order_details, _test_data_orders
 
 
@@ -60,3 +65,44 @@ async def test_delete_order(
     else:
         assert response.status_code == 404
         assert response.json()["detail"] == "Order not present in database"
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="ORDER DELETE Endpoint - Delete the order along with its details returning them")])
+async def test_delete_order_returning(
+    client: AsyncClient, db_test_create: None, db_test_data: None, apply_security_override: None, query_counter: list[str], _: None
+) -> None:
+    """
+    Test that the `delete` endpoint of the Order API deletes the order along with its details with
+    one statement per table returning the deleted rows, without selecting them beforehand.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param apply_security_override: Fixture to set up test client with dependency override for `security`.
+    :param query_counter: Fixture which records the SQL statements sent to the database.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint
+    """
+    query_counter.clear()
+    response = await client.delete("/api/v1/order/delete/uuid/375339b1")
+
+    """
+    Test the statements sent to the database
+    """
+    assert response.status_code == 202
+    deletes = [statement for statement in query_counter if statement.startswith("DELETE")]
+    assert [statement.split()[2] for statement in deletes] == ["order_details", "orders"]
+    assert all("RETURNING" in statement for statement in deletes)
+    assert not [
+        statement for statement in query_counter if re.search(r"FROM (orders|order_details)\s+WHERE", statement) and statement.startswith("SELECT")
+    ]
+
+    """
+    Test that the details of the order are gone along with it
+    """
+    async with get_async_session()() as db:
+        details = (await db.execute(select(OrderDetail).where(OrderDetail.order_id == "375339b1"))).scalars().all()
+    assert details == []
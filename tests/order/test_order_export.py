@@ -0,0 +1,208 @@
+import csv
+import gzip
+import io
+import json
+from datetime import date, timedelta
+
+import pytest
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+
+from fastapi_ecom.config import config
+from tests.order import _test_data_order_details, _test_data_orders
+
+
+def _expected_orders() -> list[dict]:
+    """
+    Provides the orders of the test data as listed by the `/order/search/internal` endpoint.
+
+    :return: A list of orders along with their details.
+    """
+    details = _test_data_order_details()
+    return [
+        {
+            "uuid": order.uuid,
+            "user_id": order.user_id,
+            "order_date": order.order_date.replace(hour=0, minute=0, second=0, microsecond=0, tzinfo=None).isoformat(),
+            "total_price": order.total_price,
+            "order_items": [
+                {"product_id": detail.product_id, "quantity": detail.quantity, "price": detail.price, "uuid": detail.uuid}
+                for detail in details.values()
+                if detail.order_id == order.uuid
+            ],
+        }
+        for order in _test_data_orders().values()
+    ]
+
+
+@pytest.mark.parametrize(
+    "batch",
+    [
+        pytest.param(1000, id="ORDER EXPORT Endpoint - Stream all the orders as NDJSON"),
+        pytest.param(1, id="ORDER EXPORT Endpoint - Stream all the orders as NDJSON one row at a time from the cursor"),
+    ],
+)
+async def test_export_orders_ndjson(
+    client: AsyncClient, internal_reports: None, db_test_create: None, db_test_data: None, mocker: MockerFixture, batch: int
+) -> None:
+    """
+    Test the `export` endpoint streaming all the orders of the Order API as NDJSON, including
+    orders whose details span several partitions of the server-side cursor.
+
+    :param client: The test client to send HTTP requests.
+    :param internal_reports: Fixture to enable the endpoints which require no authentication.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+    :param batch: Number of rows fetched at a time from the server-side cursor.
+
+    :return:
+    """
+    """
+    Set the size of the partitions read from the cursor
+    """
+    mocker.patch.object(config, "exptbat", batch)
+
+    """
+    Perform the action of visiting the endpoint
+    """
+    response = await client.get("/api/v1/order/export/internal", headers={"Accept-Encoding": "identity"})
+
+    """
+    Test the response
+    """
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert "content-encoding" not in response.headers
+    assert [json.loads(line) for line in response.text.splitlines()] == _expected_orders()
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="ORDER EXPORT Endpoint - Stream all the order details as gzipped CSV")])
+async def test_export_orders_csv_gzip(client: AsyncClient, internal_reports: None, db_test_create: None, db_test_data: None, _: None) -> None:
+    """
+    Test the `export` endpoint streaming all the order details of the Order API as CSV compressed
+    with gzip.
+
+    :param client: The test client to send HTTP requests.
+    :param internal_reports: Fixture to enable the endpoints which require no authentication.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+
+    :return:
+    """
+    """
+    Get the data for assertion
+    """
+    orders = {order.uuid: order for order in _test_data_orders().values()}
+    rows = [
+        {
+            "order_uuid": detail.order_id,
+            "user_id": orders[detail.order_id].user_id,
+            "order_date": orders[detail.order_id].order_date.date().isoformat(),
+            "total_price": str(orders[detail.order_id].total_price),
+            "product_id": detail.product_id,
+            "quantity": str(detail.quantity),
+            "price": str(detail.price),
+            "detail_uuid": detail.uuid,
+        }
+        for detail in _test_data_order_details().values()
+    ]
+
+    """
+    Perform the action of visiting the endpoint, reading the raw compressed body
+    """
+    async with client.stream("GET", "/api/v1/order/export/internal", params={"format": "csv"}, headers={"Accept-Encoding": "gzip"}) as response:
+        body = b"".join([chunk async for chunk in response.aiter_raw()])
+
+    """
+    Test the response
+    """
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-encoding"] == "gzip"
+    assert list(csv.DictReader(io.StringIO(gzip.decompress(body).decode("utf-8")))) == rows
+
+
+@pytest.mark.parametrize(
+    "offset_start, offset_end, present",
+    [
+        pytest.param(0, 0, True, id="ORDER EXPORT Endpoint - Stream the orders within the date range"),
+        pytest.param(1, 2, False, id="ORDER EXPORT Endpoint - Stream no orders outside the date range"),
+    ],
+)
+async def test_export_orders_date_range(
+    client: AsyncClient, internal_reports: None, db_test_create: None, db_test_data: None, offset_start: int, offset_end: int, present: bool
+) -> None:
+    """
+    Test the `export` endpoint of the Order API filtering the orders on their date.
+
+    :param client: The test client to send HTTP requests.
+    :param internal_reports: Fixture to enable the endpoints which require no authentication.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param offset_start: Days from the date of the orders to the start of the range.
+    :param offset_end: Days from the date of the orders to the end of the range.
+    :param present: Whether the orders fall within the date range.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint
+    """
+    today = next(iter(_test_data_orders().values())).order_date.date()
+    params = {"start": (today + timedelta(days=offset_start)).isoformat(), "end": (today + timedelta(days=offset_end)).isoformat()}
+    response = await client.get("/api/v1/order/export/internal", params=params)
+
+    """
+    Test the response
+    """
+    assert response.status_code == 200
+    assert [json.loads(line) for line in response.text.splitlines()] == (_expected_orders() if present else [])
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="ORDER EXPORT Endpoint - Fail to stream a reversed date range")])
+async def test_export_orders_fail(client: AsyncClient, internal_reports: None, db_test_create: None, _: None) -> None:
+    """
+    Test the `export` endpoint of the Order API rejecting a date range whose start is after its
+    end.
+
+    :param client: The test client to send HTTP requests.
+    :param internal_reports: Fixture to enable the endpoints which require no authentication.
+    :param db_test_create: Fixture which creates a test database.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint
+    """
+    response = await client.get("/api/v1/order/export/internal", params={"start": date(2025, 2, 1).isoformat(), "end": date(2025, 1, 1).isoformat()})
+
+    """
+    Test the response
+    """
+    assert response.status_code == 422
+    assert response.json()["detail"] == "The start of the date range is after its end"
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="ORDER EXPORT Endpoint - Hide the export of the orders by default")])
+async def test_export_orders_disabled(client: AsyncClient, db_test_create: None, db_test_data: None, _: None) -> None:
+    """
+    Test that the `export` endpoint of the Order API, which requires no authentication, answers 404
+    unless the configuration enables the internal reports.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint
+    """
+    response = await client.get("/api/v1/order/export/internal")
+
+    """
+    Test the response
+    """
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Not Found"
@@ -80,7 +80,7 @@ async def test_get_orders(
     """
     if present:
         assert response.status_code == 200
-        assert response.json() == {"action": "get", "orders": orders}
+        assert response.json() == {"action": "get", "orders": orders, "next_cursor": None}
     else:
         assert response.status_code == 404
         assert response.json()["detail"] == "No orders in database"
@@ -128,7 +128,7 @@ async def test_get_orders_internal(client: AsyncClient, db_test_create: None, db
     Test the response
     """
     assert response.status_code == 200
-    assert response.json() == {"action": "get", "orders": orders}
+    assert response.json() == {"action": "get", "orders": orders, "next_cursor": None}
 
 
 @pytest.mark.parametrize("_", [pytest.param(None, id="ORDER GET Endpoint - Fail to fetch order")])
@@ -0,0 +1,220 @@
+from datetime import date
+
+import pytest
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+from sqlalchemy.future import select
+
+from fastapi_ecom.config import config
+from fastapi_ecom.database import get_async_session
+from fastapi_ecom.database.models.product import Product
+
+
+async def fetch_products() -> dict[str, Product]:
+    """
+    Fetch all the products of the test database.
+
+    :return: The products keyed on their UUID.
+    """
+    async with get_async_session()() as db:
+        return {product.uuid: product for product in (await db.execute(select(Product))).scalars()}
+
+
+@pytest.mark.parametrize(
+    "payload, count, missing, changed",
+    [
+        pytest.param(
+            {
+                "products": [
+                    {"uuid": "d5cf6983", "price": 30.0, "mfg_date": "2025-01-01T00:00:00"},
+                    {"uuid": "10677ef1", "name": "repriced", "price": 70.0},
+                    {"uuid": "3250fcbe", "price": 1.0},
+                    {"uuid": "nonexist", "price": 1.0},
+                    {"uuid": "10677ef1", "price": 80.0},
+                ]
+            },
+            2,
+            ["3250fcbe", "nonexist"],
+            {"d5cf6983": {"price": 30.0, "mfg_date": date(2025, 1, 1)}, "10677ef1": {"price": 80.0, "name": "test_prod_5"}},
+            id="PRODUCT BULK Endpoint - Update the listed products with their own changes",
+        ),
+        pytest.param(
+            {"category": "test", "changes": {"price": 10.0}},
+            2,
+            [],
+            {"d5cf6983": {"price": 10.0}, "10677ef1": {"price": 10.0}},
+            id="PRODUCT BULK Endpoint - Update the products of a category",
+        ),
+        pytest.param(
+            {"category": "other", "changes": {"price": 10.0}},
+            0,
+            [],
+            {},
+            id="PRODUCT BULK Endpoint - Update no products of an empty category",
+        ),
+    ],
+)
+async def test_bulk_update_product(
+    client: AsyncClient,
+    db_test_create: None,
+    db_test_data: None,
+    apply_security_override: None,
+    query_counter: list[str],
+    mocker: MockerFixture,
+    payload: dict,
+    count: int,
+    missing: list[str],
+    changed: dict[str, dict],
+) -> None:
+    """
+    Test the `bulk-update` endpoint of the Product API updating the products of the business only,
+    a chunk of products per statement, and bumping their version.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param apply_security_override: Fixture to set up test client with dependency override for `security`.
+    :param query_counter: Fixture which records the SQL statements sent to the database.
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+    :param payload: Body of the request.
+    :param count: The expected number of products updated.
+    :param missing: The expected UUIDs matching no product of the business.
+    :param changed: The expected attributes of the products updated.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint with chunks of three products
+    """
+    mocker.patch.object(config, "bulkbat", 3)
+    before = await fetch_products()
+    query_counter.clear()
+    response = await client.put("/api/v1/product/bulk-update", json=payload)
+
+    """
+    Test the response
+    """
+    assert response.status_code == 202
+    assert response.json() == {"action": "put", "count": count, "missing": missing}
+    assert len([query for query in query_counter if query.startswith("UPDATE products")]) == (2 if "products" in payload else 1)
+
+    """
+    Test the products updated, a product listed twice taking its last changes, and that the
+    others are left alone
+    """
+    after = await fetch_products()
+    for uuid, product in after.items():
+        if uuid in changed:
+            assert product.version == before[uuid].version + 1
+            assert {item: getattr(product, item) for item in changed[uuid]} == changed[uuid]
+        else:
+            assert (product.version, product.price, product.name) == (before[uuid].version, before[uuid].price, before[uuid].name)
+
+
+@pytest.mark.parametrize(
+    "path, payload, detail",
+    [
+        pytest.param(
+            "/api/v1/product/bulk-update",
+            {"products": [{"uuid": "d5cf6983", "price": 30.0}], "category": "test", "changes": {"price": 1.0}},
+            "Either list the products or give their category, but not both",
+            id="PRODUCT BULK Endpoint - Fail to update products both listed and selected with a category",
+        ),
+        pytest.param(
+            "/api/v1/product/bulk-update",
+            {"category": "test"},
+            "No changes given for the products of the category",
+            id="PRODUCT BULK Endpoint - Fail to update the products of a category without changes",
+        ),
+        pytest.param(
+            "/api/v1/product/bulk-delete",
+            {},
+            "Either list the products or give their category, but not both",
+            id="PRODUCT BULK Endpoint - Fail to delete products neither listed nor selected with a category",
+        ),
+    ],
+)
+async def test_bulk_product_fail(
+    client: AsyncClient, db_test_create: None, db_test_data: None, apply_security_override: None, path: str, payload: dict, detail: str
+) -> None:
+    """
+    Test the bulk endpoints of the Product API rejecting a request which does not select the
+    products in exactly one way.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param apply_security_override: Fixture to set up test client with dependency override for `security`.
+    :param path: Path of the endpoint.
+    :param payload: Body of the request.
+    :param detail: The expected detail of the error.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint
+    """
+    response = await client.request("PUT" if path.endswith("update") else "POST", path, json=payload)
+
+    """
+    Test the response
+    """
+    assert response.status_code == 422
+    assert response.json()["detail"] == detail
+
+
+@pytest.mark.parametrize(
+    "payload, count, missing",
+    [
+        pytest.param(
+            {"uuids": ["d5cf6983", "3250fcbe", "nonexist", "d5cf6983"]},
+            1,
+            ["3250fcbe", "nonexist"],
+            id="PRODUCT BULK Endpoint - Delete the listed products",
+        ),
+        pytest.param({"category": "test"}, 2, [], id="PRODUCT BULK Endpoint - Delete the products of a category"),
+    ],
+)
+async def test_bulk_delete_product(
+    client: AsyncClient,
+    db_test_create: None,
+    db_test_data: None,
+    apply_security_override: None,
+    mocker: MockerFixture,
+    payload: dict,
+    count: int,
+    missing: list[str],
+) -> None:
+    """
+    Test the `bulk-delete` endpoint of the Product API deleting the products of the business only.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param apply_security_override: Fixture to set up test client with dependency override for `security`.
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+    :param payload: Body of the request.
+    :param count: The expected number of products deleted.
+    :param missing: The expected UUIDs matching no product of the business.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint with chunks of two products
+    """
+    mocker.patch.object(config, "bulkbat", 2)
+    before = await fetch_products()
+    response = await client.post("/api/v1/product/bulk-delete", json=payload)
+
+    """
+    Test the response
+    """
+    assert response.status_code == 202
+    assert response.json() == {"action": "delete", "count": count, "missing": missing}
+
+    """
+    Test that only the products of the business are deleted
+    """
+    after = await fetch_products()
+    assert len(before) - len(after) == count
+    assert {"3250fcbe", "4e6c9aea", "2e7a5e2d"} <= set(after)
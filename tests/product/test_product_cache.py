@@ -0,0 +1,225 @@
+import pytest
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+
+from fastapi_ecom.config import config
+from fastapi_ecom.utils.response_cache import response_cache
+
+
+@pytest.mark.parametrize(
+    "path, params",
+    [
+        pytest.param("/api/v1/product/search", {}, id="PRODUCT CACHE Endpoint - Serve the products from the cache"),
+        pytest.param(
+            "/api/v1/product/search/name/Test", {"limit": 2}, id="PRODUCT CACHE Endpoint - Serve the products matching a text from the cache"
+        ),
+        pytest.param("/api/v1/business/search", {}, id="BUSINESS CACHE Endpoint - Serve the businesses from the cache"),
+    ],
+)
+async def test_get_catalog_cached(
+    client: AsyncClient, db_test_create: None, db_test_data: None, query_counter: list[str], path: str, params: dict[str, int]
+) -> None:
+    """
+    Test that the public catalog endpoints serve a page from the cache without querying the
+    database once it was built, and that the same page requested with other parameters is built
+    on its own.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param query_counter: Fixture which records the SQL statements sent to the database.
+    :param path: Path of the endpoint.
+    :param params: Query parameters of the request.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint twice
+    """
+    first = await client.get(path, params=params)
+    query_counter.clear()
+    second = await client.get(path, params=params)
+
+    """
+    Test the response
+    """
+    assert first.status_code == second.status_code == 200
+    assert second.content == first.content
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert second.headers["content-type"] == "application/json"
+    assert query_counter == []
+    assert response_cache.hits == 1
+
+    """
+    Test that other parameters miss the cache
+    """
+    third = await client.get(path, params=params | {"limit": 1})
+    assert third.status_code == 200
+    assert query_counter != []
+    assert third.headers["ETag"] != first.headers["ETag"]
+
+
+@pytest.mark.parametrize(
+    "params, others",
+    [
+        pytest.param(
+            "category=test&limit=2",
+            "category=test%26limit%3D2",
+            id="PRODUCT CACHE Endpoint - Tell a parameter apart from a value holding the same characters",
+        ),
+    ],
+)
+async def test_get_catalog_cached_apart(client: AsyncClient, db_test_create: None, db_test_data: None, params: str, others: str) -> None:
+    """
+    Test that the pages requested with parameters whose names and values join into the same text
+    are cached apart.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param params: Query string of the request cached first.
+    :param others: Query string of the request cached next.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint with both query strings
+    """
+    first = await client.get(f"/api/v1/product/search?{params}")
+    second = await client.get(f"/api/v1/product/search?{others}")
+
+    """
+    Test that the second page is not served from the first one
+    """
+    assert first.status_code == 200
+    assert second.status_code == 404
+    assert response_cache.hits == 0
+
+
+@pytest.mark.parametrize(
+    "weak, cached",
+    [
+        pytest.param(False, False, id="PRODUCT CACHE Endpoint - Answer 304 to a client holding the page just built"),
+        pytest.param(True, True, id="PRODUCT CACHE Endpoint - Answer 304 to a client holding the cached page with a weak tag"),
+    ],
+)
+async def test_get_products_not_modified(
+    client: AsyncClient, db_test_create: None, db_test_data: None, mocker: MockerFixture, weak: bool, cached: bool
+) -> None:
+    """
+    Test that the `get` endpoint of the Product API answers 304 Not Modified to a conditional
+    request holding the page, whether the page is built or served from the cache.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+    :param weak: Whether the entity tag is sent as a weak one.
+    :param cached: Whether the page is served from the cache.
+
+    :return:
+    """
+    """
+    Get the entity tag of the page, then disable the cache unless the page is to be served from it
+    """
+    etag = (await client.get("/api/v1/product/search")).headers["ETag"]
+    if not cached:
+        mocker.patch.object(config, "rspcttl", 0)
+
+    """
+    Perform the action of visiting the endpoint with the entity tag
+    """
+    response = await client.get("/api/v1/product/search", headers={"If-None-Match": f"W/{etag}" if weak else etag})
+
+    """
+    Test the response
+    """
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+    assert response_cache.hits == (1 if cached else 0)
+    response = await client.get("/api/v1/product/search", headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize(
+    "method, path, payload, page",
+    [
+        pytest.param(
+            "put",
+            "/api/v1/product/update/uuid/10677ef1",
+            {"name": "renamed"},
+            "/api/v1/product/search",
+            id="PRODUCT CACHE Endpoint - Invalidate on a product update",
+        ),
+        pytest.param(
+            "delete",
+            "/api/v1/product/delete/uuid/10677ef1",
+            None,
+            "/api/v1/product/search",
+            id="PRODUCT CACHE Endpoint - Invalidate on a product delete",
+        ),
+        pytest.param(
+            "put",
+            "/api/v1/product/bulk-update",
+            {"products": [{"uuid": "10677ef1", "price": 75.0}]},
+            "/api/v1/product/search",
+            id="PRODUCT CACHE Endpoint - Invalidate on a product bulk update",
+        ),
+        pytest.param(
+            "post",
+            "/api/v1/product/bulk-delete",
+            {"category": "test"},
+            "/api/v1/product/search",
+            id="PRODUCT CACHE Endpoint - Invalidate on a product bulk delete",
+        ),
+        pytest.param(
+            "put",
+            "/api/v1/business/update/me",
+            {"city": "renamed"},
+            "/api/v1/business/search",
+            id="BUSINESS CACHE Endpoint - Invalidate on a business update",
+        ),
+        pytest.param(
+            "delete", "/api/v1/business/delete/me", None, "/api/v1/business/search", id="BUSINESS CACHE Endpoint - Invalidate on a business delete"
+        ),
+    ],
+)
+async def test_get_catalog_invalidated(
+    client: AsyncClient,
+    db_test_create: None,
+    db_test_data: None,
+    apply_security_override: None,
+    method: str,
+    path: str,
+    payload: dict | None,
+    page: str,
+) -> None:
+    """
+    Test that none of the pages of the catalog cached before a change to the products or the
+    businesses is served after it.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param apply_security_override: Fixture to set up test client with dependency override for `security`.
+    :param method: HTTP method of the change.
+    :param path: Path of the endpoint making the change.
+    :param payload: Body of the change, if any.
+    :param page: Path of the page changed by the change.
+
+    :return:
+    """
+    """
+    Cache the pages, then perform the action of changing the catalog
+    """
+    before = {url: await client.get(url) for url in ["/api/v1/product/search", "/api/v1/business/search"]}
+    response = await client.request(method, path, json=payload)
+    assert response.status_code == 202
+
+    """
+    Test that the pages are built again, and that the one changed differs
+    """
+    after = {url: await client.get(url) for url in before}
+    assert response_cache.hits == 0
+    assert after[page].headers["ETag"] != before[page].headers["ETag"]
@@ -1,3 +1,5 @@
+import re
+
 import pytest
 from httpx import AsyncClient
 
@@ -62,3 +64,36 @@ async def test_delete_product(
     else:
         assert response.status_code == 404
         assert response.json()["detail"] == "Product not present in database"
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="PRODUCT DELETE Endpoint - Delete the product returning it without selecting it beforehand")])
+async def test_delete_product_returning(
+    client: AsyncClient, db_test_create: None, db_test_data: None, apply_security_override: None, query_counter: list[str], _: None
+) -> None:
+    """
+    Test that the `delete` endpoint of the Product API deletes the product with a single statement
+    returning the deleted row, without selecting the product and the order details referencing it
+    beforehand.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param apply_security_override: Fixture to set up test client with dependency override for `security`.
+    :param query_counter: Fixture which records the SQL statements sent to the database.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint
+    """
+    query_counter.clear()
+    response = await client.delete("/api/v1/product/delete/uuid/d5cf6983")
+
+    """
+    Test the response and the statements sent to the database
+    """
+    assert response.status_code == 202
+    assert response.json()["product"]["uuid"] == "d5cf6983"
+    deletes = [statement for statement in query_counter if statement.startswith("DELETE FROM products")]
+    assert len(deletes) == 1 and "RETURNING" in deletes[0]
+    assert not [statement for statement in query_counter if statement.startswith("SELECT") and re.search(r"WHERE products\.uuid = ", statement)]
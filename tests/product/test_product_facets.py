@@ -0,0 +1,189 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+
+from fastapi_ecom.database import get_async_session
+from fastapi_ecom.database.models.product import Product
+
+TODAY = datetime.now(timezone.utc).date()
+
+
+@pytest.mark.parametrize(
+    "params, names",
+    [
+        pytest.param(
+            {"category": "test"},
+            ["test_prod_1", "test_prod_2", "test_prod_3", "test_prod_4", "test_prod_5"],
+            id="PRODUCT FILTER Endpoint - Fetch the products of a category",
+        ),
+        pytest.param({"category": "other"}, [], id="PRODUCT FILTER Endpoint - Fail to fetch any product of a category"),
+        pytest.param(
+            {"min_price": 65, "max_price": 115},
+            ["test_prod_1", "test_prod_3", "test_prod_5"],
+            id="PRODUCT FILTER Endpoint - Fetch the products within a price range",
+        ),
+        pytest.param(
+            {"category": ["other", "test"], "max_price": 50},
+            ["test_prod_4"],
+            id="PRODUCT FILTER Endpoint - Fetch the products of any category below a price",
+        ),
+        pytest.param(
+            {"mfg_from": TODAY.isoformat(), "mfg_to": TODAY.isoformat(), "not_expired": True},
+            ["test_prod_1", "test_prod_2", "test_prod_3", "test_prod_4", "test_prod_5"],
+            id="PRODUCT FILTER Endpoint - Fetch the products manufactured on a day and not expired yet",
+        ),
+        pytest.param(
+            {"exp_to": (TODAY - timedelta(days=1)).isoformat()}, [], id="PRODUCT FILTER Endpoint - Fail to fetch any product expired before a day"
+        ),
+    ],
+)
+async def test_get_products_filtered(client: AsyncClient, db_test_create: None, db_test_data: None, params: dict, names: list[str]) -> None:
+    """
+    Test the `get` endpoint of the Product API filtering the products.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param params: The filters of the request.
+    :param names: Names of the products expected to match.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint
+    """
+    response = await client.get("/api/v1/product/search", params=params)
+
+    """
+    Test the response
+    """
+    if names:
+        assert response.status_code == 200
+        assert [product["name"] for product in response.json()["products"]] == names
+    else:
+        assert response.status_code == 404
+        assert response.json()["detail"] == "No product present in database"
+
+
+@pytest.mark.parametrize(
+    "path, params, detail",
+    [
+        pytest.param(
+            "/api/v1/product/search",
+            {"min_price": 100, "max_price": 50},
+            "The start of the price range is after its end",
+            id="PRODUCT FILTER Endpoint - Fail to fetch the products within a reversed price range",
+        ),
+        pytest.param(
+            "/api/v1/product/facets",
+            {"mfg_from": date(2025, 2, 1).isoformat(), "mfg_to": date(2025, 1, 1).isoformat()},
+            "The start of the manufacturing date range is after its end",
+            id="PRODUCT FACET Endpoint - Fail to count the products within a reversed date range",
+        ),
+    ],
+)
+async def test_get_products_filtered_fail(client: AsyncClient, db_test_create: None, path: str, params: dict, detail: str) -> None:
+    """
+    Test the endpoints of the Product API rejecting a filtered range whose start is after its end.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param path: Path of the endpoint.
+    :param params: The filters of the request.
+    :param detail: The expected detail of the error.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint
+    """
+    response = await client.get(path, params=params)
+
+    """
+    Test the response
+    """
+    assert response.status_code == 422
+    assert response.json()["detail"] == detail
+
+
+@pytest.mark.parametrize(
+    "params, total, categories, prices",
+    [
+        pytest.param(
+            {},
+            7,
+            [{"category": "test", "count": 5}, {"category": "garden", "count": 1}, {"category": "kitchen", "count": 1}],
+            [0, 1, 1, 3, 1, 1],
+            id="PRODUCT FACET Endpoint - Count all the products per category and price bucket",
+        ),
+        pytest.param(
+            {"min_price": 100, "category": ["test", "garden"]},
+            4,
+            [{"category": "test", "count": 3}, {"category": "garden", "count": 1}],
+            [0, 0, 0, 3, 0, 1],
+            id="PRODUCT FACET Endpoint - Count the filtered products per category and price bucket",
+        ),
+        pytest.param(
+            {"category": "other"},
+            0,
+            [],
+            [0, 0, 0, 0, 0, 0],
+            id="PRODUCT FACET Endpoint - Count no products",
+        ),
+    ],
+)
+async def test_get_product_facets(
+    client: AsyncClient,
+    db_test_create: None,
+    db_test_data: None,
+    query_counter: list[str],
+    params: dict,
+    total: int,
+    categories: list[dict],
+    prices: list[int],
+) -> None:
+    """
+    Test the `facets` endpoint of the Product API counting the products per category and per price
+    bucket in a single query.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param query_counter: Fixture which records the SQL statements sent to the database.
+    :param params: The filters of the request.
+    :param total: The expected number of matching products.
+    :param categories: The expected counts per category.
+    :param prices: The expected counts per price bucket.
+
+    :return:
+    """
+    """
+    Add products of other categories in the most expensive buckets
+    """
+    today = datetime.now(timezone.utc)
+    async with get_async_session()() as db:
+        for uuid, category, price in [("kitchen1", "kitchen", 500.0), ("garden01", "garden", 1500.0)]:
+            db.add(
+                Product(uuid=uuid, name=uuid, description="", category=category, mfg_date=today, exp_date=today, price=price, business_id="d76a11f2")
+            )
+        await db.commit()
+
+    """
+    Perform the action of visiting the endpoint
+    """
+    query_counter.clear()
+    response = await client.get("/api/v1/product/facets", params=params)
+
+    """
+    Test the response
+    """
+    assert response.status_code == 200
+    assert len(query_counter) == 1
+    bounds = [None, 10, 50, 100, 500, 1000, None]
+    assert response.json() == {
+        "action": "get",
+        "total": total,
+        "categories": categories,
+        "prices": [{"min": bounds[indx], "max": bounds[indx + 1], "count": count} for indx, count in enumerate(prices)],
+    }
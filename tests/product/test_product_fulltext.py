@@ -0,0 +1,188 @@
+from datetime import datetime, timezone
+
+import pytest
+from httpx import AsyncClient
+
+from fastapi_ecom.database import get_async_session
+from fastapi_ecom.database.models.product import Product
+from fastapi_ecom.utils.fulltext import fts5_query
+
+
+@pytest.mark.parametrize(
+    "text, names",
+    [
+        pytest.param("Second", ["test_prod_2"], id="PRODUCT FULLTEXT Endpoint - Fetch the product matching a word"),
+        pytest.param("fifth products", ["test_prod_5"], id="PRODUCT FULLTEXT Endpoint - Fetch the product matching all the stemmed words"),
+        pytest.param("test_prod_3", ["test_prod_3"], id="PRODUCT FULLTEXT Endpoint - Fetch the product matching a punctuated name"),
+        pytest.param("Sixth", [], id="PRODUCT FULLTEXT Endpoint - Fail to fetch any product matching a word"),
+        pytest.param('"* OR -', [], id="PRODUCT FULLTEXT Endpoint - Fail to fetch any product without a word"),
+    ],
+)
+async def test_get_product_fulltext(client: AsyncClient, db_test_create: None, db_test_data: None, text: str, names: list[str]) -> None:
+    """
+    Test the `get` endpoint of the Product API searching the products in full-text.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param text: The search string.
+    :param names: Names of the products expected to match.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint
+    """
+    response = await client.get(f"/api/v1/product/search/name/{text}", params={"mode": "fulltext"})
+
+    """
+    Test the response
+    """
+    if names:
+        assert response.status_code == 200
+        assert [product["name"] for product in response.json()["products"]] == names
+    else:
+        assert response.status_code == 404
+        assert response.json()["detail"] == "No such product present in database"
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="PRODUCT FULLTEXT Endpoint - Rank the products matching on their name first")])
+async def test_get_product_fulltext_rank(client: AsyncClient, db_test_create: None, db_test_data: None, _: None) -> None:
+    """
+    Test that the full-text search of the Product API lists the products by relevance, with the
+    products matching on their name before those matching on their description, whatever the order
+    they were created in.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+
+    :return:
+    """
+    """
+    Add a product mentioning a lamp in its description before one named after it
+    """
+    today = datetime.now(timezone.utc)
+    async with get_async_session()() as db:
+        db.add(
+            Product(
+                uuid="deskdesk",
+                name="desk",
+                description="Desk fitted with a lamp",
+                category="test",
+                mfg_date=today,
+                exp_date=today,
+                price=1.0,
+                business_id="d76a11f2",
+            )
+        )
+        await db.flush()
+        db.add(
+            Product(
+                uuid="lamplamp", name="lamp", description="Bright", category="test", mfg_date=today, exp_date=today, price=1.0, business_id="d76a11f2"
+            )
+        )
+        await db.commit()
+
+    """
+    Perform the action of visiting the endpoint
+    """
+    response = await client.get("/api/v1/product/search/name/lamps", params={"mode": "fulltext"})
+
+    """
+    Test the response
+    """
+    assert response.status_code == 200
+    assert [product["name"] for product in response.json()["products"]] == ["lamp", "desk"]
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="PRODUCT FULLTEXT Endpoint - Walk the ranked products two at a time with the cursor")])
+async def test_get_product_fulltext_cursor(client: AsyncClient, db_test_create: None, db_test_data: None, _: None) -> None:
+    """
+    Test that following the cursor of the full-text search of the Product API walks all the
+    matching products exactly once in the order of their relevance.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+
+    :return:
+    """
+    """
+    Get the data for assertion
+    """
+    response = await client.get("/api/v1/product/search/name/product", params={"mode": "fulltext"})
+    ranked = [product["name"] for product in response.json()["products"]]
+
+    """
+    Perform the action of visiting the endpoint page after page
+    """
+    seen, cursor = [], None
+    while True:
+        params = {"mode": "fulltext", "limit": 2} | ({"cursor": cursor} if cursor else {})
+        response = await client.get("/api/v1/product/search/name/product", params=params)
+        assert response.status_code == 200
+        seen.extend(product["name"] for product in response.json()["products"])
+        cursor = response.json()["next_cursor"]
+        if cursor is None:
+            break
+
+    """
+    Test that every product is seen once in the order of relevance
+    """
+    assert sorted(ranked) == ["test_prod_1", "test_prod_2", "test_prod_3", "test_prod_4", "test_prod_5"]
+    assert seen == ranked
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="PRODUCT FULLTEXT Endpoint - Keep the full-text index in sync with updates and deletes")])
+async def test_get_product_fulltext_sync(
+    client: AsyncClient, db_test_create: None, db_test_data: None, apply_security_override: None, _: None
+) -> None:
+    """
+    Test that the full-text index of the Product API follows the products being renamed and
+    deleted.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param apply_security_override: Fixture to set up test client with dependency override for `security`.
+
+    :return:
+    """
+    """
+    Perform the action of renaming a product and deleting another one
+    """
+    response = await client.put("/api/v1/product/update/uuid/10677ef1", json={"description": "Refurbished gadget"})
+    assert response.status_code == 202
+    response = await client.delete("/api/v1/product/delete/uuid/d5cf6983")
+    assert response.status_code == 202
+
+    """
+    Test that the search follows the changes
+    """
+    response = await client.get("/api/v1/product/search/name/gadget", params={"mode": "fulltext"})
+    assert [product["name"] for product in response.json()["products"]] == ["test_prod_5"]
+    response = await client.get("/api/v1/product/search/name/Fourth", params={"mode": "fulltext"})
+    assert response.status_code == 404
+    response = await client.get("/api/v1/product/search/name/Fifth", params={"mode": "fulltext"})
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize(
+    "text, query",
+    [
+        pytest.param("red shoes", '"red" "shoes"', id="PRODUCT FULLTEXT Query - Quote every word"),
+        pytest.param('shoes" OR NEAR(*', '"shoes" "OR" "NEAR"', id="PRODUCT FULLTEXT Query - Take the query syntax literally"),
+        pytest.param("--", None, id="PRODUCT FULLTEXT Query - Match nothing without a word"),
+    ],
+)
+def test_fts5_query(text: str, query: str | None) -> None:
+    """
+    Test turning a search string into an FTS5 query.
+
+    :param text: The search string.
+    :param query: The expected FTS5 query.
+
+    :return:
+    """
+    assert fts5_query(text) == query
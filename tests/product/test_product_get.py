@@ -4,6 +4,7 @@ from fastapi.security import HTTPBasicCredentials
 from httpx import AsyncClient
 from pytest_mock import MockerFixture
 
+from fastapi_ecom.config import config
 from fastapi_ecom.utils.basic_auth import security
 from tests.product import _test_data_product
 
@@ -44,7 +45,7 @@ async def test_get_products(client: AsyncClient, db_test_create: None, db_test_d
     Test the response
     """
     assert response.status_code == 200
-    assert response.json() == {"action": "get", "products": products}
+    assert response.json() == {"action": "get", "products": products, "next_cursor": None}
 
 
 @pytest.mark.parametrize("_", [pytest.param(None, id="CUSTOMER GET Endpoint - Fail to fetch product")])
@@ -71,6 +72,98 @@ async def test_get_products_fail(
     assert response.json()["detail"] == "No product present in database"
 
 
+@pytest.mark.parametrize(
+    "limit",
+    [
+        pytest.param(1, id="PRODUCT GET Endpoint - Walk the products one at a time with the cursor"),
+        pytest.param(2, id="PRODUCT GET Endpoint - Walk the products two at a time with the cursor"),
+    ],
+)
+async def test_get_products_cursor(client: AsyncClient, db_test_create: None, db_test_data: None, limit: int) -> None:
+    """
+    Test that following the cursor of the `get` endpoint of the Product API walks all the products
+    exactly once and stops on the last page.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param limit: Number of products in a page.
+
+    :return:
+    """
+    """
+    Get the data for assertion
+    """
+    names = [product.name for product in _test_data_product().values()]
+
+    """
+    Perform the action of visiting the endpoint page after page
+    """
+    seen, pages, cursor = [], 0, None
+    while True:
+        params = {"limit": limit} if cursor is None else {"limit": limit, "cursor": cursor}
+        response = await client.get("/api/v1/product/search", params=params)
+        assert response.status_code == 200
+        pages += 1
+        seen.extend(product["name"] for product in response.json()["products"])
+        cursor = response.json()["next_cursor"]
+        if cursor is None:
+            break
+
+    """
+    Test that every product is seen once in order
+    """
+    assert seen == names
+    assert pages == -(-len(names) // limit)
+
+
+@pytest.mark.parametrize(
+    "params, detail",
+    [
+        pytest.param({"cursor": "not-a-cursor"}, "Invalid pagination cursor", id="PRODUCT GET Endpoint - Fail to fetch with a malformed cursor"),
+        pytest.param(
+            {"cursor": "eyJpZCI6ICJ4In0"}, "Invalid pagination cursor", id="PRODUCT GET Endpoint - Fail to fetch with a cursor of wrong type"
+        ),
+        pytest.param(
+            {"skip": 3},
+            "Cannot skip more than 2 records - Paginate with the cursor instead",
+            id="PRODUCT GET Endpoint - Fail to skip beyond the configured cap",
+        ),
+    ],
+)
+async def test_get_products_cursor_fail(
+    client: AsyncClient, db_test_create: None, db_test_data: None, mocker: MockerFixture, params: dict, detail: str
+) -> None:
+    """
+    Test the `get` endpoint of the Product API rejecting malformed cursors and skips beyond the
+    configured cap.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+    :param params: Query parameters of the request.
+    :param detail: Expected detail of the error.
+
+    :return:
+    """
+    """
+    Cap the legacy skip parameter
+    """
+    mocker.patch.object(config, "skipmax", 2)
+
+    """
+    Perform the action of visiting the endpoint
+    """
+    response = await client.get("/api/v1/product/search", params=params)
+
+    """
+    Test the response
+    """
+    assert response.status_code == 422
+    assert response.json()["detail"] == detail
+
+
 @pytest.mark.parametrize(
     "text, present",
     [
@@ -118,7 +211,7 @@ async def test_get_product_by_text(client: AsyncClient, db_test_create: None, db
     """
     if present:
         assert response.status_code == 200
-        assert response.json() == {"action": "get", "products": products}
+        assert response.json() == {"action": "get", "products": products, "next_cursor": None}
     else:
         assert response.status_code == 404
         assert response.json()["detail"] == "No such product present in database"
@@ -196,7 +289,7 @@ async def test_get_products_internal(
     """
     if present:
         assert response.status_code == 200
-        assert response.json() == {"action": "get", "products": products}
+        assert response.json() == {"action": "get", "products": products, "next_cursor": None}
     else:
         assert response.status_code == 404
         assert response.json()["detail"] == "No product present in database"
@@ -0,0 +1,257 @@
+import asyncio
+import json
+
+import pytest
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+from sqlalchemy.future import select
+
+from fastapi_ecom.config import config
+from fastapi_ecom.database import get_async_session
+from fastapi_ecom.database.models.product import Product
+from fastapi_ecom.utils.search_index import product_index
+
+ROW = {
+    "name": "imported lamp",
+    "description": "A lamp imported in bulk",
+    "category": "lighting",
+    "mfg_date": "2024-01-01T00:00:00",
+    "exp_date": "2030-01-01T00:00:00",
+    "price": 20.0,
+}
+
+
+def chunked(body: bytes, size: int = 7):
+    """
+    Split an upload into small chunks, so that the lines and the records are cut across them.
+
+    :param body: The upload.
+    :param size: Number of bytes per chunk.
+
+    :return: An asynchronous generator of the chunks.
+    """
+
+    async def stream():
+        for start in range(0, len(body), size):
+            yield body[start : start + size]
+
+    return stream()
+
+
+@pytest.mark.parametrize(
+    "fmt, body, imported, errors",
+    [
+        pytest.param(
+            "ndjson",
+            "\n".join(json.dumps(ROW | {"name": f"imported lamp {indx}"}) for indx in range(5)) + "\n",
+            5,
+            [],
+            id="PRODUCT IMPORT Endpoint - Import products from NDJSON",
+        ),
+        pytest.param(
+            "ndjson",
+            "\n".join(
+                [
+                    json.dumps(ROW),
+                    "",
+                    "{not json",
+                    json.dumps(ROW | {"price": "free"}),
+                    "[1, 2]",
+                    json.dumps(ROW | {"name": "imported lamp ünicode"}),
+                ]
+            ),
+            2,
+            [
+                {"line": 3, "detail": "Line is not valid JSON"},
+                {"line": 4, "detail": "price: Input should be a valid number, unable to parse string as a number"},
+                {"line": 5, "detail": "Line is not a JSON object"},
+            ],
+            id="PRODUCT IMPORT Endpoint - Import the valid products from NDJSON and report the others",
+        ),
+        pytest.param(
+            "csv",
+            "name,description,category,mfg_date,exp_date,price\r\n"
+            'imported lamp,"A lamp\nover two lines, with a ""quote""",lighting,2024-01-01,2030-01-01,20\r\n'
+            "\r\n"
+            "imported shade,A shade,lighting,2024-01-01,2030-01-01\r\n"
+            "imported bulb,A bulb,lighting,2024-01-01,2030-01-01,5",
+            2,
+            [{"line": 5, "detail": "Record holds 5 fields instead of 6"}],
+            id="PRODUCT IMPORT Endpoint - Import the valid products from CSV and report the others",
+        ),
+    ],
+)
+async def test_import_product(
+    client: AsyncClient,
+    db_test_create: None,
+    db_test_data: None,
+    apply_security_override: None,
+    mocker: MockerFixture,
+    fmt: str,
+    body: str,
+    imported: int,
+    errors: list[dict],
+) -> None:
+    """
+    Test the `import` endpoint of the Product API loading the valid rows of an upload a chunk at a
+    time and reporting the others.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param apply_security_override: Fixture to set up test client with dependency override for `security`.
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+    :param fmt: Format of the upload.
+    :param body: The upload.
+    :param imported: The expected number of products imported.
+    :param errors: The expected rejected rows.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint with a chunked upload and small chunks of products
+    """
+    mocker.patch.object(config, "imptbat", 2)
+    response = await client.post("/api/v1/product/import", params={"format": fmt}, content=chunked(body.encode()))
+
+    """
+    Test the response
+    """
+    assert response.status_code == 201
+    assert response.json() == {"action": "post", "imported": imported, "failed": len(errors), "errors": errors}
+
+    """
+    Test the products imported
+    """
+    async with get_async_session()() as db:
+        products = (await db.execute(select(Product).where(Product.category == "lighting").order_by(Product.id))).scalars().all()
+    assert len(products) == imported
+    assert len({product.uuid for product in products}) == imported
+    assert all(product.business_id == "5c1c48fb" and product.version == 0 for product in products)
+    if fmt == "csv":
+        assert products[0].description == 'A lamp\nover two lines, with a "quote"'
+
+
+async def test_import_product_errors_capped(
+    client: AsyncClient, db_test_create: None, db_test_data: None, apply_security_override: None, mocker: MockerFixture
+) -> None:
+    """
+    Test the `import` endpoint of the Product API counting all the rejected rows while reporting
+    only the configured number of them.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param apply_security_override: Fixture to set up test client with dependency override for `security`.
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint with more invalid rows than reported
+    """
+    mocker.patch.object(config, "impterrs", 3)
+    response = await client.post("/api/v1/product/import", content="{}\n" * 10)
+
+    """
+    Test the response
+    """
+    assert response.status_code == 201
+    assert response.json()["imported"] == 0
+    assert response.json()["failed"] == 10
+    assert [error["line"] for error in response.json()["errors"]] == [1, 2, 3]
+
+
+@pytest.mark.parametrize(
+    "fmt, body, detail",
+    [
+        pytest.param(
+            "csv",
+            "name,description,price\r\n",
+            "The CSV header lacks the fields: category, mfg_date, exp_date",
+            id="PRODUCT IMPORT Endpoint - Fail to import CSV lacking fields",
+        ),
+        pytest.param(
+            "ndjson", b'{"name": "\xff"}\n', "The upload is not valid UTF-8", id="PRODUCT IMPORT Endpoint - Fail to import an upload not in UTF-8"
+        ),
+        pytest.param(
+            "ndjson",
+            json.dumps(ROW) + "\n" + "x" * 300,
+            "Line 2 is longer than 200 characters",
+            id="PRODUCT IMPORT Endpoint - Fail to import a line longer than the limit",
+        ),
+        pytest.param(
+            "csv",
+            "name,description,category,mfg_date,exp_date,price\n" + '"open,' + "a\n" * 150,
+            "Record 2 is longer than 200 characters",
+            id="PRODUCT IMPORT Endpoint - Fail to import a CSV record left open longer than the limit",
+        ),
+    ],
+)
+async def test_import_product_fail(
+    client: AsyncClient,
+    db_test_create: None,
+    db_test_data: None,
+    apply_security_override: None,
+    mocker: MockerFixture,
+    fmt: str,
+    body: str | bytes,
+    detail: str,
+) -> None:
+    """
+    Test the `import` endpoint of the Product API rejecting an upload which cannot be parsed, or
+    which holds a line or a record too long to be held in memory.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param apply_security_override: Fixture to set up test client with dependency override for `security`.
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+    :param fmt: Format of the upload.
+    :param body: The upload.
+    :param detail: The expected detail of the error.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint with lines and records of 200 characters at most
+    """
+    mocker.patch.object(config, "imptlmax", 200)
+    response = await client.post("/api/v1/product/import", params={"format": fmt}, content=chunked(body.encode() if isinstance(body, str) else body))
+
+    """
+    Test the response
+    """
+    assert response.status_code == 422
+    assert response.json()["detail"] == detail
+
+
+async def test_import_product_searchable(client: AsyncClient, db_test_create: None, db_test_index: None, apply_security_override: None) -> None:
+    """
+    Test that the products imported show up in the cached catalog and in the search index once
+    the import commits.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_index: Fixture to build the product search index from the initial test data.
+    :param apply_security_override: Fixture to set up test client with dependency override for `security`.
+
+    :return:
+    """
+    """
+    Cache the catalog, then perform the action of importing a product
+    """
+    before = await client.get("/api/v1/product/search")
+    response = await client.post("/api/v1/product/import", content=json.dumps(ROW))
+    assert response.status_code == 201
+    await asyncio.gather(*product_index._tasks)
+
+    """
+    Test that the product is listed and searchable
+    """
+    after = await client.get("/api/v1/product/search")
+    assert after.headers["ETag"] != before.headers["ETag"]
+    assert product_index.builds == 2
+    response = await client.get("/api/v1/product/search/name/lamp", params={"mode": "index"})
+    assert response.status_code == 200
+    assert [product["name"] for product in response.json()["products"]] == ["imported lamp"]
@@ -0,0 +1,389 @@
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import pytest
+from httpx import AsyncClient
+from pytest_mock import MockerFixture
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from fastapi_ecom.database import get_async_session
+from fastapi_ecom.database.models.product import Product
+from fastapi_ecom.utils.search_index import product_index, tokenize
+
+
+@pytest.mark.parametrize(
+    "text, names",
+    [
+        pytest.param("Second", ["test_prod_2"], id="PRODUCT INDEX Endpoint - Fetch the product matching a word"),
+        pytest.param("FIFTH products", ["test_prod_5"], id="PRODUCT INDEX Endpoint - Fetch the product matching all the words"),
+        pytest.param("test_prod_3", ["test_prod_3"], id="PRODUCT INDEX Endpoint - Fetch the product matching its name"),
+        pytest.param("Sixth", [], id="PRODUCT INDEX Endpoint - Fail to fetch any product matching a word"),
+        pytest.param("Second Fifth", [], id="PRODUCT INDEX Endpoint - Fail to fetch any product matching all the words"),
+        pytest.param("!!!", [], id="PRODUCT INDEX Endpoint - Fail to fetch any product without a word"),
+    ],
+)
+async def test_get_product_index(
+    client: AsyncClient, db_test_create: None, db_test_index: None, query_counter: list[str], text: str, names: list[str]
+) -> None:
+    """
+    Test the `get` endpoint of the Product API searching the products from the search index,
+    without querying the database.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_index: Fixture to build the product search index from the initial test data.
+    :param query_counter: Fixture which records the SQL statements sent to the database.
+    :param text: The search string.
+    :param names: Names of the products expected to match.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint
+    """
+    query_counter.clear()
+    response = await client.get(f"/api/v1/product/search/name/{text}", params={"mode": "index"})
+
+    """
+    Test the response
+    """
+    assert query_counter == []
+    if names:
+        assert response.status_code == 200
+        assert [product["name"] for product in response.json()["products"]] == names
+    else:
+        assert response.status_code == 404
+        assert response.json()["detail"] == "No such product present in database"
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="PRODUCT INDEX Endpoint - Serve the products as the database does")])
+async def test_get_product_index_view(client: AsyncClient, db_test_create: None, db_test_index: None, _: None) -> None:
+    """
+    Test that the products served from the search index are the same as those served from the
+    database.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_index: Fixture to build the product search index from the initial test data.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint in both modes
+    """
+    from_index = await client.get("/api/v1/product/search/name/Third", params={"mode": "index"})
+    from_database = await client.get("/api/v1/product/search/name/Third", params={"mode": "fulltext"})
+
+    """
+    Test the response
+    """
+    assert from_index.status_code == 200
+    assert from_index.json()["products"] == from_database.json()["products"]
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="PRODUCT INDEX Endpoint - Search in full-text until the index is built")])
+async def test_get_product_index_fallback(client: AsyncClient, db_test_create: None, db_test_data: None, _: None) -> None:
+    """
+    Test that the `get` endpoint of the Product API searches the products in full-text from the
+    database while the search index is not built.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+
+    :return:
+    """
+    """
+    Perform the action of visiting the endpoint
+    """
+    response = await client.get("/api/v1/product/search/name/Second", params={"mode": "index"})
+
+    """
+    Test the response
+    """
+    assert not product_index.ready
+    assert response.status_code == 200
+    assert [product["name"] for product in response.json()["products"]] == ["test_prod_2"]
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="PRODUCT INDEX Endpoint - Rank the products matching on their name first")])
+async def test_get_product_index_rank(client: AsyncClient, db_test_create: None, db_test_data: None, _: None) -> None:
+    """
+    Test that the search index of the Product API lists the products by relevance, with the
+    products matching on their name before those matching on their description, whatever the order
+    they were created in.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+
+    :return:
+    """
+    """
+    Add a product mentioning a lamp in its description before one named after it, then build the
+    index
+    """
+    today = datetime.now(timezone.utc)
+    async with get_async_session()() as db:
+        db.add(
+            Product(
+                uuid="deskdesk",
+                name="desk",
+                description="Desk fitted with a lamp",
+                category="test",
+                mfg_date=today,
+                exp_date=today,
+                price=1.0,
+                business_id="d76a11f2",
+            )
+        )
+        await db.flush()
+        db.add(
+            Product(
+                uuid="lamplamp", name="lamp", description="Bright", category="test", mfg_date=today, exp_date=today, price=1.0, business_id="d76a11f2"
+            )
+        )
+        await db.commit()
+    await product_index.build()
+
+    """
+    Perform the action of visiting the endpoint
+    """
+    response = await client.get("/api/v1/product/search/name/lamps", params={"mode": "index"})
+
+    """
+    Test the response
+    """
+    assert response.status_code == 200
+    assert [product["name"] for product in response.json()["products"]] == ["lamp", "desk"]
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="PRODUCT INDEX Endpoint - Walk the ranked products two at a time with the cursor")])
+async def test_get_product_index_cursor(client: AsyncClient, db_test_create: None, db_test_index: None, _: None) -> None:
+    """
+    Test that following the cursor of the search index of the Product API walks all the matching
+    products exactly once in the order of their relevance.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_index: Fixture to build the product search index from the initial test data.
+
+    :return:
+    """
+    """
+    Get the data for assertion
+    """
+    response = await client.get("/api/v1/product/search/name/test", params={"mode": "index"})
+    ranked = [product["name"] for product in response.json()["products"]]
+
+    """
+    Perform the action of visiting the endpoint page after page
+    """
+    seen, cursor = [], None
+    while True:
+        params = {"mode": "index", "limit": 2} | ({"cursor": cursor} if cursor else {})
+        response = await client.get("/api/v1/product/search/name/test", params=params)
+        assert response.status_code == 200
+        seen.extend(product["name"] for product in response.json()["products"])
+        cursor = response.json()["next_cursor"]
+        if cursor is None:
+            break
+
+    """
+    Test that every product is seen once in the order of relevance, and that a malformed cursor
+    is rejected
+    """
+    assert sorted(ranked) == ["test_prod_1", "test_prod_2", "test_prod_3", "test_prod_4", "test_prod_5"]
+    assert seen == ranked
+    response = await client.get("/api/v1/product/search/name/test", params={"mode": "index", "cursor": "eyJpZCI6IDF9"})
+    assert response.status_code == 422
+    assert response.json()["detail"] == "Invalid pagination cursor"
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="PRODUCT INDEX Endpoint - Keep the index in sync with creations, updates and deletes")])
+async def test_get_product_index_sync(client: AsyncClient, db_test_create: None, db_test_index: None, apply_security_override: None, _: None) -> None:
+    """
+    Test that the search index of the Product API follows the products being created, updated and
+    deleted through the endpoints.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_index: Fixture to build the product search index from the initial test data.
+    :param apply_security_override: Fixture to set up test client with dependency override for `security`.
+
+    :return:
+    """
+    """
+    Perform the action of creating, updating and deleting products
+    """
+    payload = {
+        "name": "kettle",
+        "description": "Electric kettle",
+        "category": "kitchen",
+        "mfg_date": "1900-01-01T00:00:00",
+        "exp_date": "1900-01-01T00:00:00",
+        "price": 30.0,
+    }
+    response = await client.post("/api/v1/product/create", json=payload)
+    assert response.status_code == 201
+    response = await client.put("/api/v1/product/update/uuid/10677ef1", json={"description": "Refurbished gadget"})
+    assert response.status_code == 202
+    response = await client.delete("/api/v1/product/delete/uuid/d5cf6983")
+    assert response.status_code == 202
+
+    """
+    Test that the search follows the changes
+    """
+    response = await client.get("/api/v1/product/search/name/kitchen", params={"mode": "index"})
+    assert [product["name"] for product in response.json()["products"]] == ["kettle"]
+    response = await client.get("/api/v1/product/search/name/gadget", params={"mode": "index"})
+    assert response.json()["products"][0] | {"mfg_date": None, "exp_date": None} == {
+        "name": "test_prod_5",
+        "description": "Refurbished gadget",
+        "category": "test",
+        "mfg_date": None,
+        "exp_date": None,
+        "price": 65.0,
+    }
+    for text in ["Fifth", "Fourth"]:
+        response = await client.get(f"/api/v1/product/search/name/{text}", params={"mode": "index"})
+        assert response.status_code == 404
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="PRODUCT INDEX Hooks - Leave out the changes which are rolled back")])
+async def test_product_index_rollback(db_test_create: None, db_test_index: None, _: None) -> None:
+    """
+    Test that the search index leaves out the changes of a session which rolls back, and applies
+    those of a session which commits.
+
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_index: Fixture to build the product search index from the initial test data.
+
+    :return:
+    """
+    """
+    Perform the action of changing a product in a session rolling back, then in one committing
+    """
+    today = datetime.now(timezone.utc)
+    for commit in [False, True]:
+        async with get_async_session()() as db:
+            product = Product(
+                uuid=f"teapot{commit:02d}",
+                name="teapot",
+                description="",
+                category="test",
+                mfg_date=today,
+                exp_date=today,
+                price=1.0,
+                business_id="d76a11f2",
+            )
+            db.add(product)
+            await db.flush()
+            product_index.track(db, product)
+            await (db.commit() if commit else db.rollback())
+
+        """
+        Test that the change shows up only once committed
+        """
+        assert [row[0].view["name"] for row in product_index.search("teapot", None, 0, 10)] == (["teapot"] if commit else [])
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="PRODUCT INDEX Endpoint - Drop the products of a deleted business")])
+async def test_get_product_index_business_deleted(
+    client: AsyncClient, db_test_create: None, db_test_index: None, apply_security_override: None, _: None
+) -> None:
+    """
+    Test that the search index of the Product API drops the products which the database deletes
+    along with their business.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_index: Fixture to build the product search index from the initial test data.
+    :param apply_security_override: Fixture to set up test client with dependency override for `security`.
+
+    :return:
+    """
+    """
+    Perform the action of deleting the business owning the fourth and the fifth products
+    """
+    response = await client.delete("/api/v1/business/delete/me")
+    assert response.status_code == 202
+    await asyncio.gather(*product_index._tasks)
+
+    """
+    Test that the search leaves out its products
+    """
+    for text in ["Fourth", "Fifth"]:
+        response = await client.get(f"/api/v1/product/search/name/{text}", params={"mode": "index"})
+        assert response.status_code == 404
+    response = await client.get("/api/v1/product/search/name/Third", params={"mode": "index"})
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="PRODUCT INDEX Hooks - Run the builds requested at once one after the other")])
+async def test_product_index_builds_serialized(db_test_create: None, db_test_index: None, mocker: MockerFixture, _: None) -> None:
+    """
+    Test that the builds of the search index requested at once do not scan the database at the
+    same time, so that none of them stops capturing the changes while another one scans.
+
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_index: Fixture to build the product search index from the initial test data.
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+
+    :return:
+    """
+    """
+    Record the number of builds scanning the database at once
+    """
+    scanning, peak = 0, 0
+
+    def counted() -> Callable[[], AsyncIterator[AsyncSession]]:
+        @asynccontextmanager
+        async def session() -> AsyncIterator[AsyncSession]:
+            nonlocal scanning, peak
+            scanning += 1
+            peak = max(peak, scanning)
+            try:
+                async with get_async_session()() as db:
+                    yield db
+            finally:
+                scanning -= 1
+
+        return session
+
+    mocker.patch("fastapi_ecom.utils.search_index.get_async_session", counted)
+
+    """
+    Perform the action of building the index three times at once
+    """
+    builds = product_index.builds
+    await asyncio.gather(*[product_index.build(chunk=1) for _ in range(3)])
+
+    """
+    Test that the builds ran one after the other
+    """
+    assert peak == 1
+    assert product_index.builds == builds + 3
+    assert len(product_index.search("test", None, 0, 10)) == 5
+
+
+@pytest.mark.parametrize(
+    "text, terms",
+    [
+        pytest.param("Red Shoes", ["red", "shoe"], id="PRODUCT INDEX Tokenizer - Lowercase the words and drop the plural"),
+        pytest.param("glass bus", ["glass", "bus"], id="PRODUCT INDEX Tokenizer - Keep the words merely ending with an s"),
+        pytest.param("e-reader, v2!", ["e", "reader", "v2"], id="PRODUCT INDEX Tokenizer - Split on the punctuation"),
+    ],
+)
+def test_tokenize(text: str, terms: list[str]) -> None:
+    """
+    Test splitting a text into the terms it is indexed and searched by.
+
+    :param text: The text to split.
+    :param terms: The expected terms.
+
+    :return:
+    """
+    assert tokenize(text) == terms
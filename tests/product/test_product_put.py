@@ -107,3 +107,67 @@ async def test_update_product(
     else:
         assert response.status_code == 404
         assert response.json()["detail"] == "Product not present in database"
+
+
+@pytest.mark.parametrize(
+    "if_match, status, price",
+    [
+        pytest.param(None, 202, 1.5, id="PRODUCT PUT Endpoint - Update the product unconditionally with a single statement"),
+        pytest.param('"0"', 202, 1.5, id="PRODUCT PUT Endpoint - Update the product conditionally on its current version"),
+        pytest.param('"7", "0"', 202, 1.5, id="PRODUCT PUT Endpoint - Update the product conditionally on one of the versions listed"),
+        pytest.param('"1"', 412, 65.0, id="PRODUCT PUT Endpoint - Fail to update the product conditionally on a stale version"),
+        pytest.param('W/"0"', 412, 65.0, id="PRODUCT PUT Endpoint - Fail to update the product conditionally on a weak entity tag"),
+    ],
+)
+async def test_update_product_conditional(
+    client: AsyncClient,
+    db_test_create: None,
+    db_test_data: None,
+    apply_security_override: None,
+    query_counter: list[str],
+    if_match: str | None,
+    status: int,
+    price: float,
+) -> None:
+    """
+    Test that the `update` endpoint of the Product API writes the product with a single statement
+    returning it, honours the `If-Match` header and returns the `ETag` of the updated product.
+
+    :param client: The test client to send HTTP requests.
+    :param db_test_create: Fixture which creates a test database.
+    :param db_test_data: Fixture to populate the test database with initial test data.
+    :param apply_security_override: Fixture to set up test client with dependency override for `security`.
+    :param query_counter: Fixture which records the SQL statements sent to the database.
+    :param if_match: Value of the `If-Match` header, if any.
+    :param status: Expected status code of the request.
+    :param price: Expected price of the product afterwards.
+
+    :return:
+    """
+    """
+    Perform the action of fetching the product and updating its price
+    """
+    response = await client.get("/api/v1/product/search/uuid/10677ef1")
+    assert response.headers["etag"] == '"0"'
+    query_counter.clear()
+    headers = {} if if_match is None else {"If-Match": if_match}
+    response = await client.put("/api/v1/product/update/uuid/10677ef1", json={"price": 1.5}, headers=headers)
+
+    """
+    Test the response and the statements sent to the database
+    """
+    assert response.status_code == status
+    assert len([statement for statement in query_counter if statement.startswith("UPDATE products")]) == 1
+    if status == 202:
+        assert not [statement for statement in query_counter if statement.startswith("SELECT") and "WHERE products.uuid = " in statement]
+        assert response.headers["etag"] == '"1"'
+        assert response.json()["product"]["price"] == price
+    else:
+        assert response.json()["detail"] == "Product was modified in the meantime - Please fetch it again"
+
+    """
+    Test the product stored afterwards
+    """
+    response = await client.get("/api/v1/product/search/uuid/10677ef1")
+    assert response.json()["product"]["price"] == price
+    assert response.headers["etag"] == ('"1"' if status == 202 else '"0"')
@@ -0,0 +1,82 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi import FastAPI
+from pytest_mock import MockerFixture
+from sqlalchemy import URL
+from sqlalchemy.future import select
+
+from fastapi_ecom import database
+from fastapi_ecom.app import lifespan
+from fastapi_ecom.config import config
+from fastapi_ecom.database import get_async_session
+from fastapi_ecom.database.models.idempotency_key import IdempotencyKey
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="ROOT Lifespan - Share one engine across sessions and dispose it on shutdown")])
+async def test_lifespan(test_app: FastAPI, get_test_database_url: URL, _: None) -> None:
+    """
+    Test that the application lifespan sets up a single engine shared by all the sessions and
+    disposes it on shutdown.
+
+    :param test_app: The fixture which returns the FastAPI app instance.
+    :param get_test_database_url: The fixture which generates test database URL.
+
+    :return:
+    """
+    """
+    Perform the action of starting the application and requesting multiple sessions
+    """
+    async with lifespan(test_app):
+        first, second = get_async_session()(), get_async_session()()
+
+        """
+        Test that the sessions share the same engine
+        """
+        assert first.bind is second.bind
+        assert database._async_engine is first.bind
+        await first.close()
+        await second.close()
+
+    """
+    Test that the engine is disposed on shutdown
+    """
+    assert database._async_engine is None
+    assert database._async_session is None
+
+
+@pytest.mark.parametrize("_", [pytest.param(None, id="ROOT Lifespan - Sweep the expired idempotency keys in the background")])
+async def test_lifespan_sweeper(test_app: FastAPI, db_test_create: None, mocker: MockerFixture, _: None) -> None:
+    """
+    Test that the application lifespan sweeps the expired idempotency keys periodically and keeps
+    the live ones.
+
+    :param test_app: The fixture which returns the FastAPI app instance.
+    :param db_test_create: Fixture which creates a test database.
+    :param mocker: Mock fixture to be used for mocking desired functionality.
+
+    :return:
+    """
+    """
+    Store an expired and a live idempotency key and sweep them often
+    """
+    mocker.patch.object(config, "idemswep", 0.01)
+    now = datetime.now(timezone.utc)
+    async with get_async_session()() as db:
+        db.add(IdempotencyKey(scope="order", key="expired", fingerprint="", expiry_date=now - timedelta(seconds=1)))
+        db.add(IdempotencyKey(scope="order", key="live", fingerprint="", expiry_date=now + timedelta(hours=1)))
+        await db.commit()
+
+    """
+    Perform the action of starting the application and letting the sweeper run
+    """
+    async with lifespan(test_app):
+        await asyncio.sleep(0.1)
+        async with get_async_session()() as db:
+            keys = (await db.execute(select(IdempotencyKey.key))).scalars().all()
+
+    """
+    Test that only the expired key is swept
+    """
+    assert keys == ["live"]